@@ -0,0 +1,58 @@
+"""Contention benchmark of uuid7()/uuid6() in shared (single lock) mode and sharded mode.
+
+Usage:
+    PYTHONPATH=./src python benchmarks/contention_benchmark.py
+"""
+import argparse
+import threading
+import time
+from typing import Callable, List
+
+import newnewid
+
+
+def _measure(func: Callable[[], object], threads_count: int, n: int) -> float:
+    barrier = threading.Barrier(threads_count + 1)
+
+    def run() -> None:
+        barrier.wait()
+        for _ in range(n):
+            func()
+
+    threads: List[threading.Thread] = [threading.Thread(target=run) for _ in range(threads_count)]
+    for thread in threads:
+        thread.start()
+
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    return threads_count * n / elapsed
+
+
+def main() -> None:
+    """Run benchmark."""
+    parser = argparse.ArgumentParser(description="uuid7()/uuid6() contention benchmark")
+    parser.add_argument("-n", type=int, default=20_000, help="UUIDs per thread")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32])
+    args = parser.parse_args()
+
+    cases = {
+        "uuid7 shared": lambda: newnewid.uuid7(),
+        "uuid7 sharded": lambda: newnewid.uuid7(sharded=True),
+        "uuid7 sharded 8 bits": lambda: newnewid.uuid7(sharded=True, shard_bits_length=8),
+        "uuid6 shared": lambda: newnewid.uuid6(),
+        "uuid6 sharded": lambda: newnewid.uuid6(sharded=True),
+    }
+
+    print(f"{'case':<24}{'threads':>8}{'UUIDs/s':>14}")
+    for name, func in cases.items():
+        for threads_count in args.threads:
+            throughput = _measure(func, threads_count, args.n)
+            print(f"{name:<24}{threads_count:>8}{throughput:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Startup time benchmark of `import newnewid` and the CLI.
+
+Each case runs in a fresh interpreter. The time of the case is the median of the runs minus
+the median of an empty interpreter, so it is the time added by newnewid.
+
+Usage:
+    PYTHONPATH=./src python benchmarks/import_benchmark.py
+    PYTHONPATH=./src python benchmarks/import_benchmark.py --max-milliseconds 50
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+_CASES: Dict[str, str] = {
+    "python": "pass",
+    "import newnewid": "import newnewid",
+    "newnewid.uuid7()": "import newnewid; newnewid.uuid7()",
+    "newnewid.uuid6()": "import newnewid; newnewid.uuid6()",
+    "newnewid --help": (
+        "import sys; sys.argv = ['newnewid', '--help']\n"
+        + "from newnewid.cli import cli\n"
+        + "try:\n    cli()\nexcept SystemExit:\n    pass"
+    ),
+}
+
+
+def _measure(code: str, runs: int) -> float:
+    elapsed_list: List[float] = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True, stdout=subprocess.DEVNULL)
+        elapsed_list.append(time.perf_counter() - start)
+
+    return statistics.median(elapsed_list) * 1000
+
+
+def main() -> None:
+    """Run benchmark."""
+    parser = argparse.ArgumentParser(description="newnewid import time benchmark")
+    parser.add_argument("--runs", type=int, default=20, help="Runs per case")
+    parser.add_argument(
+        "--max-milliseconds",
+        type=float,
+        default=None,
+        help="Fail if `import newnewid` adds more than this",
+    )
+    args = parser.parse_args()
+
+    baseline = _measure(_CASES["python"], args.runs)
+    print(f"{'case':<20}{'ms':>10}{'added ms':>10}")
+    print(f"{'python':<20}{baseline:>10.1f}{0:>10.1f}")
+
+    added_milliseconds: Dict[str, float] = {}
+    for name, code in _CASES.items():
+        if name == "python":
+            continue
+        milliseconds = _measure(code, args.runs)
+        added_milliseconds[name] = milliseconds - baseline
+        print(f"{name:<20}{milliseconds:>10.1f}{added_milliseconds[name]:>10.1f}")
+
+    if (
+        args.max_milliseconds is not None
+        and added_milliseconds["import newnewid"] > args.max_milliseconds
+    ):
+        print(f"`import newnewid` is slower than {args.max_milliseconds} ms", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
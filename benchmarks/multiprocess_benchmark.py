@@ -0,0 +1,65 @@
+"""Throughput benchmark of UUID7Generator against the number of processes.
+
+Each process has its own counter in per-process mode, and all processes share one counter
+by `SharedCounterState` in shared mode.
+
+Usage:
+    PYTHONPATH=./src python benchmarks/multiprocess_benchmark.py
+"""
+import argparse
+import multiprocessing
+import time
+from typing import List, Optional
+
+import newnewid
+
+
+def _run(
+    shared_counter_state: Optional[newnewid.SharedCounterState],
+    barrier,
+    n: int,
+) -> None:
+    generator = newnewid.UUID7Generator(
+        newnewid.METHOD_1_FIXED_LENGTH_DEDICATED_COUNTER_BITS_12,
+        shared_counter_state=shared_counter_state,
+    )
+    barrier.wait()
+    for _ in range(n):
+        generator.generate()
+
+
+def _measure(shared: bool, processes_count: int, n: int) -> float:
+    shared_counter_state = newnewid.SharedCounterState() if shared else None
+    barrier = multiprocessing.Barrier(processes_count + 1)
+    processes: List[multiprocessing.Process] = [
+        multiprocessing.Process(target=_run, args=(shared_counter_state, barrier, n))
+        for _ in range(processes_count)
+    ]
+    for process in processes:
+        process.start()
+
+    barrier.wait()
+    start = time.perf_counter()
+    for process in processes:
+        process.join()
+    elapsed = time.perf_counter() - start
+
+    return processes_count * n / elapsed
+
+
+def main() -> None:
+    """Run benchmark."""
+    parser = argparse.ArgumentParser(description="UUID7Generator multi-process benchmark")
+    parser.add_argument("-n", type=int, default=50_000, help="UUIDs per process")
+    parser.add_argument("--processes", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    print(f"{'case':<24}{'processes':>10}{'UUIDs/s':>14}")
+    for name, shared in (("per-process counter", False), ("shared counter", True)):
+        for processes_count in args.processes:
+            throughput = _measure(shared, processes_count, args.n)
+            print(f"{name:<24}{processes_count:>10}{throughput:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+from typing import TYPE_CHECKING
 from uuid import (
     NAMESPACE_DNS,
     NAMESPACE_OID,
@@ -16,43 +17,151 @@ from uuid import (
     uuid5,
 )
 
-from newnewid.clock.uuid_clock import UUIDClock
-from newnewid.counter.counter import Counter
-from newnewid.draft_ietf_uuidrev_rfc4122bis_00.nil_uuid_generator import (
-    NilUUIDGenerator,
-    nil_uuid,
-)
-from newnewid.draft_peabody_dispatch_new_uuid_format_01.uuid6_generator import (
-    UUID6Generator,
-    uuid6,
-)
-from newnewid.draft_peabody_dispatch_new_uuid_format_03.max_uuid_generator import (
-    MaxUUIDGenerator,
-    max_uuid,
-)
-from newnewid.draft_peabody_dispatch_new_uuid_format_03.uuid7_generator import (
-    METHOD_0_NO_COUNTER,
-    METHOD_1_FIXED_LENGTH_DEDICATED_COUNTER_BITS_12,
-    METHOD_1_FIXED_LENGTH_DEDICATED_COUNTER_BITS_26,
-    METHOD_1_FIXED_LENGTH_DEDICATED_COUNTER_BITS_42,
-    METHOD_2_MONOTONIC_RANDOM_62_BITS,
-    METHOD_3_RERANDOMIZE_UNTIL_MONOTONIC,
-    METHOD_4_REPLACE_LEFT_MOST_RANDOM_BITS_WITH_INCREASED_CLOCK_PRECISION_12_BITS,
-    METHOD_4_REPLACE_LEFT_MOST_RANDOM_BITS_WITH_INCREASED_CLOCK_PRECISION_12_BITS_WITH_COUNTER_14_BITS,
-    UUID7Generator,
-    UUID7Option,
-    ulid_compatible,
-    uuid7,
-)
-from newnewid.draft_peabody_dispatch_new_uuid_format_03.uuid8_generator import (
-    UUID8Generator,
-    uuid8,
+from newnewid.util.lazy_module import lazy_module_attributes
+
+# The same attributes for static analysis. They are not imported at runtime.
+if TYPE_CHECKING:
+    from newnewid.clock.coarse_uuid_clock import CoarseUUIDClock
+    from newnewid.clock.monotonic_uuid_clock import MonotonicUUIDClock
+    from newnewid.clock.uuid_clock import UUIDClock
+    from newnewid.column.uuid_array import UUIDArray
+    from newnewid.counter.counter import Counter
+    from newnewid.counter.shared_counter_state import SharedCounterState
+    from newnewid.draft_ietf_uuidrev_rfc4122bis_00.nil_uuid_generator import (
+        NilUUIDGenerator,
+        nil_uuid,
+    )
+    from newnewid.draft_peabody_dispatch_new_uuid_format_01.uuid6_generator import (
+        UUID6Generator,
+        uuid6,
+    )
+    from newnewid.draft_peabody_dispatch_new_uuid_format_03.max_uuid_generator import (
+        MaxUUIDGenerator,
+        max_uuid,
+    )
+    from newnewid.draft_peabody_dispatch_new_uuid_format_03.uuid7_generator import (
+        METHOD_0_NO_COUNTER,
+        METHOD_1_FIXED_LENGTH_DEDICATED_COUNTER_BITS_12,
+        METHOD_1_FIXED_LENGTH_DEDICATED_COUNTER_BITS_26,
+        METHOD_1_FIXED_LENGTH_DEDICATED_COUNTER_BITS_42,
+        METHOD_2_MONOTONIC_RANDOM_62_BITS,
+        METHOD_3_RERANDOMIZE_UNTIL_MONOTONIC,
+        METHOD_4_REPLACE_LEFT_MOST_RANDOM_BITS_WITH_INCREASED_CLOCK_PRECISION_12_BITS,
+        METHOD_4_REPLACE_LEFT_MOST_RANDOM_BITS_WITH_INCREASED_CLOCK_PRECISION_12_BITS_WITH_COUNTER_14_BITS,
+        UUID7Generator,
+        UUID7Option,
+        ulid_compatible,
+        uuid7,
+    )
+    from newnewid.draft_peabody_dispatch_new_uuid_format_03.uuid8_generator import (
+        UUID8Generator,
+        uuid8,
+    )
+    from newnewid.exception.backward_uuid_exception import BackwardUUIDException
+    from newnewid.index.uuid7_time_index import (
+        UUID7TimeIndex,
+        max_uuid7_for,
+        min_uuid7_for,
+    )
+    from newnewid.parser.uuid_record import (
+        UUID1Record,
+        UUID3Record,
+        UUID4Record,
+        UUID5Record,
+        UUID6Record,
+        UUID7Record,
+        UUID8Record,
+        UUIDRecord,
+    )
+    from newnewid.random.pooled_pseudo_random_generator import (
+        PooledPseudoRandomGenerator,
+    )
+    from newnewid.random.pseudo_random_binary_generator import (
+        PseudoRandomBinaryGenerator,
+    )
+    from newnewid.random.pseudo_random_generator import PseudoRandomGenerator
+    from newnewid.shard.shard_option import ShardOption
+    from newnewid.state.high_water_mark_store import HighWaterMarkStore
+    from newnewid.stats.generator_stats import (
+        GeneratorStats,
+        GeneratorStatsSnapshot,
+        dump_openmetrics,
+    )
+    from newnewid.uuidgenerator.gregorian_based_uuid_generator import (
+        MacAddressGenerator,
+    )
+    from newnewid.uuidgenerator.name_based_uuid_generator import NameBasedUUIDGenerator
+    from newnewid.uuidgenerator.uuid_generator import UUIDGenerator
+
+# The attributes are imported on first access to keep the import fast.
+__getattr__, __dir__ = lazy_module_attributes(
+    __name__,
+    {
+        "UUIDClock": "newnewid.clock.uuid_clock",
+        "CoarseUUIDClock": "newnewid.clock.coarse_uuid_clock",
+        "MonotonicUUIDClock": "newnewid.clock.monotonic_uuid_clock",
+        "min_uuid7_for": "newnewid.index.uuid7_time_index",
+        "max_uuid7_for": "newnewid.index.uuid7_time_index",
+        "UUID7TimeIndex": "newnewid.index.uuid7_time_index",
+        "UUIDArray": "newnewid.column.uuid_array",
+        "NameBasedUUIDGenerator": "newnewid.uuidgenerator.name_based_uuid_generator",
+        "Counter": "newnewid.counter.counter",
+        "SharedCounterState": "newnewid.counter.shared_counter_state",
+        "NilUUIDGenerator": "newnewid.draft_ietf_uuidrev_rfc4122bis_00.nil_uuid_generator",
+        "nil_uuid": "newnewid.draft_ietf_uuidrev_rfc4122bis_00.nil_uuid_generator",
+        "UUID6Generator": "newnewid.draft_peabody_dispatch_new_uuid_format_01.uuid6_generator",
+        "uuid6": "newnewid.draft_peabody_dispatch_new_uuid_format_01.uuid6_generator",
+        "MaxUUIDGenerator": "newnewid.draft_peabody_dispatch_new_uuid_format_03.max_uuid_generator",
+        "max_uuid": "newnewid.draft_peabody_dispatch_new_uuid_format_03.max_uuid_generator",
+        "METHOD_0_NO_COUNTER": "newnewid.draft_peabody_dispatch_new_uuid_format_03.uuid7_generator",
+        "METHOD_1_FIXED_LENGTH_DEDICATED_COUNTER_BITS_12": (
+            "newnewid.draft_peabody_dispatch_new_uuid_format_03.uuid7_generator"
+        ),
+        "METHOD_1_FIXED_LENGTH_DEDICATED_COUNTER_BITS_26": (
+            "newnewid.draft_peabody_dispatch_new_uuid_format_03.uuid7_generator"
+        ),
+        "METHOD_1_FIXED_LENGTH_DEDICATED_COUNTER_BITS_42": (
+            "newnewid.draft_peabody_dispatch_new_uuid_format_03.uuid7_generator"
+        ),
+        "METHOD_2_MONOTONIC_RANDOM_62_BITS": (
+            "newnewid.draft_peabody_dispatch_new_uuid_format_03.uuid7_generator"
+        ),
+        "METHOD_3_RERANDOMIZE_UNTIL_MONOTONIC": (
+            "newnewid.draft_peabody_dispatch_new_uuid_format_03.uuid7_generator"
+        ),
+        "METHOD_4_REPLACE_LEFT_MOST_RANDOM_BITS_WITH_INCREASED_CLOCK_PRECISION_12_BITS": (
+            "newnewid.draft_peabody_dispatch_new_uuid_format_03.uuid7_generator"
+        ),
+        "METHOD_4_REPLACE_LEFT_MOST_RANDOM_BITS_WITH_INCREASED_CLOCK_PRECISION_12_BITS_WITH_COUNTER_14_BITS": (
+            "newnewid.draft_peabody_dispatch_new_uuid_format_03.uuid7_generator"
+        ),
+        "UUID7Generator": "newnewid.draft_peabody_dispatch_new_uuid_format_03.uuid7_generator",
+        "UUID7Option": "newnewid.draft_peabody_dispatch_new_uuid_format_03.uuid7_generator",
+        "ulid_compatible": "newnewid.draft_peabody_dispatch_new_uuid_format_03.uuid7_generator",
+        "uuid7": "newnewid.draft_peabody_dispatch_new_uuid_format_03.uuid7_generator",
+        "UUID8Generator": "newnewid.draft_peabody_dispatch_new_uuid_format_03.uuid8_generator",
+        "uuid8": "newnewid.draft_peabody_dispatch_new_uuid_format_03.uuid8_generator",
+        "BackwardUUIDException": "newnewid.exception.backward_uuid_exception",
+        "UUID1Record": "newnewid.parser.uuid_record",
+        "UUID3Record": "newnewid.parser.uuid_record",
+        "UUID4Record": "newnewid.parser.uuid_record",
+        "UUID5Record": "newnewid.parser.uuid_record",
+        "UUID6Record": "newnewid.parser.uuid_record",
+        "UUID7Record": "newnewid.parser.uuid_record",
+        "UUID8Record": "newnewid.parser.uuid_record",
+        "UUIDRecord": "newnewid.parser.uuid_record",
+        "PooledPseudoRandomGenerator": "newnewid.random.pooled_pseudo_random_generator",
+        "PseudoRandomBinaryGenerator": "newnewid.random.pseudo_random_binary_generator",
+        "PseudoRandomGenerator": "newnewid.random.pseudo_random_generator",
+        "ShardOption": "newnewid.shard.shard_option",
+        "HighWaterMarkStore": "newnewid.state.high_water_mark_store",
+        "GeneratorStats": "newnewid.stats.generator_stats",
+        "GeneratorStatsSnapshot": "newnewid.stats.generator_stats",
+        "dump_openmetrics": "newnewid.stats.generator_stats",
+        "MacAddressGenerator": "newnewid.uuidgenerator.gregorian_based_uuid_generator",
+        "UUIDGenerator": "newnewid.uuidgenerator.uuid_generator",
+    },
 )
-from newnewid.exception.backward_uuid_exception import BackwardUUIDException
-from newnewid.random.pseudo_random_binary_generator import PseudoRandomBinaryGenerator
-from newnewid.random.pseudo_random_generator import PseudoRandomGenerator
-from newnewid.uuidgenerator.gregorian_based_uuid_generator import MacAddressGenerator
-from newnewid.uuidgenerator.uuid_generator import UUIDGenerator
 
 __all__ = [
     # Compatibility
@@ -97,6 +206,28 @@ __all__ = [
     "PseudoRandomBinaryGenerator",
     "Counter",
     "UUIDClock",
+    "CoarseUUIDClock",
+    "MonotonicUUIDClock",
+    "min_uuid7_for",
+    "max_uuid7_for",
+    "UUID7TimeIndex",
+    "UUIDArray",
+    "NameBasedUUIDGenerator",
     "PseudoRandomGenerator",
+    "PooledPseudoRandomGenerator",
+    "ShardOption",
+    "HighWaterMarkStore",
+    "GeneratorStats",
+    "GeneratorStatsSnapshot",
+    "dump_openmetrics",
+    "UUIDRecord",
+    "UUID1Record",
+    "UUID3Record",
+    "UUID4Record",
+    "UUID5Record",
+    "UUID6Record",
+    "UUID7Record",
+    "UUID8Record",
+    "SharedCounterState",
     "MacAddressGenerator",
 ]
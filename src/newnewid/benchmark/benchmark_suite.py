@@ -0,0 +1,325 @@
+import json
+import platform
+import threading
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from uuid import NAMESPACE_DNS, uuid1, uuid3, uuid4, uuid5
+
+# Version of the results format. Increment it when the fields of `BenchmarkResult` change.
+RESULTS_FORMAT_VERSION = 1
+
+# Operations between clock reads
+_BATCH_COUNT = 100
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """Operation to measure."""
+
+    name: str
+    func: Callable[[], Any]
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Measurement of a case."""
+
+    name: str
+    # Operations per second on one thread
+    ops_per_second: float
+    # Operations per second of all the threads sharing the same generator
+    threads_count: int
+    threads_ops_per_second: float
+    # Latency of one operation on one thread
+    p50_nano_seconds: int
+    p99_nano_seconds: int
+    # Peak bytes allocated during one operation, measured by tracemalloc. None before Python 3.9.
+    allocated_bytes: Optional[float]
+
+
+def get_default_cases() -> List[BenchmarkCase]:
+    """Get the cases of every generator, every UUIDv7 method and the parser.
+
+    Each UUIDv7 case has its own generator, so the counter of a case does not affect the others.
+
+    Returns:
+        List[BenchmarkCase]: Cases.
+    """
+    import newnewid
+    from newnewid.parser.uuid_parser import get_parser
+
+    uuid7_options = {
+        "METHOD_0_NO_COUNTER": newnewid.METHOD_0_NO_COUNTER,
+        "METHOD_1_12": newnewid.METHOD_1_FIXED_LENGTH_DEDICATED_COUNTER_BITS_12,
+        "METHOD_1_26": newnewid.METHOD_1_FIXED_LENGTH_DEDICATED_COUNTER_BITS_26,
+        "METHOD_1_42": newnewid.METHOD_1_FIXED_LENGTH_DEDICATED_COUNTER_BITS_42,
+        "METHOD_2": newnewid.METHOD_2_MONOTONIC_RANDOM_62_BITS,
+        "METHOD_3": newnewid.METHOD_3_RERANDOMIZE_UNTIL_MONOTONIC,
+        "METHOD_4": (
+            newnewid.METHOD_4_REPLACE_LEFT_MOST_RANDOM_BITS_WITH_INCREASED_CLOCK_PRECISION_12_BITS
+        ),
+        "METHOD_4_WITH_COUNTER": (
+            newnewid.METHOD_4_REPLACE_LEFT_MOST_RANDOM_BITS_WITH_INCREASED_CLOCK_PRECISION_12_BITS_WITH_COUNTER_14_BITS  # noqa: E501
+        ),
+    }
+
+    uuid3_generator = newnewid.NameBasedUUIDGenerator(NAMESPACE_DNS, "md5")
+    uuid5_generator = newnewid.NameBasedUUIDGenerator(NAMESPACE_DNS, "sha1")
+    cases = [
+        BenchmarkCase("uuid1", uuid1),
+        BenchmarkCase("uuid3", lambda: uuid3(NAMESPACE_DNS, "example.com")),
+        BenchmarkCase("uuid3 name_based", lambda: uuid3_generator.generate("example.com")),
+        BenchmarkCase("uuid4", uuid4),
+        BenchmarkCase("uuid5", lambda: uuid5(NAMESPACE_DNS, "example.com")),
+        BenchmarkCase("uuid5 name_based", lambda: uuid5_generator.generate("example.com")),
+        BenchmarkCase("uuid6", newnewid.UUID6Generator(uses_mac_address=False).generate),
+    ]
+    for method, uuid7_option in uuid7_options.items():
+        cases.append(
+            BenchmarkCase(f"uuid7 {method}", newnewid.UUID7Generator(uuid7_option).generate)
+        )
+    cases += [
+        BenchmarkCase("ulid_compatible", newnewid.ulid_compatible),
+        BenchmarkCase("uuid8", lambda: newnewid.uuid8(1, 2, 3)),
+    ]
+
+    parse = get_parser()
+    uuid7_option = newnewid.METHOD_1_FIXED_LENGTH_DEDICATED_COUNTER_BITS_12
+    uuid4_ = uuid4()
+    uuid6_ = newnewid.uuid6()
+    uuid7_ = newnewid.uuid7(uuid7_option)
+    cases += [
+        BenchmarkCase("parse uuid4", lambda: parse(uuid4_)),
+        BenchmarkCase("parse uuid6", lambda: parse(uuid6_)),
+        BenchmarkCase("parse uuid7", lambda: parse(uuid7_, uuid7_option=uuid7_option)),
+    ]
+    return cases
+
+
+def run_case(
+    case: BenchmarkCase,
+    n: int,
+    threads_count: int = 4,
+    max_seconds: float = 1.0,
+) -> BenchmarkResult:
+    """Measure a case.
+
+    Each measurement stops after `n` operations or `max_seconds`, whichever comes first, so a case
+    that waits for the clock such as METHOD_0_NO_COUNTER does not take long.
+
+    Args:
+        case (BenchmarkCase): Case.
+        n (int): Maximum number of operations per measurement.
+        threads_count (int, optional): Number of threads for the multi-thread throughput. Defaults to 4.
+        max_seconds (float, optional): Maximum seconds per measurement. Defaults to 1.0.
+
+    Returns:
+        BenchmarkResult: Measurement.
+    """
+    assert n > 0, f"n must be greater than 0, not {n}"
+    assert threads_count > 0, f"threads_count must be greater than 0, not {threads_count}"
+    func = case.func
+
+    # Warm up.
+    _run(func, min(n, 1000), max_seconds / 10)
+
+    count, elapsed = _run(func, n, max_seconds)
+    ops_per_second = count / elapsed
+
+    latencies: List[int] = []
+    perf_counter_ns = time.perf_counter_ns
+    deadline_ns = perf_counter_ns() + int(max_seconds * 1_000_000_000)
+    for _ in range(n):
+        start_ns = perf_counter_ns()
+        func()
+        end_ns = perf_counter_ns()
+        latencies.append(end_ns - start_ns)
+        if end_ns >= deadline_ns:
+            break
+    latencies.sort()
+
+    return BenchmarkResult(
+        name=case.name,
+        ops_per_second=ops_per_second,
+        threads_count=threads_count,
+        threads_ops_per_second=_measure_threads(func, n, threads_count, max_seconds),
+        p50_nano_seconds=latencies[len(latencies) // 2],
+        p99_nano_seconds=latencies[min(len(latencies) * 99 // 100, len(latencies) - 1)],
+        allocated_bytes=_measure_allocated_bytes(func, min(n, 1000), max_seconds),
+    )
+
+
+def run_cases(
+    cases: Sequence[BenchmarkCase],
+    n: int,
+    threads_count: int = 4,
+    max_seconds: float = 1.0,
+    on_result: Optional[Callable[[BenchmarkResult], None]] = None,
+) -> Dict[str, Any]:
+    """Measure cases and make machine-readable results.
+
+    Args:
+        cases (Sequence[BenchmarkCase]): Cases.
+        n (int): Maximum number of operations per measurement.
+        threads_count (int, optional): Number of threads for the multi-thread throughput. Defaults to 4.
+        max_seconds (float, optional): Maximum seconds per measurement. Defaults to 1.0.
+        on_result (Optional[Callable[[BenchmarkResult], None]], optional): Called with each result as soon as it is measured. Defaults to None.
+
+    Returns:
+        Dict[str, Any]: Results with the versions of newnewid and Python. It can be dumped as JSON.
+    """
+    results: List[BenchmarkResult] = []
+    for case in cases:
+        results.append(run_case(case, n, threads_count, max_seconds))
+        if on_result is not None:
+            on_result(results[-1])
+
+    return {
+        "format_version": RESULTS_FORMAT_VERSION,
+        "newnewid_version": _get_newnewid_version(),
+        "python_version": platform.python_version(),
+        "python_implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "n": n,
+        "max_seconds": max_seconds,
+        "results": [asdict(result) for result in results],
+    }
+
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, float]:
+    """Compare the single-thread throughput of the cases in both results.
+
+    Args:
+        baseline (Dict[str, Any]): Results of `run_cases`, for example of the previous release.
+        current (Dict[str, Any]): Results of `run_cases`.
+
+    Returns:
+        Dict[str, float]: Case name to current / baseline throughput. Less than 1 is slower.
+    """
+    baseline_ops = {result["name"]: result["ops_per_second"] for result in baseline["results"]}
+    return {
+        result["name"]: result["ops_per_second"] / baseline_ops[result["name"]]
+        for result in current["results"]
+        if baseline_ops.get(result["name"])
+    }
+
+
+def format_results(results: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None) -> str:
+    """Format results as a text table.
+
+    Args:
+        results (Dict[str, Any]): Results of `run_cases`.
+        baseline (Optional[Dict[str, Any]], optional): Results to compare with. Defaults to None.
+
+    Returns:
+        str: Table.
+    """
+    ratios = compare_results(baseline, results) if baseline is not None else {}
+    lines = [
+        f"newnewid {results['newnewid_version']}, {results['python_implementation']} "
+        + f"{results['python_version']}, {results['platform']}",
+        f"{'case':<28}{'ops/s':>12}{'threads ops/s':>16}{'p50 ns':>10}{'p99 ns':>10}"
+        + f"{'alloc B':>10}{'vs base':>10}",
+    ]
+    for result in results["results"]:
+        allocated_bytes = result["allocated_bytes"]
+        ratio = ratios.get(result["name"])
+        lines.append(
+            f"{result['name']:<28}{result['ops_per_second']:>12,.0f}"
+            + f"{result['threads_ops_per_second']:>16,.0f}"
+            + f"{result['p50_nano_seconds']:>10,}{result['p99_nano_seconds']:>10,}"
+            + (f"{allocated_bytes:>10,.0f}" if allocated_bytes is not None else f"{'-':>10}")
+            + (f"{ratio:>10.2f}" if ratio is not None else f"{'-':>10}")
+        )
+    return "\n".join(lines)
+
+
+def dump_results(results: Dict[str, Any]) -> str:
+    """Dump results as JSON.
+
+    Args:
+        results (Dict[str, Any]): Results of `run_cases`.
+
+    Returns:
+        str: JSON.
+    """
+    return json.dumps(results, indent=2)
+
+
+def _run(func: Callable[[], Any], n: int, max_seconds: float) -> Tuple[int, float]:
+    # The clock is read once per batch not to measure the clock.
+    count = 0
+    start = time.perf_counter()
+    deadline = start + max_seconds
+    while count < n:
+        batch_count = min(_BATCH_COUNT, n - count)
+        for _ in range(batch_count):
+            func()
+        count += batch_count
+        if time.perf_counter() >= deadline:
+            break
+
+    return count, time.perf_counter() - start
+
+
+def _measure_threads(
+    func: Callable[[], Any], n: int, threads_count: int, max_seconds: float
+) -> float:
+    # The same as benchmarks/contention_benchmark.py. Each thread runs n / threads_count.
+    n_per_thread = max(n // threads_count, 1)
+    barrier = threading.Barrier(threads_count + 1)
+    counts = [0] * threads_count
+
+    def run(index: int) -> None:
+        barrier.wait()
+        counts[index] = _run(func, n_per_thread, max_seconds)[0]
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(threads_count)]
+    for thread in threads:
+        thread.start()
+
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    return sum(counts) / elapsed
+
+
+def _measure_allocated_bytes(
+    func: Callable[[], Any], n: int, max_seconds: float
+) -> Optional[float]:
+    # tracemalloc.reset_peak is new in Python 3.9.
+    if not hasattr(tracemalloc, "reset_peak") or tracemalloc.is_tracing():
+        return None
+
+    count = 0
+    total = 0
+    deadline = time.perf_counter() + max_seconds
+    tracemalloc.start()
+    try:
+        while count < n and time.perf_counter() < deadline:
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            func()
+            total += tracemalloc.get_traced_memory()[1] - current
+            count += 1
+    finally:
+        tracemalloc.stop()
+
+    return total / count
+
+
+def _get_newnewid_version() -> str:
+    try:
+        from importlib.metadata import PackageNotFoundError, version
+    except ImportError:  # pragma: no cover
+        return "unknown"
+
+    try:
+        return version("newnewid")
+    except PackageNotFoundError:
+        return "unknown"
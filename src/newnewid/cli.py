@@ -1,25 +1,34 @@
 import argparse
+import collections
+import csv
+import io
+import itertools
 import json
+import os
 import sys
 from argparse import RawTextHelpFormatter
-from typing import List
-
-from newnewid import (
-    METHOD_0_NO_COUNTER,
-    UUID,
-    UUID7Option,
-    UUIDGenerator,
-    max_uuid,
-    nil_uuid,
-    uuid1,
-    uuid3,
-    uuid4,
-    uuid5,
-    uuid6,
-    uuid7,
-    uuid8,
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
 )
-from newnewid.parser.uuid_parser import parse
+
+import newnewid
+from newnewid import UUID, uuid1, uuid3, uuid4, uuid5
+
+if TYPE_CHECKING:
+    import multiprocessing.pool
+
+    from newnewid import UUID7Option
 
 _DEBUG = False
 
@@ -46,7 +55,45 @@ class _AppException(Exception):
     pass
 
 
-def _get_uuid7_option(method: str) -> UUID7Option:
+def _encode_text(records: Union[bytes, bytearray]) -> bytes:
+    digits = records.hex()
+    return "".join(
+        [
+            f"{digits[i : i + 8]}-{digits[i + 8 : i + 12]}-{digits[i + 12 : i + 16]}"
+            + f"-{digits[i + 16 : i + 20]}-{digits[i + 20 : i + 32]}\n"
+            for i in range(0, len(digits), 32)
+        ]
+    ).encode("ascii")
+
+
+def _encode_hex(records: Union[bytes, bytearray]) -> bytes:
+    digits = records.hex()
+    return "".join([f"{digits[i : i + 32]}\n" for i in range(0, len(digits), 32)]).encode("ascii")
+
+
+def _encode_raw16(records: Union[bytes, bytearray]) -> Union[bytes, bytearray]:
+    return records
+
+
+def _encode_ndjson(records: Union[bytes, bytearray]) -> bytes:
+    # The same as `json.dumps({"uuid": str(uuid)})` per line.
+    text = _encode_text(records).decode("ascii")
+    return "".join([f'{{"uuid": "{line}"}}\n' for line in text.splitlines()]).encode("ascii")
+
+
+# Format to the function that encodes contiguous 16-byte records. "csv" is "text" after the header.
+_UUID_FORMAT_TO_ENCODER: Dict[str, Callable[[Union[bytes, bytearray]], Union[bytes, bytearray]]] = {
+    "text": _encode_text,
+    "hex": _encode_hex,
+    "raw16": _encode_raw16,
+    "ndjson": _encode_ndjson,
+    "csv": _encode_text,
+}
+
+
+def _get_uuid7_option(method: str) -> "UUID7Option":
+    from newnewid import METHOD_0_NO_COUNTER, UUID7Option
+
     method = method.upper()
 
     try:
@@ -100,7 +147,14 @@ def _get_uuid7_option(method: str) -> UUID7Option:
 
 def generate_uuid(args):
     """Generate UUID."""
+    if args.batch_size <= 0:
+        raise ValueError(f"batch-size must be greater than 0, not {args.batch_size}")
+    if args.stdin:
+        _write_records(_generate_name_based_records(args), args.format)
+        return
+
     uuid_version = args.uuid_version
+    bulk_generate_into: Optional[Callable[[bytearray], int]] = None
 
     if uuid_version == "1":
 
@@ -131,54 +185,274 @@ def generate_uuid(args):
 
         uuid_module = uuid5_wrapper
     elif uuid_version == "6":
-        uuid_module = uuid6
+        uuid_module = newnewid.uuid6
+        bulk_generate_into = newnewid.UUID6Generator(uses_mac_address=False).generate_into
     elif uuid_version == "7":
         uuid7_option = _get_uuid7_option(args.method)
 
         def uuid7_wrapper():
-            return uuid7(uuid7_option)
+            return newnewid.uuid7(uuid7_option)
 
         uuid_module = uuid7_wrapper
+        # Without a counter, the batch is cut after every UUID, so the UUIDs are written one by one.
+        if uuid7_option.counter_bits_length > 0:
+            bulk_generate_into = newnewid.UUID7Generator(uuid7_option).generate_into
     elif uuid_version == "8":
         if args.custom_a is None or args.custom_b is None or args.custom_c is None:
             raise ValueError("custom-a, custom-b and custom-c are required for UUIDv8")
 
         def uuid8_wrapper():
-            return uuid8(args.custom_a, args.custom_b, args.custom_c)
+            return newnewid.uuid8(args.custom_a, args.custom_b, args.custom_c)
 
         uuid_module = uuid8_wrapper
     elif uuid_version == "nil":
-        uuid_module = nil_uuid
+        uuid_module = newnewid.nil_uuid
     elif uuid_version == "max":
-        uuid_module = max_uuid
+        uuid_module = newnewid.max_uuid
     else:
         print("Invalid version.")
         sys.exit(1)
 
-    for _ in range(args.n):
+    def generate_into_one_by_one(buffer: bytearray) -> int:
+        n = len(buffer) // 16
+        buffer[:] = b"".join([uuid_module().bytes for _ in range(n)])
+        return n
+
+    _write_records(
+        _generate_records(bulk_generate_into or generate_into_one_by_one, args.n, args.batch_size),
+        args.format,
+    )
+
+
+def _generate_records(
+    generate_into: Callable[[bytearray], int], n: int, batch_size: int
+) -> Iterator[bytearray]:
+    for start in range(0, n, batch_size):
+        records = bytearray(16 * min(batch_size, n - start))
         try:
-            print(uuid_module())
+            generate_into(records)
         except Exception as e:
             raise _AppException from e
+        yield records
+
+
+def _generate_name_based_records(args) -> Iterator[bytes]:
+    """Generate UUIDv3 or UUIDv5 for each line of stdin."""
+    if args.uuid_version not in ("3", "5"):
+        raise ValueError("--stdin is supported only for UUIDv3 and UUIDv5")
+    if args.namespace is None or args.name is not None:
+        raise ValueError("namespace is required and name is read from stdin with --stdin")
+    if args.jobs <= 0:
+        raise ValueError(f"jobs must be greater than 0, not {args.jobs}")
+
+    generator = newnewid.NameBasedUUIDGenerator(
+        UUID(args.namespace), "md5" if args.uuid_version == "3" else "sha1"
+    )
+    # A name is a line without the line break, hashed as is like a UTF-8 `str`.
+    names = (line.rstrip(b"\r\n") for line in sys.stdin.buffer)
+    return generator.iter_records(names, args.jobs, args.batch_size)
+
+
+def _write_records(batches: Iterator[Union[bytes, bytearray]], output_format: str) -> None:
+    encode = _UUID_FORMAT_TO_ENCODER[output_format]
+    out = sys.stdout.buffer
+    try:
+        if output_format == "csv":
+            out.write(b"uuid\n")
+
+        for records in batches:
+            out.write(encode(records))
+        out.flush()
+    except BrokenPipeError:
+        # The reader such as `head` exited. Python flushes stdout again at exit, so stdout is
+        # redirected to devnull not to raise BrokenPipeError there.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
+
+
+def _get_parse_columns() -> List[str]:
+    from newnewid.parser.uuid_record import (
+        UUID1Record,
+        UUID3Record,
+        UUID4Record,
+        UUID5Record,
+        UUID6Record,
+        UUID7Record,
+        UUID8Record,
+    )
+
+    # Columns of all versions in order of appearance. A version leaves the others empty.
+    columns = ["uuid"]
+    for record_class in [
+        UUID1Record,
+        UUID3Record,
+        UUID4Record,
+        UUID5Record,
+        UUID6Record,
+        UUID7Record,
+        UUID8Record,
+    ]:
+        columns += [field for field in record_class.FIELDS if field not in columns]
+    return columns
+
+
+# UUIDv7 option of `_parse_chunk`, resolved once per process by `_init_parse_worker`
+_parse_uuid7_option: Optional["UUID7Option"] = None
+
+
+def _init_parse_worker(method: str) -> None:
+    """Resolve the UUIDv7 option once. This is the initializer of the worker processes."""
+    global _parse_uuid7_option
+    _parse_uuid7_option = _get_uuid7_option(method)
+
+
+def _parse_chunk(chunk: bytes, input_format: str, output_format: str) -> bytes:
+    """Parse a chunk of UUIDs and encode the results. This runs in the worker processes."""
+    from newnewid.parser.uuid_parser import get_parser
+
+    parse = get_parser()
+
+    if input_format == "raw16":
+        uuids = [UUID(bytes=chunk[i : i + 16]) for i in range(0, len(chunk), 16)]  # noqa: E203
+        uuid_strs = [str(uuid) for uuid in uuids]
+    else:
+        uuid_strs = [line.decode("ascii") for line in chunk.split()]
+        uuids = [UUID(uuid_str) for uuid_str in uuid_strs]
+
+    # The parser returns dictionaries without `as_record`.
+    rows = [
+        {"uuid": uuid_str, **cast(Dict[str, Any], parse(uuid, uuid7_option=_parse_uuid7_option))}
+        for uuid_str, uuid in zip(uuid_strs, uuids)
+    ]
+
+    if output_format == "ndjson":
+        return "".join([f"{json.dumps(row)}\n" for row in rows]).encode("utf-8")
+
+    text = io.StringIO()
+    writer = csv.DictWriter(
+        text,
+        _get_parse_columns(),
+        dialect="excel-tab" if output_format == "tsv" else "excel",
+        lineterminator="\n",
+    )
+    writer.writerows(rows)
+    return text.getvalue().encode("utf-8")
+
+
+def _read_chunks(stream: BinaryIO, input_format: str, chunk_size: int) -> Iterator[bytes]:
+    if input_format == "raw16":
+        while True:
+            chunk = stream.read(16 * chunk_size)
+            if not chunk:
+                return
+            # A pipe may return less than requested.
+            while len(chunk) % 16 != 0:
+                rest = stream.read(16 - len(chunk) % 16)
+                if not rest:
+                    raise ValueError(f"Input length is not a multiple of 16: {len(chunk)}")
+                chunk += rest
+            yield chunk
+    else:
+        while True:
+            lines = list(itertools.islice(stream, chunk_size))
+            if not lines:
+                return
+            yield b"".join(lines)
 
 
 def parse_uuid(args):
     """Parse UUID."""
-    uuid_strs: List[str] = args.uuid
+    if args.stdin == bool(args.uuid):
+        raise ValueError("Either UUIDs or --stdin is required")
+    if args.chunk_size <= 0:
+        raise ValueError(f"chunk-size must be greater than 0, not {args.chunk_size}")
+    if args.jobs <= 0:
+        raise ValueError(f"jobs must be greater than 0, not {args.jobs}")
+
+    if args.stdin:
+        input_format = args.input_format
+        chunks = _read_chunks(sys.stdin.buffer, input_format, args.chunk_size)
+    else:
+        input_format = "text"
+        chunks = iter(["\n".join(args.uuid).encode("ascii")])
 
-    for uuid_str in uuid_strs:
-        uuid = UUID(uuid_str)
-        version = UUIDGenerator.get_version(uuid)
-        try:
-            if version == "7":
-                uuid7_option = _get_uuid7_option(args.method)
-                parsed = parse(uuid, uuid7_option=uuid7_option)
-            else:
-                parsed = parse(uuid)
-            obj = {**{"uuid": uuid_str}, **parsed}
-            print(json.dumps(obj))
-        except Exception as e:
-            raise _AppException from e
+    out = sys.stdout.buffer
+    try:
+        if args.format != "ndjson":
+            delimiter = "\t" if args.format == "tsv" else ","
+            out.write(f"{delimiter.join(_get_parse_columns())}\n".encode("utf-8"))
+
+        # The option is resolved here as well, so an invalid method fails before the workers start.
+        _init_parse_worker(args.method)
+        chunk_args = ((chunk, input_format, args.format) for chunk in chunks)
+        if args.jobs == 1:
+            for chunk_arg in chunk_args:
+                try:
+                    out.write(_parse_chunk(*chunk_arg))
+                except Exception as e:
+                    raise _AppException from e
+        else:
+            _parse_chunks_in_pool(chunk_args, args.jobs, args.method, out)
+        out.flush()
+    except BrokenPipeError:
+        # The same as `generate_uuid`.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
+
+
+def _parse_chunks_in_pool(
+    chunk_args: Iterator[Tuple[bytes, str, str]], jobs: int, method: str, out: BinaryIO
+) -> None:
+    import multiprocessing
+
+    # `Pool.imap` reads the whole input ahead, so the chunks are submitted by hand and at most
+    # 2 chunks per worker are in flight. The results are written in order of the input.
+    pending: Deque["multiprocessing.pool.AsyncResult[bytes]"] = collections.deque()
+    with multiprocessing.Pool(jobs, initializer=_init_parse_worker, initargs=(method,)) as pool:
+        for chunk_arg in chunk_args:
+            pending.append(pool.apply_async(_parse_chunk, chunk_arg))
+            if len(pending) >= 2 * jobs:
+                out.write(_get_parse_result(pending.popleft()))
+        while pending:
+            out.write(_get_parse_result(pending.popleft()))
+
+
+def _get_parse_result(result: "multiprocessing.pool.AsyncResult[bytes]") -> bytes:
+    try:
+        return result.get()
+    except Exception as e:
+        raise _AppException from e
+
+
+def bench(args):
+    """Benchmark generators and parser."""
+    from newnewid.benchmark.benchmark_suite import (
+        dump_results,
+        format_results,
+        get_default_cases,
+        run_cases,
+    )
+
+    cases = get_default_cases()
+    if args.filter:
+        cases = [case for case in cases if any(word in case.name for word in args.filter)]
+    baseline = None
+    if args.baseline is not None:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    def print_progress(result):
+        print(f"{result.name}: {result.ops_per_second:,.0f} ops/s", file=sys.stderr)
+
+    results = run_cases(cases, args.n, args.threads, args.max_seconds, on_result=print_progress)
+
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            f.write(dump_results(results))
+    if args.format == "json":
+        print(dump_results(results))
+    else:
+        print(format_results(results, baseline))
 
 
 def cli():
@@ -249,6 +523,41 @@ def cli():
         help="cuatom-c binary for UUIDv8.",
         default=None,
     )
+    gen_parser.add_argument(
+        "-f",
+        "--format",
+        type=str,
+        choices=list(_UUID_FORMAT_TO_ENCODER),
+        help="""Output format.
+
+* 'text' Canonical string per line
+* 'hex' 32 hexadecimal digits per line
+* 'raw16' Contiguous 16-byte big-endian records without separators
+* 'ndjson' JSON object {"uuid": "..."} per line
+* 'csv' CSV with the header 'uuid'
+
+Default: 'text'
+""",
+        default="text",
+    )
+    gen_parser.add_argument(
+        "--batch-size",
+        type=int,
+        help="Number of UUIDs generated and written at once. Default: 10000",
+        default=10_000,
+    )
+    gen_parser.add_argument(
+        "--stdin",
+        action="store_true",
+        help="Generate UUIDv3 or UUIDv5 for each name per line of stdin instead of --name and n.",
+    )
+    gen_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="Number of worker processes for --stdin. The output is in input order. Default: 1",
+        default=1,
+    )
 
     def generate_uuid_wrapper(args):
         try:
@@ -267,7 +576,53 @@ def cli():
         help="Parse UUID.",
         formatter_class=RawTextHelpFormatter,
     )
-    parse_parser.add_argument("uuid", nargs="+", type=str, help="UUID")
+    parse_parser.add_argument("uuid", nargs="*", type=str, help="UUID")
+    parse_parser.add_argument(
+        "--stdin",
+        action="store_true",
+        help="Read UUIDs from stdin instead of the arguments.",
+    )
+    parse_parser.add_argument(
+        "--input-format",
+        type=str,
+        choices=["text", "raw16"],
+        help="""Input format of --stdin.
+
+* 'text' UUID string per line
+* 'raw16' Contiguous 16-byte big-endian records
+
+Default: 'text'
+""",
+        default="text",
+    )
+    parse_parser.add_argument(
+        "-f",
+        "--format",
+        type=str,
+        choices=["ndjson", "csv", "tsv"],
+        help="""Output format.
+
+* 'ndjson' JSON object per line
+* 'csv' CSV with the columns of all versions
+* 'tsv' TSV with the columns of all versions
+
+Default: 'ndjson'
+""",
+        default="ndjson",
+    )
+    parse_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="Number of worker processes. The output is in order of the input. Default: 1",
+        default=1,
+    )
+    parse_parser.add_argument(
+        "--chunk-size",
+        type=int,
+        help="Number of UUIDs read and parsed at once. Default: 10000",
+        default=10_000,
+    )
     parse_parser.add_argument(
         "-m",
         "--method",
@@ -289,6 +644,69 @@ def cli():
 
     parse_parser.set_defaults(func=parse_uuid_wrapper)
 
+    bench_parser = subparsers.add_parser(
+        "bench",
+        help="Benchmark generators and parser.",
+        formatter_class=RawTextHelpFormatter,
+    )
+    bench_parser.add_argument(
+        "-n",
+        type=int,
+        help="Maximum number of operations per measurement. Default: 100000",
+        default=100_000,
+    )
+    bench_parser.add_argument(
+        "--max-seconds",
+        type=float,
+        help="Maximum seconds per measurement. Default: 1.0",
+        default=1.0,
+    )
+    bench_parser.add_argument(
+        "--threads",
+        type=int,
+        help="Number of threads for the multi-thread throughput. Default: 4",
+        default=4,
+    )
+    bench_parser.add_argument(
+        "-k",
+        "--filter",
+        type=str,
+        nargs="*",
+        help="Run only the cases whose name contains any of them. example: uuid7 parse",
+        default=None,
+    )
+    bench_parser.add_argument(
+        "-o",
+        "--output",
+        type=str,
+        help="Write the results as JSON to the file.",
+        default=None,
+    )
+    bench_parser.add_argument(
+        "--baseline",
+        type=str,
+        help="JSON results of --output to compare the throughput with.",
+        default=None,
+    )
+    bench_parser.add_argument(
+        "-f",
+        "--format",
+        type=str,
+        choices=["text", "json"],
+        help="Output format to stdout. Default: 'text'",
+        default="text",
+    )
+
+    def bench_wrapper(args):
+        try:
+            bench(args)
+        except Exception as e:
+            if _DEBUG:
+                raise e
+            bench_parser.print_help()
+
+    bench_parser.set_defaults(func=bench_wrapper)
+
     try:
         args = parser.parse_args()
         args.func(args)
@@ -0,0 +1,93 @@
+import os
+import threading
+import time
+import weakref
+
+from newnewid.clock.uuid_clock import UUIDClock
+
+_coarse_uuid_clocks: "weakref.WeakSet[CoarseUUIDClock]" = weakref.WeakSet()
+
+
+class CoarseUUIDClock(UUIDClock):
+    """Clock that returns a cached time refreshed by a background ticker thread.
+
+    `epoch_nano_seconds` reads an attribute instead of calling `time.time_ns`, so a generator
+    issuing many UUIDs per tick does not pay for the system call. The time is truncated to
+    `resolution_seconds` and lags the system clock by up to one tick plus the scheduling delay
+    of the ticker thread. Use it with millisecond-precision UUIDv7 such as Method 1 and Method 2;
+    the time fraction of Method 4 is always 0.
+
+    The ticker is a daemon thread. It stops by `close` or when the clock is garbage collected,
+    and it is restarted in the child process after `os.fork`.
+    """
+
+    def __init__(self, resolution_seconds: float = 0.001) -> None:
+        """Create coarse clock and start the ticker thread.
+
+        Args:
+            resolution_seconds (float, optional): Interval of the ticker and resolution of the time. Defaults to 0.001.
+        """
+        assert (
+            resolution_seconds > 0
+        ), f"resolution_seconds must be greater than 0, not {resolution_seconds}"
+        super().__init__()
+        self.resolution_seconds = resolution_seconds
+        self._resolution_nano_seconds = max(int(resolution_seconds * 1_000_000_000), 1)
+        self._now = self._read()
+        self._stop_event = threading.Event()
+        self._start()
+        _coarse_uuid_clocks.add(self)
+
+    def epoch_nano_seconds(self) -> int:
+        """Get the cached time in nanoseconds.
+
+        Returns:
+            int: Epoch time in nanoseconds, truncated to `resolution_seconds`.
+        """
+        return self._now
+
+    def close(self) -> None:
+        """Stop the ticker thread.
+
+        The clock keeps returning the last cached time after this.
+        """
+        self._stop_event.set()
+
+    def _read(self) -> int:
+        now = time.time_ns()
+        return now - now % self._resolution_nano_seconds
+
+    def _start(self) -> None:
+        # The thread holds a weak reference, so the clock can be garbage collected.
+        threading.Thread(
+            target=_tick,
+            args=(weakref.ref(self), self._stop_event, self.resolution_seconds),
+            name="newnewid-coarse-clock",
+            daemon=True,
+        ).start()
+
+
+def _tick(
+    clock_ref: "weakref.ReferenceType[CoarseUUIDClock]",
+    stop_event: threading.Event,
+    resolution_seconds: float,
+) -> None:
+    while not stop_event.wait(resolution_seconds):
+        clock = clock_ref()
+        if clock is None:
+            return
+        clock._now = clock._read()
+        del clock
+
+
+def _restart_after_fork() -> None:
+    # Threads do not survive fork, so the ticker of each clock is started again in the child.
+    for coarse_uuid_clock in list(_coarse_uuid_clocks):
+        if not coarse_uuid_clock._stop_event.is_set():
+            coarse_uuid_clock._now = coarse_uuid_clock._read()
+            coarse_uuid_clock._stop_event = threading.Event()
+            coarse_uuid_clock._start()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_after_fork)
@@ -0,0 +1,101 @@
+import time
+from threading import Lock
+from typing import NamedTuple
+
+from newnewid.clock.uuid_clock import UUIDClock
+
+
+class _SlewState(NamedTuple):
+    # Monotonic time and epoch time at the last sync
+    base_monotonic: int
+    base_time: int
+    # Correction per nanosecond of monotonic time, in parts per billion
+    rate_ppb: int
+    next_sync_monotonic: int
+
+
+class MonotonicUUIDClock(UUIDClock):
+    """Clock that derives the epoch time from `time.monotonic_ns` and slews toward the system clock.
+
+    The epoch time is anchored to one sample of `time.time_ns` at creation and advanced by
+    `time.monotonic_ns`, so a step of the system clock, for example by NTP, never moves it backward
+    and the generators never sleep or raise `BackwardUUIDException` because of the step.
+    Every `sync_seconds`, the drift from the system clock is measured. When the system clock is
+    ahead, for example after a suspend or a forward step by NTP, the clock moves forward to it at
+    once. When it is behind, the clock runs slower by at most `max_slew_rate` until the drift is
+    corrected, like `adjtime`. The time never goes backward.
+
+    A backward drift of 1 second takes 2,000 seconds to correct with the default `max_slew_rate`
+    of 500 ppm.
+    """
+
+    def __init__(self, sync_seconds: float = 1.0, max_slew_rate: float = 0.000_5) -> None:
+        """Create monotonic clock.
+
+        Args:
+            sync_seconds (float, optional): Interval to measure the drift from the system clock. Defaults to 1.0.
+            max_slew_rate (float, optional): Maximum ratio the clock runs slower than the monotonic clock to correct a backward drift. Defaults to 0.0005 (500 ppm).
+        """
+        assert sync_seconds > 0, f"sync_seconds must be greater than 0, not {sync_seconds}"
+        assert 0 <= max_slew_rate < 1, f"max_slew_rate must be 0 <= x < 1, not {max_slew_rate}"
+        super().__init__()
+        self.sync_seconds = sync_seconds
+        self.max_slew_rate = max_slew_rate
+        self._sync_nano_seconds = max(int(sync_seconds * 1_000_000_000), 1)
+        self._max_rate_ppb = int(max_slew_rate * 1_000_000_000)
+        self._lock = Lock()
+
+        monotonic = time.monotonic_ns()
+        self._state = _SlewState(
+            base_monotonic=monotonic,
+            base_time=time.time_ns(),
+            rate_ppb=0,
+            next_sync_monotonic=monotonic + self._sync_nano_seconds,
+        )
+        self.last_drift_nano_seconds = 0
+
+    def epoch_nano_seconds(self) -> int:
+        """Get time in nanoseconds.
+
+        Returns:
+            int: Epoch time in nanoseconds.
+        """
+        monotonic = time.monotonic_ns()
+        state = self._state
+        if monotonic >= state.next_sync_monotonic:
+            state = self._sync()
+        return self._time_at(state, monotonic)
+
+    def _time_at(self, state: _SlewState, monotonic: int) -> int:
+        elapsed = monotonic - state.base_monotonic
+        # The rate is applied only for one interval, so an idle clock does not overshoot.
+        slewed = min(elapsed, self._sync_nano_seconds)
+        return state.base_time + elapsed + slewed * state.rate_ppb // 1_000_000_000
+
+    def _sync(self) -> _SlewState:
+        with self._lock:
+            monotonic = time.monotonic_ns()
+            state = self._state
+            if monotonic < state.next_sync_monotonic:
+                # Another thread has synced.
+                return state
+
+            now = self._time_at(state, monotonic)
+            drift = time.time_ns() - now
+            if drift > 0:
+                # Moving forward keeps the time monotonic, so the anchor follows the system clock.
+                now += drift
+                rate_ppb = 0
+            else:
+                # Correct the backward drift in the next interval within the maximum rate.
+                rate_ppb = max(
+                    drift * 1_000_000_000 // self._sync_nano_seconds, -self._max_rate_ppb
+                )
+            self._state = _SlewState(
+                base_monotonic=monotonic,
+                base_time=now,
+                rate_ppb=rate_ppb,
+                next_sync_monotonic=monotonic + self._sync_nano_seconds,
+            )
+            self.last_drift_nano_seconds = drift
+            return self._state
@@ -0,0 +1,232 @@
+from typing import Any, Iterable, Iterator, Optional, Union, overload
+from uuid import UUID
+
+from newnewid.util.uuid7_ndarray import import_numpy
+
+# Bytes of a UUID record
+_RECORD_BYTES_LENGTH = 16
+
+
+class UUIDArray:
+    """Array of UUIDs stored as contiguous 16-byte big-endian records, the same as `UUID.bytes`.
+
+    A UUID takes 16 bytes instead of a `UUID` object of about 100 bytes. `UUID` objects are
+    created only when an element is accessed. The order of the records is the same as the order
+    of the UUIDs, so the array can be sorted and bisected by bytes.
+
+    The records are exported by `data`, a `bytearray` that supports the buffer protocol on all
+    Python versions, for example `memoryview(array.data)`, and by `tobytes` and `to_numpy`
+    (without copy).
+    """
+
+    def __init__(self, uuids: Iterable[UUID] = ()) -> None:
+        """Create UUID array.
+
+        Args:
+            uuids (Iterable[UUID], optional): UUIDs. Defaults to ().
+        """
+        self.data = bytearray()
+        self.extend(uuids)
+
+    @classmethod
+    def frombytes(cls, data: Any) -> "UUIDArray":
+        """Create UUID array from records.
+
+        Args:
+            data (Any): Bytes-like object of 16-byte records, such as `bytes` or the `(n, 16)` uint8 NumPy array of `generate_ndarray`.
+
+        Returns:
+            UUIDArray: UUID array with a copy of the records.
+        """
+        uuid_array = cls()
+        uuid_array.data = bytearray(memoryview(data).cast("B"))
+        assert (
+            len(uuid_array.data) % _RECORD_BYTES_LENGTH == 0
+        ), f"data length must be a multiple of 16, not {len(uuid_array.data)}"
+        return uuid_array
+
+    def __len__(self) -> int:
+        """Get the number of UUIDs."""
+        return len(self.data) // _RECORD_BYTES_LENGTH
+
+    @overload
+    def __getitem__(self, index: int) -> UUID:  # noqa: D105
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "UUIDArray":  # noqa: D105
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[UUID, "UUIDArray"]:
+        """Get a UUID by an index, or a UUID array with a copy of the records by a slice."""
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                begin, end = start * _RECORD_BYTES_LENGTH, stop * _RECORD_BYTES_LENGTH
+                return UUIDArray.frombytes(self.data[begin:end])
+            return UUIDArray.frombytes(b"".join(self._record(i) for i in range(start, stop, step)))
+
+        return UUID(bytes=self._record(self._normalize_index(index)))
+
+    def __setitem__(self, index: int, uuid: UUID) -> None:
+        """Set a UUID by an index."""
+        offset = self._normalize_index(index) * _RECORD_BYTES_LENGTH
+        self.data[offset : offset + _RECORD_BYTES_LENGTH] = uuid.bytes  # noqa: E203
+
+    def __iter__(self) -> Iterator[UUID]:
+        """Iterate over the UUIDs."""
+        data = bytes(self.data)
+        for offset in range(0, len(data), _RECORD_BYTES_LENGTH):
+            yield UUID(bytes=data[offset : offset + _RECORD_BYTES_LENGTH])  # noqa: E203
+
+    def __contains__(self, uuid: object) -> bool:
+        """Check if the UUID is in the array by a linear scan. Use `contains_sorted` if sorted."""
+        if not isinstance(uuid, UUID):
+            return False
+        record = uuid.bytes
+        offset = self.data.find(record)
+        while offset >= 0:
+            # A match that straddles two records is skipped.
+            if offset % _RECORD_BYTES_LENGTH == 0:
+                return True
+            offset = self.data.find(record, offset + 1)
+        return False
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the records with another UUID array."""
+        if not isinstance(other, UUIDArray):
+            return NotImplemented
+        return self.data == other.data
+
+    def __repr__(self) -> str:
+        """Get the representation with the number of UUIDs."""
+        return f"UUIDArray(<{len(self)} UUIDs>)"
+
+    def append(self, uuid: UUID) -> None:
+        """Append UUID.
+
+        Args:
+            uuid (UUID): UUID.
+        """
+        self.data += uuid.bytes
+
+    def extend(self, uuids: Iterable[UUID]) -> None:
+        """Append UUIDs, for example the result of `generate_many`.
+
+        Args:
+            uuids (Iterable[UUID]): UUIDs or another UUID array.
+        """
+        if isinstance(uuids, UUIDArray):
+            self.data += uuids.data
+        else:
+            self.data += b"".join(uuid.bytes for uuid in uuids)
+
+    def extend_generated(self, generator: Any, n: int) -> None:
+        """Append UUIDs generated into the array without creating `UUID` objects.
+
+        Args:
+            generator (Any): Generator that has `generate_into`, such as `UUID7Generator`.
+            n (int): Number of UUIDs.
+        """
+        assert n >= 0, f"n must be greater than or equal to 0, not {n}"
+        offset = len(self.data)
+        self.data += bytes(n * _RECORD_BYTES_LENGTH)
+        with memoryview(self.data) as view:
+            generator.generate_into(view[offset:])
+
+    def sort(self) -> None:
+        """Sort the UUIDs in ascending order.
+
+        NumPy is used if it is installed.
+        """
+        try:
+            numpy = import_numpy()
+        except ImportError:
+            records = [self._record(i) for i in range(len(self))]
+            records.sort()
+            self.data = bytearray(b"".join(records))
+            return
+
+        # Each record as the upper and the lower 64-bit big-endian integers
+        records_array = numpy.frombuffer(self.data, dtype=[("upper", ">u8"), ("lower", ">u8")])
+        self.data = bytearray(numpy.sort(records_array, order=["upper", "lower"]).tobytes())
+
+    def searchsorted(self, uuid: UUID, side: str = "left") -> int:
+        """Find the index to insert a UUID keeping the order, like `numpy.searchsorted`.
+
+        The array must be sorted.
+
+        Args:
+            uuid (UUID): UUID.
+            side (str, optional): "left" for the index of the first UUID greater than or equal to `uuid`, "right" for the first UUID greater than `uuid`. Defaults to "left".
+
+        Returns:
+            int: Index.
+        """
+        assert side in ("left", "right"), f"side must be left or right, not {side}"
+        record = uuid.bytes
+        low, high = 0, len(self)
+        while low < high:
+            middle = (low + high) // 2
+            middle_record = self._record(middle)
+            if middle_record < record or (side == "right" and middle_record == record):
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def index(self, uuid: UUID) -> Optional[int]:
+        """Find a UUID in the sorted array.
+
+        Args:
+            uuid (UUID): UUID.
+
+        Returns:
+            Optional[int]: Index of the UUID, or None if it is not found.
+        """
+        index = self.searchsorted(uuid)
+        if index < len(self) and self._record(index) == uuid.bytes:
+            return index
+        return None
+
+    def contains_sorted(self, uuid: UUID) -> bool:
+        """Check if a UUID is in the sorted array by a binary search.
+
+        Args:
+            uuid (UUID): UUID.
+
+        Returns:
+            bool: True if the UUID is found.
+        """
+        return self.index(uuid) is not None
+
+    def tobytes(self) -> bytes:
+        """Get the records.
+
+        Returns:
+            bytes: Copy of the 16-byte records.
+        """
+        return bytes(self.data)
+
+    def to_numpy(self) -> Any:
+        """Get the records as a NumPy array without copy.
+
+        The array must not be resized while the NumPy array is alive.
+
+        Returns:
+            Any: `(n, 16)` uint8 array whose rows are `UUID.bytes`.
+        """
+        numpy = import_numpy()
+        return numpy.frombuffer(self.data, dtype=numpy.uint8).reshape(-1, _RECORD_BYTES_LENGTH)
+
+    def _record(self, index: int) -> bytes:
+        offset = index * _RECORD_BYTES_LENGTH
+        return bytes(self.data[offset : offset + _RECORD_BYTES_LENGTH])  # noqa: E203
+
+    def _normalize_index(self, index: int) -> int:
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("UUIDArray index out of range")
+        return index
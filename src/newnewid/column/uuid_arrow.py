@@ -0,0 +1,198 @@
+import os
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from newnewid.column.uuid_array import UUIDArray
+from newnewid.draft_peabody_dispatch_new_uuid_format_03.uuid7_generator import (
+    UUID7Option,
+)
+from newnewid.parser.uuid_bulk_parser import parse_many
+from newnewid.util.uuid7_ndarray import import_numpy
+
+# Bytes of a UUID record
+_RECORD_BYTES_LENGTH = 16
+
+# Translation tables to set ver to 4 (octet 6) and var to 0b10 (octet 8) of random records
+_UUID4_VERSION_TABLE = bytes((octet & 0x0F) | 0x40 for octet in range(256))
+_UUID4_VARIANT_TABLE = bytes((octet & 0x3F) | 0x80 for octet in range(256))
+
+
+def import_pyarrow() -> Any:
+    """Import PyArrow, which is an optional dependency.
+
+    Returns:
+        Any: `pyarrow` module.
+    """
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            "PyArrow is required. Install it by `pip install newnewid[arrow]`."
+        ) from e
+
+    return pyarrow
+
+
+def generate_records(n: int, generator: Any = None) -> bytearray:
+    """Generate UUIDs as contiguous 16-byte records without creating `UUID` objects.
+
+    Args:
+        n (int): Number of UUIDs.
+        generator (Any, optional): Generator that has `generate_into`, such as `UUID7Generator` or `UUID6Generator`. UUIDv4 is generated from `os.urandom` if None. Defaults to None.
+
+    Returns:
+        bytearray: Records, the same as `UUID.bytes`.
+    """
+    assert n >= 0, f"n must be greater than or equal to 0, not {n}"
+    if generator is None:
+        records = bytearray(os.urandom(n * _RECORD_BYTES_LENGTH))
+        records[6::_RECORD_BYTES_LENGTH] = records[6::_RECORD_BYTES_LENGTH].translate(
+            _UUID4_VERSION_TABLE
+        )
+        records[8::_RECORD_BYTES_LENGTH] = records[8::_RECORD_BYTES_LENGTH].translate(
+            _UUID4_VARIANT_TABLE
+        )
+        return records
+
+    records = bytearray(n * _RECORD_BYTES_LENGTH)
+    generator.generate_into(records)
+    return records
+
+
+def generate_arrow(n: int, generator: Any = None) -> Any:
+    """Generate UUIDs into an Arrow array.
+
+    The UUIDs are generated into the data buffer of the array, so no `UUID` objects are created
+    and the records are not copied.
+
+    Args:
+        n (int): Number of UUIDs.
+        generator (Any, optional): Generator that has `generate_into`, such as `UUID7Generator` or `UUID6Generator`. UUIDv4 is generated if None. Defaults to None.
+
+    Returns:
+        Any: `pyarrow.FixedSizeBinaryArray` of `pyarrow.binary(16)`.
+    """
+    return to_arrow(generate_records(n, generator))
+
+
+def to_arrow(records: Any) -> Any:
+    """Wrap 16-byte records in an Arrow array without copy.
+
+    A `bytearray` or a `UUIDArray` cannot be resized while the Arrow array is alive.
+
+    Args:
+        records (Any): `UUIDArray`, or a bytes-like object of 16-byte records such as `bytearray` or the `(n, 16)` uint8 NumPy array of `generate_ndarray`.
+
+    Returns:
+        Any: `pyarrow.FixedSizeBinaryArray` of `pyarrow.binary(16)`.
+    """
+    pyarrow = import_pyarrow()
+    if isinstance(records, UUIDArray):
+        records = records.data
+    view = memoryview(records).cast("B")
+    n, remainder = divmod(len(view), _RECORD_BYTES_LENGTH)
+    assert remainder == 0, f"records length must be a multiple of 16, not {len(view)}"
+    return pyarrow.Array.from_buffers(pyarrow.binary(16), n, [None, pyarrow.py_buffer(view)])
+
+
+def arrow_records(array: Any) -> Any:
+    """Get the records of an Arrow array as a NumPy array without copy.
+
+    Args:
+        array (Any): `pyarrow.FixedSizeBinaryArray` of `pyarrow.binary(16)`. The records of null elements are undefined.
+
+    Returns:
+        Any: Read-only `(n, 16)` uint8 array whose rows are `UUID.bytes`.
+    """
+    numpy = import_numpy()
+    pyarrow = import_pyarrow()
+    assert array.type == pyarrow.binary(16), f"type must be binary(16), not {array.type}"
+
+    data = array.buffers()[1]
+    if data is None:
+        return numpy.zeros((len(array), _RECORD_BYTES_LENGTH), dtype=numpy.uint8)
+    return numpy.frombuffer(
+        data,
+        dtype=numpy.uint8,
+        count=len(array) * _RECORD_BYTES_LENGTH,
+        offset=array.offset * _RECORD_BYTES_LENGTH,
+    ).reshape(-1, _RECORD_BYTES_LENGTH)
+
+
+def parse_many_arrow(
+    uuids: Any,
+    spec: str = "latest",
+    uuid7_option: Optional[UUID7Option] = None,
+) -> Dict[str, Any]:
+    """Parse UUIDs in bulk into Arrow tables grouped by version.
+
+    The UUIDs are decoded as a NumPy array, so the types of the columns do not depend on the values.
+    The columns are the same as `parse_many`. Integer columns are uint64 except `index`, which is
+    int64, and columns longer than 64 bits such as `md5` are `binary(16)` in big-endian.
+    Absent fields, for example `seq` of a UUIDv7 option without counter, are null columns.
+    `pyarrow.Table.to_pandas` converts the tables into pandas DataFrames.
+
+    Args:
+        uuids (Any): `pyarrow.FixedSizeBinaryArray` or `pyarrow.ChunkedArray` without nulls, `UUIDArray`, or any input of `parse_many`.
+        spec (str, optional): UUID spec. Draft-peabody-dispatch-new-uuid-format-03 or later is supported. Defaults to "latest".
+        uuid7_option (Optional[UUID7Option], optional): UUIDv7 option. Required if UUIDv7 is included. Defaults to None.
+
+    Returns:
+        Dict[str, Any]: `pyarrow.Table` by version ("1" to "8", "nil" and "max").
+    """
+    numpy = import_numpy()
+    pyarrow = import_pyarrow()
+    if isinstance(uuids, pyarrow.ChunkedArray):
+        uuids = uuids.combine_chunks()
+    if isinstance(uuids, pyarrow.Array):
+        assert uuids.null_count == 0, "uuids must not contain nulls"
+        uuids = arrow_records(uuids)
+    elif isinstance(uuids, UUIDArray):
+        uuids = uuids.to_numpy()
+    elif not hasattr(uuids, "dtype"):
+        uuids = _to_ndarray(numpy, uuids)
+
+    tables = {}
+    for version, columns in parse_many(uuids, spec, uuid7_option).items():
+        length = len(columns["index"])
+        tables[version] = pyarrow.table(
+            {
+                name: _to_arrow_column(
+                    pyarrow,
+                    column,
+                    length,
+                    pyarrow.int64() if name == "index" else pyarrow.uint64(),
+                )
+                for name, column in columns.items()
+            }
+        )
+    return tables
+
+
+def _to_ndarray(numpy: Any, uuids: Any) -> Any:
+    if isinstance(uuids, (bytes, bytearray, memoryview)):
+        data = bytes(uuids)
+    else:
+        data = b"".join(_to_record(uuid) for uuid in uuids)
+    return numpy.frombuffer(data, dtype=numpy.uint8).reshape(-1, _RECORD_BYTES_LENGTH)
+
+
+def _to_record(uuid: Any) -> bytes:
+    if isinstance(uuid, UUID):
+        return uuid.bytes
+    elif isinstance(uuid, str):
+        return UUID(uuid).bytes
+    assert len(uuid) == 16, f"UUID bytes must be 16 bytes, not {len(uuid)}"
+    return bytes(uuid)
+
+
+def _to_arrow_column(pyarrow: Any, column: Any, length: int, type_: Any) -> Any:
+    if column is None:
+        return pyarrow.nulls(length, type_)
+    if column.dtype == object:
+        # Python int longer than 64 bits
+        return pyarrow.array(
+            [int(value).to_bytes(_RECORD_BYTES_LENGTH, "big") for value in column],
+            pyarrow.binary(16),
+        )
+    return pyarrow.array(column, type_)
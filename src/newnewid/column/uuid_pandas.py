@@ -0,0 +1,335 @@
+from typing import Any, Dict, Optional, Sequence, Type, cast
+from uuid import UUID
+
+try:
+    import numpy
+    import pandas
+    from pandas.api.extensions import (
+        ExtensionArray,
+        ExtensionDtype,
+        register_extension_dtype,
+        take,
+    )
+    from pandas.api.indexers import check_array_indexer
+    from pandas.api.types import is_integer, is_list_like
+except ImportError as e:
+    raise ImportError("pandas is required. Install it by `pip install newnewid[pandas]`.") from e
+
+from newnewid.column.uuid_array import UUIDArray
+from newnewid.column.uuid_arrow import arrow_records, generate_records, import_pyarrow
+from newnewid.draft_peabody_dispatch_new_uuid_format_03.uuid7_generator import (
+    UUID7Option,
+)
+from newnewid.parser.uuid_bulk_parser import parse_many
+
+# Bytes of a UUID record
+_RECORD_BYTES_LENGTH = 16
+
+
+@register_extension_dtype
+class UUIDDtype(ExtensionDtype):
+    """pandas dtype of `UUIDExtensionArray`, named "uuid"."""
+
+    @property
+    def name(self) -> str:
+        """Name of the dtype, "uuid"."""
+        return "uuid"
+
+    @property
+    def type(self) -> Type[UUID]:
+        """Scalar type of the elements, `UUID`."""
+        return UUID
+
+    @property
+    def kind(self) -> str:
+        """Kind of the dtype, "O" for Python objects."""
+        return "O"
+
+    @property
+    def na_value(self) -> Any:
+        """Value of the null elements, `pandas.NA`."""
+        return pandas.NA
+
+    @classmethod
+    def construct_from_string(cls, string: str) -> "UUIDDtype":
+        """Create the dtype from its name, for example `dtype="uuid"`."""
+        if not isinstance(string, str):
+            raise TypeError(f"'construct_from_string' expects a string, got {type(string)}")
+        if string != "uuid":
+            raise TypeError(f"Cannot construct a 'UUIDDtype' from '{string}'")
+        return cls()
+
+    def construct_array_type(self) -> Type["UUIDExtensionArray"]:
+        """Get the array type of the dtype, `UUIDExtensionArray`."""
+        return UUIDExtensionArray
+
+    def __from_arrow__(self, array: Any) -> "UUIDExtensionArray":
+        """Convert a `binary(16)` Arrow array, for `pyarrow.Table.to_pandas(types_mapper=...)`."""
+        chunks = array.chunks if hasattr(array, "chunks") else [array]
+        return UUIDExtensionArray._concat_same_type(
+            [UUIDExtensionArray._from_arrow_chunk(chunk) for chunk in chunks]
+            or [UUIDExtensionArray(b"")]
+        )
+
+
+class UUIDExtensionArray(ExtensionArray):
+    """pandas extension array of UUIDs stored as a `(n, 16)` uint8 NumPy array and a null mask.
+
+    A Series or a DataFrame column of this array holds 17 bytes per UUID instead of a `UUID`
+    object each. `UUID` objects are created only on element access. It is converted to a
+    `binary(16)` Arrow array, for example by `DataFrame.to_parquet`, without copying the records.
+    """
+
+    def __init__(self, records: Any, mask: Any = None) -> None:
+        """Create UUID extension array.
+
+        Args:
+            records (Any): `(n, 16)` uint8 NumPy array whose rows are `UUID.bytes` such as the result of `generate_ndarray`, `UUIDArray` or a bytes-like object of 16-byte records. NumPy arrays and `UUIDArray` are not copied.
+            mask (Any, optional): Boolean array that is True for null elements. Defaults to None.
+        """
+        if isinstance(records, UUIDArray):
+            records = records.to_numpy()
+        elif not isinstance(records, numpy.ndarray):
+            records = numpy.frombuffer(memoryview(records).cast("B"), dtype=numpy.uint8)
+            records = records.reshape(-1, _RECORD_BYTES_LENGTH)
+        assert (
+            records.dtype == numpy.uint8 and records.ndim == 2 and records.shape[1] == 16
+        ), f"records must be a (n, 16) uint8 array, not {records.dtype} {records.shape}"
+
+        self._records = records
+        if mask is None:
+            self._mask = numpy.zeros(len(records), dtype=bool)
+        else:
+            self._mask = numpy.asarray(mask, dtype=bool)
+            assert self._mask.shape == (len(records),), "mask must be as long as records"
+
+    @classmethod
+    def generate(cls, n: int, generator: Any = None) -> "UUIDExtensionArray":
+        """Generate UUIDs into an extension array without creating `UUID` objects.
+
+        Args:
+            n (int): Number of UUIDs.
+            generator (Any, optional): Generator that has `generate_into`, such as `UUID7Generator` or `UUID6Generator`. UUIDv4 is generated if None. Defaults to None.
+
+        Returns:
+            UUIDExtensionArray: UUIDs.
+        """
+        return cls(generate_records(n, generator))
+
+    @classmethod
+    def _from_sequence(
+        cls, scalars: Any, *, dtype: Any = None, copy: bool = False
+    ) -> "UUIDExtensionArray":
+        if isinstance(scalars, cls):
+            return scalars.copy() if copy else scalars
+
+        records = [_to_record(scalar) for scalar in scalars]
+        mask = numpy.array([record is None for record in records], dtype=bool)
+        null_record = bytes(_RECORD_BYTES_LENGTH)
+        data = b"".join(null_record if record is None else record for record in records)
+        return cls(bytearray(data), mask)
+
+    @classmethod
+    def _from_sequence_of_strings(
+        cls, strings: Any, *, dtype: Any = None, copy: bool = False
+    ) -> "UUIDExtensionArray":
+        return cls._from_sequence(strings, dtype=dtype, copy=copy)
+
+    @classmethod
+    def _from_factorized(cls, values: Any, original: Any) -> "UUIDExtensionArray":
+        return cls._from_sequence(values)
+
+    @classmethod
+    def _from_arrow_chunk(cls, chunk: Any) -> "UUIDExtensionArray":
+        mask = chunk.is_null().to_numpy(zero_copy_only=False) if chunk.null_count else None
+        return cls(arrow_records(chunk), mask)
+
+    @classmethod
+    def _concat_same_type(cls, to_concat: Sequence[ExtensionArray]) -> "UUIDExtensionArray":
+        arrays = cast(Sequence[UUIDExtensionArray], to_concat)
+        return cls(
+            numpy.concatenate([array._records for array in arrays]),
+            numpy.concatenate([array._mask for array in arrays]),
+        )
+
+    @property
+    def dtype(self) -> UUIDDtype:
+        """Dtype of the array, `UUIDDtype`."""
+        return UUIDDtype()
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes of the records and the null mask."""
+        return self._records.nbytes + self._mask.nbytes
+
+    def __len__(self) -> int:
+        """Get the number of elements."""
+        return len(self._records)
+
+    def __getitem__(self, item: Any) -> Any:
+        """Get a `UUID` or `pandas.NA` by an integer, or an array by a slice or a mask."""
+        if isinstance(item, tuple):
+            # `array[..., key]` and `array[key, ...]` of the 1-D array
+            item = next((key for key in item if key is not Ellipsis), Ellipsis)
+        if is_integer(item):
+            if self._mask[item]:
+                return pandas.NA
+            return UUID(bytes=self._records[item].tobytes())
+
+        item = check_array_indexer(self, item)
+        return type(self)(self._records[item], self._mask[item])
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        """Set UUIDs or nulls. `UUID`, str, int and 16 bytes are accepted."""
+        key = check_array_indexer(self, key)
+        if is_list_like(value):
+            array = self._from_sequence(value)
+            self._records[key] = array._records
+            self._mask[key] = array._mask
+            return
+
+        record = _to_record(value)
+        if record is not None:
+            self._records[key] = numpy.frombuffer(record, dtype=numpy.uint8)
+        self._mask[key] = record is None
+
+    def __eq__(self, other: Any) -> Any:  # type: ignore[override]
+        """Compare elementwise. Null elements are not equal to anything."""
+        if isinstance(other, (pandas.Series, pandas.Index, pandas.DataFrame)):
+            return NotImplemented
+
+        if is_list_like(other):
+            other_array = self._from_sequence(other)
+            assert len(other_array) == len(self), "lengths must match to compare"
+            return (
+                (self._records == other_array._records).all(axis=1)
+                & ~self._mask
+                & ~other_array._mask
+            )
+
+        record = _to_record(other)
+        if record is None:
+            return numpy.zeros(len(self), dtype=bool)
+        equal = (self._records == numpy.frombuffer(record, dtype=numpy.uint8)).all(axis=1)
+        return equal & ~self._mask
+
+    def __array__(self, dtype: Any = None, copy: Any = None) -> Any:
+        """Convert into a NumPy object array of `UUID` and `pandas.NA`."""
+        if copy is False:
+            raise ValueError("UUIDExtensionArray cannot be converted to a NumPy array without copy")
+        result = numpy.empty(len(self), dtype=object)
+        for i, record in enumerate(self._iter_records()):
+            result[i] = pandas.NA if record is None else UUID(bytes=record)
+        return result if dtype is None else result.astype(dtype)
+
+    def __arrow_array__(self, type: Any = None) -> Any:
+        """Convert into a `binary(16)` Arrow array without copying contiguous records."""
+        pyarrow = import_pyarrow()
+        records = numpy.ascontiguousarray(self._records)
+        validity = None
+        if self._mask.any():
+            validity = pyarrow.py_buffer(numpy.packbits(~self._mask, bitorder="little"))
+        return pyarrow.Array.from_buffers(
+            pyarrow.binary(16),
+            len(self),
+            [validity, pyarrow.py_buffer(records)],
+            null_count=int(self._mask.sum()),
+        )
+
+    def isna(self) -> Any:
+        """Get the null mask."""
+        return self._mask.copy()
+
+    def copy(self) -> "UUIDExtensionArray":
+        """Copy the records and the null mask."""
+        return type(self)(self._records.copy(), self._mask.copy())
+
+    def take(
+        self, indices: Any, *, allow_fill: bool = False, fill_value: Any = None
+    ) -> "UUIDExtensionArray":
+        """Take elements by positions. -1 is null or `fill_value` if `allow_fill`."""
+        indices = numpy.asarray(indices, dtype=numpy.intp)
+        if not allow_fill:
+            positions = take(numpy.arange(len(self)), indices)
+            return type(self)(self._records[positions], self._mask[positions])
+
+        # -1 is filled with `fill_value`.
+        positions = take(numpy.arange(len(self)), indices, allow_fill=True, fill_value=-1)
+        filled = positions == -1
+        if len(self) == 0:
+            records = numpy.zeros((len(positions), _RECORD_BYTES_LENGTH), dtype=numpy.uint8)
+            mask = numpy.zeros(len(positions), dtype=bool)
+        else:
+            records = self._records[positions]
+            mask = self._mask[positions]
+
+        fill_record = _to_record(fill_value)
+        if fill_record is not None:
+            records[filled] = numpy.frombuffer(fill_record, dtype=numpy.uint8)
+        mask[filled] = fill_record is None
+        return type(self)(records, mask)
+
+    def _values_for_factorize(self) -> Any:
+        values = numpy.empty(len(self), dtype=object)
+        for i, record in enumerate(self._iter_records()):
+            values[i] = record
+        return values, None
+
+    def _values_for_argsort(self) -> Any:
+        # Fixed-length byte strings are compared bytewise, the same as the UUIDs.
+        return numpy.ascontiguousarray(self._records).view(f"S{_RECORD_BYTES_LENGTH}").ravel()
+
+    def _iter_records(self) -> Any:
+        # 16-byte records, or None for null elements
+        data = self._records.tobytes()
+        for i, is_null in enumerate(self._mask.tolist()):
+            offset = i * _RECORD_BYTES_LENGTH
+            yield None if is_null else data[offset : offset + _RECORD_BYTES_LENGTH]  # noqa: E203
+
+
+def parse_many_frames(
+    uuids: Any,
+    spec: str = "latest",
+    uuid7_option: Optional[UUID7Option] = None,
+) -> Dict[str, Any]:
+    """Parse UUIDs in bulk into pandas DataFrames grouped by version.
+
+    The columns are the same as `parse_many`, and the index of each DataFrame is the positions
+    in `uuids`. Columns longer than 64 bits such as `md5` are object columns of Python int.
+
+    Args:
+        uuids (Any): `UUIDExtensionArray` or Series of it without nulls, or any input of `parse_many`.
+        spec (str, optional): UUID spec. Draft-peabody-dispatch-new-uuid-format-03 or later is supported. Defaults to "latest".
+        uuid7_option (Optional[UUID7Option], optional): UUIDv7 option. Required if UUIDv7 is included. Defaults to None.
+
+    Returns:
+        Dict[str, Any]: `pandas.DataFrame` by version ("1" to "8", "nil" and "max").
+    """
+    if isinstance(uuids, pandas.Series):
+        uuids = uuids.array
+    if isinstance(uuids, UUIDExtensionArray):
+        assert not uuids._mask.any(), "uuids must not contain nulls"
+        uuids = uuids._records
+    elif isinstance(uuids, UUIDArray):
+        uuids = uuids.to_numpy()
+
+    frames = {}
+    for version, columns in parse_many(uuids, spec, uuid7_option).items():
+        index = columns.pop("index")
+        frames[version] = pandas.DataFrame(columns, index=index)
+    return frames
+
+
+def _to_record(scalar: Any) -> Optional[bytes]:
+    if scalar is None or scalar is pandas.NA or (isinstance(scalar, float) and scalar != scalar):
+        return None
+    elif isinstance(scalar, UUID):
+        return scalar.bytes
+    elif isinstance(scalar, str):
+        return UUID(scalar).bytes
+    elif isinstance(scalar, int) and not isinstance(scalar, bool):
+        return UUID(int=scalar).bytes
+    elif isinstance(scalar, (bytes, bytearray, memoryview)):
+        assert len(scalar) == 16, f"UUID bytes must be 16 bytes, not {len(scalar)}"
+        return bytes(scalar)
+    raise TypeError(f"{type(scalar).__name__} cannot be converted to UUID")
@@ -1,6 +1,7 @@
-from typing import Optional
+from typing import List, Optional
 
 from newnewid.random.pseudo_random_generator import PseudoRandomGenerator
+from newnewid.stats.generator_stats import GeneratorStats
 
 
 class Counter:
@@ -18,6 +19,7 @@ class Counter:
         pseudo_random_generator: PseudoRandomGenerator,
         initial_timestamp: Optional[int],
         initial_counter: Optional[int],
+        stats: Optional[GeneratorStats] = None,
     ) -> None:
         """Create counter.
 
@@ -27,6 +29,7 @@ class Counter:
             pseudo_random_generator (PseudoRandomGenerator): Pseudo random generator.
             initial_last_timestamp (Optional[int]): Initial timestamp.
             initial_counter (Optional[int]): Initial counter value.
+            stats (Optional[GeneratorStats], optional): Stats to count the rollovers. Defaults to None.
         """
         if counter_bits_length > 0:
             assert (
@@ -43,6 +46,7 @@ class Counter:
         self.mask: int = (1 << counter_bits_length) - 1
         self.max_increment_bits_length = max_increment_bits_length
         self._pseudo_random_generator = pseudo_random_generator
+        self.stats = stats
 
         self.last_timestamp = initial_timestamp
         if initial_counter is None:
@@ -53,9 +57,50 @@ class Counter:
         else:
             self.counter = initial_counter
 
+    def reset(self) -> None:
+        """Reset the counter.
+
+        The counter is reset to a random value on the next call even if the timestamp is the same.
+        """
+        if self.counter_bits_length > 0:
+            self.counter = None
+            self.last_timestamp = None
+
+    def observe(
+        self, timestamp: int, counter: Optional[int], max_timestamp: Optional[int] = None
+    ) -> None:
+        """Continue the counter after a counter value issued by another generator.
+
+        The pair of `timestamp` and `counter` is kept if it is after the last one, so the next
+        value for the same timestamp is greater than `counter`.
+
+        Args:
+            timestamp (int): Timestamp of the counter value.
+            counter (Optional[int]): Counter value.
+            max_timestamp (Optional[int], optional): Maximum timestamp accepted. A later `timestamp` is ignored, for example one from a generator whose clock is far ahead. Unlimited if None. Defaults to None.
+        """
+        if self.counter_bits_length == 0 or counter is None:
+            return
+        if max_timestamp is not None and timestamp > max_timestamp:
+            return
+
+        if self.last_timestamp is None or (timestamp, counter) > (
+            self.last_timestamp,
+            self.counter if self.counter is not None else -1,
+        ):
+            self.last_timestamp = timestamp
+            self.counter = counter
+
     def _get_counter_reset_value(self) -> int:
         return self._pseudo_random_generator.generate(self.counter_bits_length - 1, "counter-reset")
 
+    def _get_increment(self) -> int:
+        assert self.max_increment_bits_length is not None
+        # 0 is not an increment, so the range is [1, 2^max_increment_bits_length).
+        return self._pseudo_random_generator.generate_range(
+            1, 1 << self.max_increment_bits_length, "counter-increment"
+        )
+
     def get_next(self, timestamp: int) -> int:
         """Ge next counter value.
 
@@ -65,6 +110,9 @@ class Counter:
         Returns:
             int: counter value.
         """
+        return self._get_next(timestamp)
+
+    def _get_next(self, timestamp: int) -> int:
         if self.counter_bits_length == 0:
             return 0
 
@@ -75,15 +123,46 @@ class Counter:
             if self.max_increment_bits_length == 1:
                 increment = 1
             else:
-                assert self.max_increment_bits_length is not None
-                increment = 0
-                while increment <= 0:
-                    increment = self._pseudo_random_generator.generate(
-                        self.max_increment_bits_length, "counter-increment"
-                    )
+                increment = self._get_increment()
             new_counter_raw = self.counter + increment
+            if new_counter_raw > self.mask and self.stats is not None:
+                self.stats.counter_rollovers += 1
         else:
             new_counter_raw = self._get_counter_reset_value()
         self.counter = new_counter_raw & self.mask
         self.last_timestamp = timestamp
         return self.counter
+
+    def get_next_many(self, timestamp: int, n: int) -> List[int]:
+        """Get a run of next counter values for the same timestamp.
+
+        The first value is the same as `get_next`. The following values are reserved in one step
+        and the run stops before the counter rolls over, so fewer than `n` values may be returned.
+        Only one value is returned without counter bits.
+
+        Args:
+            timestamp (int): Current timestamp.
+            n (int): Maximum number of counter values.
+
+        Returns:
+            List[int]: Counter values. At least one value is returned.
+        """
+        first = self._get_next(timestamp)
+        if self.counter_bits_length == 0:
+            # Without a counter, the UUIDs after the first are not ordered within the timestamp,
+            # so the run is cut off there and the clock is read again.
+            return [first]
+
+        if self.max_increment_bits_length == 1:
+            counters = list(range(first, min(first + n - 1, self.mask) + 1))
+        else:
+            counters = [first]
+            counter = first
+            while len(counters) < n:
+                counter += self._get_increment()
+                if counter > self.mask:
+                    break
+                counters.append(counter)
+
+        self.counter = counters[-1]
+        return counters
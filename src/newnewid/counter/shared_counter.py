@@ -0,0 +1,112 @@
+from typing import List, Optional
+
+from newnewid.counter.counter import Counter
+from newnewid.counter.shared_counter_state import SharedCounterState
+from newnewid.random.pseudo_random_generator import PseudoRandomGenerator
+from newnewid.stats.generator_stats import GeneratorStats
+
+
+class SharedCounter(Counter):
+    """Timebased counter shared between processes.
+
+    The last timestamp and the counter are kept in `SharedCounterState` and updated under its lock.
+    A timestamp older than the shared one is moved forward to it, and the counter overflow is carried
+    into the timestamp, so the pairs of timestamp and counter are strictly increasing across processes.
+
+    After the call, `last_timestamp` is the timestamp the returned counter values belong to.
+    """
+
+    def __init__(
+        self,
+        counter_bits_length: int,
+        max_increment_bits_length: Optional[int],
+        pseudo_random_generator: PseudoRandomGenerator,
+        initial_timestamp: Optional[int],
+        initial_counter: Optional[int],
+        shared_counter_state: SharedCounterState,
+        stats: Optional[GeneratorStats] = None,
+    ) -> None:
+        """Create shared counter.
+
+        Args:
+            counter_bits_length (int): Number of bits of the counter.
+            max_increment_bits_length (Optional[int]): Maximum number of bits of the increment. Maximum value is 2^max_increment_bits_length - 1.
+            pseudo_random_generator (PseudoRandomGenerator): Pseudo random generator.
+            initial_timestamp (Optional[int]): Initial timestamp. It is stored only if it is after the shared one.
+            initial_counter (Optional[int]): Initial counter value.
+            shared_counter_state (SharedCounterState): State shared between processes.
+            stats (Optional[GeneratorStats], optional): Stats to count the rollovers. Defaults to None.
+        """
+        assert (
+            counter_bits_length > 0
+        ), f"counter_bits_length must be greater than 0, not {counter_bits_length}"
+        super().__init__(
+            counter_bits_length,
+            max_increment_bits_length,
+            pseudo_random_generator,
+            initial_timestamp,
+            initial_counter,
+            stats,
+        )
+        self._shared_counter_state = shared_counter_state
+
+        if initial_timestamp is not None:
+            self.observe(initial_timestamp, initial_counter)
+
+    def observe(
+        self, timestamp: int, counter: Optional[int], max_timestamp: Optional[int] = None
+    ) -> None:
+        """Continue the shared counter after a counter value issued by another generator.
+
+        Args:
+            timestamp (int): Timestamp of the counter value. It is stored only if it is after the shared one.
+            counter (Optional[int]): Counter value.
+            max_timestamp (Optional[int], optional): Maximum timestamp accepted. A later `timestamp` is ignored. Unlimited if None. Defaults to None.
+        """
+        if max_timestamp is not None and timestamp > max_timestamp:
+            return
+
+        with self._shared_counter_state.lock:
+            shared_timestamp, shared_counter = self._shared_counter_state.load()
+            if shared_timestamp is None or (shared_timestamp, shared_counter or 0) < (
+                timestamp,
+                counter or 0,
+            ):
+                self._shared_counter_state.store(timestamp, counter)
+
+    def get_next(self, timestamp: int) -> int:
+        """Get next counter value.
+
+        Args:
+            timestamp (int): Current timestamp. It may be moved forward, see `last_timestamp`.
+
+        Returns:
+            int: counter value.
+        """
+        return self.get_next_many(timestamp, 1)[0]
+
+    def get_next_many(self, timestamp: int, n: int) -> List[int]:
+        """Get a run of next counter values for the same timestamp.
+
+        Args:
+            timestamp (int): Current timestamp. It may be moved forward, see `last_timestamp`.
+            n (int): Maximum number of counter values.
+
+        Returns:
+            List[int]: Counter values. At least one value is returned.
+        """
+        with self._shared_counter_state.lock:
+            self.last_timestamp, self.counter = self._shared_counter_state.load()
+
+            if self.last_timestamp is not None and timestamp < self.last_timestamp:
+                timestamp = self.last_timestamp
+            last_counter = self.counter if timestamp == self.last_timestamp else None
+
+            counters = super().get_next_many(timestamp, n)
+            if last_counter is not None and counters[0] <= last_counter:
+                # Carry the overflow into the timestamp.
+                counters = super().get_next_many(timestamp + 1, n)
+
+            self._shared_counter_state.store(self.last_timestamp, self.counter)
+
+        return counters
@@ -0,0 +1,76 @@
+from typing import Optional, Tuple
+
+_WORD_BITS_LENGTH = 64
+_WORD_MASK = (1 << _WORD_BITS_LENGTH) - 1
+
+# flags, timestamp (high, low), counter (high, low)
+_FLAGS_INDEX = 0
+_TIMESTAMP_INDEX = 1
+_COUNTER_INDEX = 3
+_WORDS_LENGTH = 5
+
+_HAS_TIMESTAMP = 0b01
+_HAS_COUNTER = 0b10
+
+
+class SharedCounterState:
+    """Last timestamp and counter shared between processes.
+
+    The state is kept in shared memory and guarded by a process-shared lock.
+    Create it in the parent process and pass it to the worker processes as an argument of
+    `multiprocessing.Process` or as `initargs` of `multiprocessing.Pool`, or let the workers
+    inherit it by `os.fork`. Then the generators of all workers issue one strictly increasing stream.
+
+    One state must be used with one UUID option.
+    """
+
+    def __init__(self) -> None:
+        """Create shared counter state."""
+        import ctypes
+        import multiprocessing
+
+        self._words = multiprocessing.RawArray(ctypes.c_uint64, _WORDS_LENGTH)
+        self.lock = multiprocessing.Lock()
+
+    def load(self) -> Tuple[Optional[int], Optional[int]]:
+        """Load the last timestamp and counter.
+
+        The caller must hold `lock`.
+
+        Returns:
+            Tuple[Optional[int], Optional[int]]: Last timestamp and counter. None if not set.
+        """
+        words = self._words[:]
+        flags = words[_FLAGS_INDEX]
+        timestamp = (
+            (words[_TIMESTAMP_INDEX] << _WORD_BITS_LENGTH) | words[_TIMESTAMP_INDEX + 1]
+            if flags & _HAS_TIMESTAMP
+            else None
+        )
+        counter = (
+            (words[_COUNTER_INDEX] << _WORD_BITS_LENGTH) | words[_COUNTER_INDEX + 1]
+            if flags & _HAS_COUNTER
+            else None
+        )
+        return timestamp, counter
+
+    def store(self, timestamp: Optional[int], counter: Optional[int]) -> None:
+        """Store the last timestamp and counter.
+
+        The caller must hold `lock`.
+
+        Args:
+            timestamp (Optional[int]): Last timestamp.
+            counter (Optional[int]): Last counter.
+        """
+        flags = 0
+        timestamp_words = [0, 0]
+        counter_words = [0, 0]
+        if timestamp is not None:
+            flags |= _HAS_TIMESTAMP
+            timestamp_words = [timestamp >> _WORD_BITS_LENGTH, timestamp & _WORD_MASK]
+        if counter is not None:
+            flags |= _HAS_COUNTER
+            counter_words = [counter >> _WORD_BITS_LENGTH, counter & _WORD_MASK]
+
+        self._words[:] = [flags] + timestamp_words + counter_words
@@ -1,3 +1,4 @@
+from typing import TYPE_CHECKING
 from uuid import (
     NAMESPACE_DNS,
     NAMESPACE_OID,
@@ -16,40 +17,87 @@ from uuid import (
     uuid5,
 )
 
-from newnewid.clock.uuid_clock import UUIDClock
-from newnewid.counter.counter import Counter
-from newnewid.draft_ietf_uuidrev_rfc4122bis_00.nil_uuid_generator import (
-    NilUUIDGenerator,
-    nil_uuid,
-)
-from newnewid.draft_peabody_dispatch_new_uuid_format_01.uuid6_generator import (
-    UUID6Generator,
-    uuid6,
-)
-from newnewid.draft_peabody_dispatch_new_uuid_format_03.max_uuid_generator import (
-    MaxUUIDGenerator,
-    max_uuid,
-)
-from newnewid.draft_peabody_dispatch_new_uuid_format_03.uuid7_generator import (
-    METHOD_0_NO_COUNTER,
-    METHOD_1_FIXED_LENGTH_DEDICATED_COUNTER_BITS_12,
-    METHOD_1_FIXED_LENGTH_DEDICATED_COUNTER_BITS_26,
-    METHOD_1_FIXED_LENGTH_DEDICATED_COUNTER_BITS_42,
-    METHOD_2_MONOTONIC_RANDOM_62_BITS,
-    UUID7Generator,
-    UUID7Option,
-    ulid_compatible,
-    uuid7,
-)
-from newnewid.draft_peabody_dispatch_new_uuid_format_03.uuid8_generator import (
-    UUID8Generator,
-    uuid8,
+from newnewid.util.lazy_module import lazy_module_attributes
+
+# The same attributes for static analysis. They are not imported at runtime.
+if TYPE_CHECKING:
+    from newnewid.clock.uuid_clock import UUIDClock
+    from newnewid.counter.counter import Counter
+    from newnewid.draft_ietf_uuidrev_rfc4122bis_00.nil_uuid_generator import (
+        NilUUIDGenerator,
+        nil_uuid,
+    )
+    from newnewid.draft_peabody_dispatch_new_uuid_format_01.uuid6_generator import (
+        UUID6Generator,
+        uuid6,
+    )
+    from newnewid.draft_peabody_dispatch_new_uuid_format_03.max_uuid_generator import (
+        MaxUUIDGenerator,
+        max_uuid,
+    )
+    from newnewid.draft_peabody_dispatch_new_uuid_format_03.uuid7_generator import (
+        METHOD_0_NO_COUNTER,
+        METHOD_1_FIXED_LENGTH_DEDICATED_COUNTER_BITS_12,
+        METHOD_1_FIXED_LENGTH_DEDICATED_COUNTER_BITS_26,
+        METHOD_1_FIXED_LENGTH_DEDICATED_COUNTER_BITS_42,
+        METHOD_2_MONOTONIC_RANDOM_62_BITS,
+        UUID7Generator,
+        UUID7Option,
+        ulid_compatible,
+        uuid7,
+    )
+    from newnewid.draft_peabody_dispatch_new_uuid_format_03.uuid8_generator import (
+        UUID8Generator,
+        uuid8,
+    )
+    from newnewid.exception.backward_uuid_exception import BackwardUUIDException
+    from newnewid.random.pseudo_random_binary_generator import (
+        PseudoRandomBinaryGenerator,
+    )
+    from newnewid.random.pseudo_random_generator import PseudoRandomGenerator
+    from newnewid.uuidgenerator.gregorian_based_uuid_generator import (
+        MacAddressGenerator,
+    )
+    from newnewid.uuidgenerator.uuid_generator import UUIDGenerator
+
+# The attributes are imported on first access to keep the import fast.
+__getattr__, __dir__ = lazy_module_attributes(
+    __name__,
+    {
+        "UUIDClock": "newnewid.clock.uuid_clock",
+        "Counter": "newnewid.counter.counter",
+        "NilUUIDGenerator": "newnewid.draft_ietf_uuidrev_rfc4122bis_00.nil_uuid_generator",
+        "nil_uuid": "newnewid.draft_ietf_uuidrev_rfc4122bis_00.nil_uuid_generator",
+        "UUID6Generator": "newnewid.draft_peabody_dispatch_new_uuid_format_01.uuid6_generator",
+        "uuid6": "newnewid.draft_peabody_dispatch_new_uuid_format_01.uuid6_generator",
+        "MaxUUIDGenerator": "newnewid.draft_peabody_dispatch_new_uuid_format_03.max_uuid_generator",
+        "max_uuid": "newnewid.draft_peabody_dispatch_new_uuid_format_03.max_uuid_generator",
+        "METHOD_0_NO_COUNTER": "newnewid.draft_peabody_dispatch_new_uuid_format_03.uuid7_generator",
+        "METHOD_1_FIXED_LENGTH_DEDICATED_COUNTER_BITS_12": (
+            "newnewid.draft_peabody_dispatch_new_uuid_format_03.uuid7_generator"
+        ),
+        "METHOD_1_FIXED_LENGTH_DEDICATED_COUNTER_BITS_26": (
+            "newnewid.draft_peabody_dispatch_new_uuid_format_03.uuid7_generator"
+        ),
+        "METHOD_1_FIXED_LENGTH_DEDICATED_COUNTER_BITS_42": (
+            "newnewid.draft_peabody_dispatch_new_uuid_format_03.uuid7_generator"
+        ),
+        "METHOD_2_MONOTONIC_RANDOM_62_BITS": (
+            "newnewid.draft_peabody_dispatch_new_uuid_format_03.uuid7_generator"
+        ),
+        "UUID7Generator": "newnewid.draft_peabody_dispatch_new_uuid_format_03.uuid7_generator",
+        "UUID7Option": "newnewid.draft_peabody_dispatch_new_uuid_format_03.uuid7_generator",
+        "ulid_compatible": "newnewid.draft_peabody_dispatch_new_uuid_format_03.uuid7_generator",
+        "uuid7": "newnewid.draft_peabody_dispatch_new_uuid_format_03.uuid7_generator",
+        "UUID8Generator": "newnewid.draft_peabody_dispatch_new_uuid_format_03.uuid8_generator",
+        "uuid8": "newnewid.draft_peabody_dispatch_new_uuid_format_03.uuid8_generator",
+        "BackwardUUIDException": "newnewid.exception.backward_uuid_exception",
+        "PseudoRandomBinaryGenerator": "newnewid.random.pseudo_random_binary_generator",
+        "PseudoRandomGenerator": "newnewid.random.pseudo_random_generator",
+        "MacAddressGenerator": "newnewid.uuidgenerator.gregorian_based_uuid_generator",
+        "UUIDGenerator": "newnewid.uuidgenerator.uuid_generator",
+    },
 )
-from newnewid.exception.backward_uuid_exception import BackwardUUIDException
-from newnewid.random.pseudo_random_binary_generator import PseudoRandomBinaryGenerator
-from newnewid.random.pseudo_random_generator import PseudoRandomGenerator
-from newnewid.uuidgenerator.gregorian_based_uuid_generator import MacAddressGenerator
-from newnewid.uuidgenerator.uuid_generator import UUIDGenerator
 
 __all__ = [
     # Compatibility
@@ -1,6 +1,7 @@
 from typing import Any, Dict
 from uuid import UUID
 
+from newnewid.parser.uuid_record import UUIDRecord
 from newnewid.util.nodoc import nodoc
 from newnewid.uuidgenerator.uuid_generator import UUIDGenerator
 
@@ -17,9 +18,12 @@ class NilUUIDGenerator(UUIDGenerator):
     @classmethod
     @nodoc
     def parse(cls, uuid: UUID, **kwargs: Any) -> Dict[str, Any]:
-        return {
-            "ver": "nil",
-        }
+        return cls.parse_record(uuid).to_dict()
+
+    @classmethod
+    @nodoc
+    def parse_record(cls, uuid: UUID, **kwargs: Any) -> UUIDRecord:
+        return UUIDRecord("nil")
 
 
 _nil_uuid_generator = NilUUIDGenerator()
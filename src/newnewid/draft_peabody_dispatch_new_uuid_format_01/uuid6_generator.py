@@ -1,7 +1,9 @@
-from typing import Any, Dict
+import threading
+from typing import Any, Dict, Optional
 from uuid import UUID
 
-from newnewid.clock.uuid_clock import UUIDClock
+from newnewid.parser.uuid_record import UUID6Record
+from newnewid.shard.thread_shard import get_thread_shard_option
 from newnewid.util.nodoc import nodoc
 from newnewid.uuidgenerator.gregorian_based_uuid_generator import (
     GregorianBasedUUIDGenerator,
@@ -61,6 +63,11 @@ class UUID6Generator(GregorianBasedUUIDGenerator):
     @classmethod
     @nodoc
     def parse(cls, uuid: UUID, **kwargs: Any) -> Dict[str, Any]:
+        return cls.parse_record(uuid).to_dict()
+
+    @classmethod
+    @nodoc
+    def parse_record(cls, uuid: UUID, **kwargs: Any) -> UUID6Record:
         # 32 bits
         time_high = (uuid.int >> 96) & 0xFFFF_FFFF
 
@@ -83,39 +90,60 @@ class UUID6Generator(GregorianBasedUUIDGenerator):
         # 48 bits
         node = uuid.int & 0xFFFF_FFFF_FFFF
 
-        gregorian_100_nano_seconds = (time_high << 28) | (time_mid << 12) | time_low
-        time, epoch_nano_fraction = UUIDClock.to_datetime_from_gregorian_100_nano_seconds(
-            gregorian_100_nano_seconds
-        )
-
-        return {
-            "time_high": time_high,
-            "time_mid": time_mid,
-            "ver": str(version),
-            "time_low": time_low,
-            "variant": variant,
-            "clock_seq": clock_seq,
-            "node": node,
-            "gregorian_100_nano_seconds": gregorian_100_nano_seconds,
-            "time": time.isoformat(),
-            "epoch_nano_fraction": epoch_nano_fraction,
-        }
+        return UUID6Record(time_high, time_mid, str(version), time_low, variant, clock_seq, node)
 
 
 _uses_mac_address_to_uuid6_generator: Dict[int, UUID6Generator] = {}
+_uses_mac_address_to_uuid6_generator_lock = threading.Lock()
+
+_thread_local = threading.local()
+
 
+def _get_thread_local_uuid6_generator(shard_bits_length: int) -> UUID6Generator:
+    shard_bits_length_to_generator: Optional[Dict[int, UUID6Generator]] = getattr(
+        _thread_local, "shard_bits_length_to_uuid6_generator", None
+    )
+    if shard_bits_length_to_generator is None:
+        shard_bits_length_to_generator = _thread_local.shard_bits_length_to_uuid6_generator = {}
 
-def uuid6(uses_mac_address: bool = False) -> UUID:
+    if shard_bits_length not in shard_bits_length_to_generator:
+        shard_bits_length_to_generator[shard_bits_length] = UUID6Generator(
+            uses_mac_address=False,
+            shard_option=get_thread_shard_option(shard_bits_length),
+        )
+
+    return shard_bits_length_to_generator[shard_bits_length]
+
+
+def uuid6(
+    uses_mac_address: bool = False,
+    sharded: bool = False,
+    shard_bits_length: int = 0,
+) -> UUID:
     """Generate UUIDv6.
 
+    By default, all threads share one generator and the UUIDs are monotonic across threads.
+    If `sharded` is True, each thread has its own generator and no lock is contended.
+    The UUIDs are monotonic per thread only.
+
     Args:
         uses_mac_address (bool, optional): MAC address is used for `node` if True. Otherwise, pseudo-random number is used. Defaults to False.
+        sharded (bool, optional): Use a generator per thread if True. It cannot be used with `uses_mac_address`. Defaults to False.
+        shard_bits_length (int, optional): Number of left most bits of `node` replaced with the shard ID of the thread in sharded mode. Defaults to 0.
     Returns:
         UUID: UUIDv6.
     """
-    if uses_mac_address not in _uses_mac_address_to_uuid6_generator:
-        _uses_mac_address_to_uuid6_generator[uses_mac_address] = UUID6Generator(
-            uses_mac_address=uses_mac_address
-        )
-
-    return _uses_mac_address_to_uuid6_generator[uses_mac_address].generate()
+    if sharded:
+        assert not uses_mac_address, "sharded cannot be used with uses_mac_address"
+        return _get_thread_local_uuid6_generator(shard_bits_length).generate()
+
+    # The generator is created on first use. The lock keeps one generator per `uses_mac_address`.
+    uuid6_generator = _uses_mac_address_to_uuid6_generator.get(uses_mac_address)
+    if uuid6_generator is None:
+        with _uses_mac_address_to_uuid6_generator_lock:
+            uuid6_generator = _uses_mac_address_to_uuid6_generator.get(uses_mac_address)
+            if uuid6_generator is None:
+                uuid6_generator = UUID6Generator(uses_mac_address=uses_mac_address)
+                _uses_mac_address_to_uuid6_generator[uses_mac_address] = uuid6_generator
+
+    return uuid6_generator.generate()
@@ -1,3 +1,4 @@
+import threading
 from datetime import datetime, timedelta
 from typing import Any, Dict, Literal, Optional, Tuple
 from uuid import UUID
@@ -6,6 +7,7 @@ from newnewid.clock.uuid_clock import UUIDClock
 from newnewid.counter.counter import Counter
 from newnewid.random.pseudo_random_binary_generator import PseudoRandomBinaryGenerator
 from newnewid.random.pseudo_random_generator import PseudoRandomGenerator
+from newnewid.stats.generator_stats import GeneratorStats
 from newnewid.util.nodoc import nodoc
 from newnewid.uuidgenerator.clock_based_uuid_generator import ClockBasedUUIDGenerator
 
@@ -69,6 +71,7 @@ class UUID7Generator(ClockBasedUUIDGenerator):
         clock: Optional[UUIDClock] = None,
         pseudo_random_generator: Optional[PseudoRandomGenerator] = None,
         last_uuid: Optional[UUID] = None,
+        stats: Optional[GeneratorStats] = None,
     ) -> None:
         """Create UUID7 generator.
 
@@ -78,8 +81,11 @@ class UUID7Generator(ClockBasedUUIDGenerator):
             clock (Optional[UUIDClock], optional): Clock. Defaults to None.
             pseudo_random_generator (Optional[PseudoRandomGenerator], optional): Pseudo random generator. Defaults to None.
             last_uuid (Optional[UUID], optional): Last UUID. Defaults to None.
+            stats (Optional[GeneratorStats], optional): Stats of the UUIDs issued, the sleeps, the counter rollovers and the lock wait. Defaults to None.
         """
-        super().__init__(raise_exception_on_backward, clock, pseudo_random_generator, last_uuid)
+        super().__init__(
+            raise_exception_on_backward, clock, pseudo_random_generator, last_uuid, stats=stats
+        )
 
         self.precision: Precision = precision
 
@@ -105,11 +111,17 @@ class UUID7Generator(ClockBasedUUIDGenerator):
             pseudo_random_generator=self._pseudo_random_generator,
             initial_timestamp=last_timestamp,
             initial_counter=last_counter,
+            stats=stats,
         )
         self._pseudo_random_binary_generator = PseudoRandomBinaryGenerator(
             self.random_bits, self._pseudo_random_generator
         )
 
+    @nodoc
+    def reseed(self) -> None:
+        super().reseed()
+        self._counter.reset()
+
     @nodoc
     def timestamp(self, clock: UUIDClock) -> int:
         if self.precision == "milli":
@@ -314,9 +326,8 @@ class UUID7Generator(ClockBasedUUIDGenerator):
         return time, parsed["seq"]
 
 
-_uuid7_generator_milli = UUID7Generator("milli")
-_uuid7_generator_micro = UUID7Generator("micro")
-_uuid7_generator_nano = UUID7Generator("nano")
+_precision_to_uuid7_generator: Dict[Precision, UUID7Generator] = {}
+_precision_to_uuid7_generator_lock = threading.Lock()
 
 
 def uuid7(precision: Precision = "micro") -> UUID:
@@ -328,9 +339,14 @@ def uuid7(precision: Precision = "micro") -> UUID:
     Returns:
         UUID: UUIDv7.
     """
-    if precision == "milli":
-        return _uuid7_generator_milli.generate()
-    elif precision == "micro":
-        return _uuid7_generator_micro.generate()
-    else:
-        return _uuid7_generator_nano.generate()
+    # The generator is created on first use. The lock keeps one generator per precision.
+    uuid7_generator = _precision_to_uuid7_generator.get(precision)
+    if uuid7_generator is None:
+        with _precision_to_uuid7_generator_lock:
+            uuid7_generator = _precision_to_uuid7_generator.get(precision)
+            if uuid7_generator is None:
+                uuid7_generator = _precision_to_uuid7_generator[precision] = UUID7Generator(
+                    precision
+                )
+
+    return uuid7_generator.generate()
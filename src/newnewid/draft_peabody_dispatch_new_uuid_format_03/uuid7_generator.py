@@ -1,14 +1,26 @@
 import math
+import threading
 from dataclasses import dataclass
-from datetime import datetime, timedelta
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
 from newnewid.clock.uuid_clock import UUIDClock
 from newnewid.counter.counter import Counter
+from newnewid.counter.shared_counter import SharedCounter
+from newnewid.counter.shared_counter_state import SharedCounterState
+from newnewid.exception.backward_uuid_exception import BackwardUUIDException
+from newnewid.parser.uuid_record import UUID7Record
 from newnewid.random.pseudo_random_binary_generator import PseudoRandomBinaryGenerator
 from newnewid.random.pseudo_random_generator import PseudoRandomGenerator
+from newnewid.random.sharded_pseudo_random_binary_generator import (
+    ShardedPseudoRandomBinaryGenerator,
+)
+from newnewid.shard.shard_option import ShardOption
+from newnewid.shard.thread_shard import get_thread_shard_option
+from newnewid.state.high_water_mark_store import HighWaterMarkStore
+from newnewid.stats.generator_stats import GeneratorStats
 from newnewid.util.nodoc import nodoc
+from newnewid.util.uuid7_ndarray import import_numpy, layout_uuid7_ndarray
 from newnewid.uuidgenerator.clock_based_uuid_generator import ClockBasedUUIDGenerator
 
 
@@ -293,6 +305,11 @@ class UUID7Generator(ClockBasedUUIDGenerator):
         clock: Optional[UUIDClock] = None,
         pseudo_random_generator: Optional[PseudoRandomGenerator] = None,
         last_uuid: Optional[UUID] = None,
+        max_borrow_seconds: float = 0.0,
+        shard_option: Optional[ShardOption] = None,
+        state_store: Optional[HighWaterMarkStore] = None,
+        shared_counter_state: Optional[SharedCounterState] = None,
+        stats: Optional[GeneratorStats] = None,
     ) -> None:
         """Create UUIDv7 generator.
 
@@ -302,12 +319,20 @@ class UUID7Generator(ClockBasedUUIDGenerator):
             clock (Optional[UUIDClock], optional): Clock. Defaults to None.
             pseudo_random_generator (Optional[PseudoRandomGenerator], optional): Pseudo random generator. Defaults to None.
             last_uuid (Optional[UUID], optional): Last UUID. Defaults to None.
+            max_borrow_seconds (float, optional): Maximum seconds `unix_ts_ms` can run ahead of the clock when the counter overflows. Borrowing carries the overflow into the timestamp instead of sleeping. Defaults to 0.0 (sleep).
+            shard_option (Optional[ShardOption], optional): Shard ID folded into the left most random bits. Defaults to None.
+            state_store (Optional[HighWaterMarkStore], optional): Store of the high-water-mark timestamp. The UUIDs after a restart are always after the ones issued before. Defaults to None.
+            shared_counter_state (Optional[SharedCounterState], optional): Timestamp and counter shared between processes. The UUIDs of all processes using the same state are strictly increasing. The counter overflow is carried into the timestamp. `uuid7_option` must have a counter. Defaults to None.
+            stats (Optional[GeneratorStats], optional): Stats of the UUIDs issued, the sleeps, the counter rollovers and the lock wait. Defaults to None.
         """
         super().__init__(
             raise_exception_on_backward=raise_exception_on_backward,
             clock=clock,
             pseudo_random_generator=pseudo_random_generator,
             last_uuid=last_uuid,
+            max_borrow_seconds=max_borrow_seconds,
+            state_store=state_store,
+            stats=stats,
         )
 
         last_timestamp: Optional[int] = None
@@ -320,29 +345,56 @@ class UUID7Generator(ClockBasedUUIDGenerator):
                 uuid7_option,
             )
 
-        self._counter = Counter(
-            counter_bits_length=uuid7_option.counter_bits_length,
-            max_increment_bits_length=uuid7_option.max_increment_bits_length,
-            pseudo_random_generator=self._pseudo_random_generator,
-            initial_timestamp=last_timestamp,
-            initial_counter=last_counter,
-        )
+        if shared_counter_state:
+            assert uuid7_option.counter_option, "uuid7_option must have a counter to share it"
+            self._counter: Counter = SharedCounter(
+                counter_bits_length=uuid7_option.counter_bits_length,
+                max_increment_bits_length=uuid7_option.max_increment_bits_length,
+                pseudo_random_generator=self._pseudo_random_generator,
+                initial_timestamp=last_timestamp,
+                initial_counter=last_counter,
+                shared_counter_state=shared_counter_state,
+                stats=stats,
+            )
+        else:
+            self._counter = Counter(
+                counter_bits_length=uuid7_option.counter_bits_length,
+                max_increment_bits_length=uuid7_option.max_increment_bits_length,
+                pseudo_random_generator=self._pseudo_random_generator,
+                initial_timestamp=last_timestamp,
+                initial_counter=last_counter,
+                stats=stats,
+            )
 
+        self._uuid7_option = uuid7_option
         self.time_fraction_bits_length = uuid7_option.time_fraction_bits_length
         self.time_fraction_max = (
             (1 << self.time_fraction_bits_length) if self.time_fraction_bits_length > 0 else 0
         )
 
         self.rand_bits_length = uuid7_option.random_bits_length
+        self._shard_option = shard_option
 
-        self._pseudo_random_binary_generator = PseudoRandomBinaryGenerator(
-            self.rand_bits_length, self._pseudo_random_generator
-        )
+        if shard_option:
+            self._pseudo_random_binary_generator = ShardedPseudoRandomBinaryGenerator(
+                self.rand_bits_length, self._pseudo_random_generator, shard_option
+            )
+        else:
+            self._pseudo_random_binary_generator = PseudoRandomBinaryGenerator(
+                self.rand_bits_length, self._pseudo_random_generator
+            )
         self.rerandomize_until_monotonic = (
             uuid7_option.rerandomize_until_monotonic
             if uuid7_option.rerandomize_until_monotonic
             else False
         )
+        # The random bits are rerandomized until monotonic only while the tick is the same.
+        self._last_tick: Optional[int] = None
+
+    @nodoc
+    def reseed(self) -> None:
+        super().reseed()
+        self._counter.reset()
 
     @nodoc
     def timestamp(self, clock: UUIDClock) -> int:
@@ -362,9 +414,74 @@ class UUID7Generator(ClockBasedUUIDGenerator):
         else:
             return 0.000_000_001
 
+    @nodoc
+    def next_timestamp(self, timestamp: int) -> int:
+        if self.time_fraction_bits_length == 0:
+            return (timestamp // 1_000_000 + 1) * 1_000_000
+        else:
+            return timestamp + -(-1_000_000 // self.time_fraction_max)
+
+    @property
+    @nodoc
+    def timestamp_per_second(self) -> int:
+        return 1_000_000_000
+
+    @nodoc
+    def observed_timestamp(self, uuid: UUID) -> int:
+        if uuid.version == 6:
+            # 60 bits of 100 nanoseconds since the Gregorian epoch
+            uuid_int = uuid.int
+            gregorian_100_nano_seconds = (
+                (uuid_int >> 96) << 28
+                | ((uuid_int >> 80) & 0xFFFF) << 12
+                | (uuid_int >> 64) & 0x0FFF
+            )
+            return (gregorian_100_nano_seconds - UUIDClock.GREGORIAN_OFFSET) * 100
+
+        assert uuid.version == 7, f"uuid must be version 6 or 7, not {uuid.version}"
+        tick, _ = self.__class__._parse_last_uuid(uuid, self._uuid7_option)
+        if self.time_fraction_bits_length == 0:
+            return tick * 1_000_000
+        time_fraction = tick & (self.time_fraction_max - 1)
+        return (tick >> self.time_fraction_bits_length) * 1_000_000 + (
+            time_fraction * 1_000_000 // self.time_fraction_max
+        )
+
+    def _observe_counter(self, uuid: UUID) -> bool:
+        if uuid.version != 7:
+            return False
+
+        tick, counter = self.__class__._parse_last_uuid(uuid, self._uuid7_option)
+        self._counter.observe(tick, counter)
+        return True
+
     @nodoc
     def generate_impl(self, timestamp: int) -> UUID:
-        unix_ts_ms, fraction_nano = divmod(timestamp, 1_000_000)
+        return UUID(int=self.generate_impl_many(timestamp, 1)[0])
+
+    @nodoc
+    def generate_impl_many(self, timestamp: int, n: int) -> List[int]:
+        if self.time_fraction_bits_length == 0:
+            unix_ts_ms = timestamp // 1_000_000
+            time_fraction = 0
+        else:
+            unix_ts_ms, fraction_nano = divmod(timestamp, 1_000_000)
+
+            # 0 bits - 74 bits
+            time_fraction = math.ceil(self.time_fraction_max * fraction_nano / 1_000_000) & (
+                self.time_fraction_max - 1
+            )
+        # 0 bits or 12 bits - 48 bits
+        # The counter is incremented while the timestamp written in UUID is the same.
+        seqs = self._counter.get_next_many(
+            (unix_ts_ms << self.time_fraction_bits_length) | time_fraction, n
+        )
+        if isinstance(self._counter, SharedCounter):
+            # The shared counter may move the timestamp forward.
+            tick = self._counter.last_timestamp
+            assert tick is not None
+            unix_ts_ms = tick >> self.time_fraction_bits_length
+            time_fraction = tick & ((1 << self.time_fraction_bits_length) - 1)
 
         # 48 bits
         unix_ts_ms &= 0xFFFF_FFFF_FFFF
@@ -372,35 +489,87 @@ class UUID7Generator(ClockBasedUUIDGenerator):
         # 4 bits
         ver = 7
 
-        # 0 bits - 74 bits
-        time_fraction = math.ceil(self.time_fraction_max * fraction_nano / 1_000_000) & (
-            self.time_fraction_max - 1
-        )
-        # 0 bits or 12 bits - 48 bits
-        seq = self._counter.get_next(timestamp)
-        # 0 bits - 74 bits
-        node = self._pseudo_random_binary_generator.generate(
-            monotonic=self.rerandomize_until_monotonic
-        )
+        # 2 bits
+        var = 0b10
 
-        # 74 bits
-        randomize_section = (
-            (time_fraction << (self.rand_bits_length + self._counter.counter_bits_length))
-            | (seq << self.rand_bits_length)
-            | node
+        fixed_section = (unix_ts_ms << 80) | (ver << 76) | (var << 62)
+        time_fraction_section = time_fraction << (
+            self.rand_bits_length + self._counter.counter_bits_length
         )
 
-        # 12 bits = 74 - 62
-        rand_a = (randomize_section >> 62) & 0x0FFF
+        tick = (unix_ts_ms << self.time_fraction_bits_length) | time_fraction
+        monotonic = self.rerandomize_until_monotonic and tick == self._last_tick
+        self._last_tick = tick
 
-        # 62 bits
-        rand_b = randomize_section & 0x3FFF_FFFF_FFFF_FFFF
+        uuid_ints = []
+        for seq in seqs:
+            # 0 bits - 74 bits
+            node = self._pseudo_random_binary_generator.generate(monotonic=monotonic)
+            monotonic = self.rerandomize_until_monotonic
 
-        # 2 bits
-        var = 0b10
+            # 74 bits
+            randomize_section = time_fraction_section | (seq << self.rand_bits_length) | node
+
+            # 12 bits = 74 - 62
+            rand_a = (randomize_section >> 62) & 0x0FFF
+
+            # 62 bits
+            rand_b = randomize_section & 0x3FFF_FFFF_FFFF_FFFF
+
+            uuid_ints.append(fixed_section | (rand_a << 64) | rand_b)
 
-        uuid_int = (unix_ts_ms << 80) | (ver << 76) | (rand_a << 64) | (var << 62) | rand_b
-        return UUID(int=uuid_int)
+        return uuid_ints
+
+    def generate_ndarray(self, timestamps: Any = None, n: Optional[int] = None) -> Any:
+        """Generate UUIDs into a NumPy array in a vectorized way.
+
+        NumPy is required (`pip install newnewid[numpy]`). The UUIDs are laid out for the given
+        timestamps, or for `n` copies of the current time of the clock. The counter is reset when
+        the timestamp changes between adjacent elements and incremented by 1 otherwise.
+        The counter is not carried into the timestamp, so use a counter long enough for the number
+        of UUIDs in the same millisecond. The state of `generate` is not used or updated.
+
+        Method 2 is not supported because its counter is longer than 64 bits.
+
+        Args:
+            timestamps (Any, optional): 1-D array of epoch nanoseconds. Defaults to None.
+            n (Optional[int], optional): Number of UUIDs for the current time when `timestamps` is None. Defaults to None.
+
+        Raises:
+            BackwardUUIDException: The counter overflows while the timestamp is the same.
+
+        Returns:
+            Any: `(n, 16)` uint8 array whose rows are `UUID.bytes`.
+        """
+        assert (timestamps is None) != (
+            n is None
+        ), "either timestamps or n must be specified, not both or neither"
+        assert self._counter.counter_bits_length == 0 or (
+            self._counter.counter_bits_length <= 62 and self._counter.max_increment_bits_length == 1
+        ), "counter must be up to 62 bits and incremented by 1"
+        assert (
+            self.time_fraction_bits_length <= 16
+        ), f"time_fraction_bits_length must be up to 16, not {self.time_fraction_bits_length}"
+
+        if timestamps is None:
+            numpy = import_numpy()
+            timestamps = numpy.full(n, self.timestamp(self._clock), dtype=numpy.int64)
+
+        uuid_bytes_array, overflow_index = layout_uuid7_ndarray(
+            timestamps,
+            time_fraction_bits_length=self.time_fraction_bits_length,
+            counter_bits_length=self._counter.counter_bits_length,
+            random_bits_length=self.rand_bits_length,
+            rerandomize_until_monotonic=self.rerandomize_until_monotonic,
+            shard_option=self._shard_option,
+        )
+        if overflow_index is not None:
+            raise BackwardUUIDException(
+                UUID(bytes=uuid_bytes_array[overflow_index - 1].tobytes()),
+                UUID(bytes=uuid_bytes_array[overflow_index].tobytes()),
+            )
+
+        return uuid_bytes_array
 
     @classmethod
     def parse(cls, uuid: UUID, uuid7_option: UUID7Option, **kwargs: Any) -> Dict[str, Any]:
@@ -413,47 +582,52 @@ class UUID7Generator(ClockBasedUUIDGenerator):
         Returns:
             Dict[str, Any]: Parsed UUIDv7.
         """
+        return cls.parse_record(uuid, uuid7_option).to_dict()
+
+    @classmethod
+    def parse_record(cls, uuid: UUID, uuid7_option: UUID7Option, **kwargs: Any) -> UUID7Record:
+        """Parse UUIDv7 into a record.
+
+        The datetime is computed on first access of `time` or `datetime`.
+
+        Args:
+            uuid (UUID): UUID.
+            uuid7_option (UUID7Option): UUIDv7 option.
+
+        Returns:
+            UUID7Record: Parsed UUIDv7.
+        """
+        uuid_int = uuid.int
+
         # 48 bits
-        unix_ts_ms = (uuid.int >> 80) & 0xFFFF_FFFF_FFFF
+        unix_ts_ms = (uuid_int >> 80) & 0xFFFF_FFFF_FFFF
 
         # 4 bits
-        ver = (uuid.int >> 76) & 0x0F
+        ver = (uuid_int >> 76) & 0x0F
         assert ver == 7, f"version must be 7, not {ver}"
 
         # 12 bits
-        rand_a = (uuid.int >> 64) & 0x0FFF
+        rand_a = (uuid_int >> 64) & 0x0FFF
 
         # 2 bits
-        variant = (uuid.int >> 62) & 0x03
+        variant = (uuid_int >> 62) & 0x03
 
         # 62 bits
-        rand_b = uuid.int & 0x3FFF_FFFF_FFFF_FFFF
+        rand_b = uuid_int & 0x3FFF_FFFF_FFFF_FFFF
 
         # 0 - 74 bits
         time_fraction, seq, rand = cls._parse_from_random_section(rand_a, rand_b, uuid7_option)
 
-        unix_ts, milliseconds = divmod(unix_ts_ms, 1000)
-        time = datetime.fromtimestamp(unix_ts).replace(microsecond=milliseconds * 1000)
-
         if time_fraction is not None:
             micro_fraction, nano_fraction = divmod(
                 (time_fraction * 1_000_000) // (1 << uuid7_option.time_fraction_bits_length), 1000
             )
-            time = time + timedelta(microseconds=micro_fraction)
         else:
-            nano_fraction = None
-
-        return {
-            "unix_ts_ms": unix_ts_ms,
-            "ver": "7",
-            "rand_a": rand_a,
-            "var": variant,
-            "rand_b": rand_b,
-            "time": time.isoformat(),
-            "nano_fraction": nano_fraction,
-            "seq": seq,
-            "rand": rand,
-        }
+            micro_fraction, nano_fraction = None, None
+
+        return UUID7Record(
+            unix_ts_ms, rand_a, variant, rand_b, micro_fraction, nano_fraction, seq, rand
+        )
 
     @classmethod
     def _parse_from_random_section(
@@ -490,52 +664,93 @@ class UUID7Generator(ClockBasedUUIDGenerator):
         last_uuid: UUID,
         uuid7_option: UUID7Option,
     ) -> Tuple[int, Optional[int]]:
-        parsed = cls.parse(last_uuid, uuid7_option)
-        unix_ts_ms: int = parsed["unix_ts_ms"]
+        parsed = cls.parse_record(last_uuid, uuid7_option)
+        unix_ts_ms: int = parsed.unix_ts_ms
         time_fraction, counter, _ = cls._parse_from_random_section(
-            rand_a=parsed["rand_a"],
-            rand_b=parsed["rand_b"],
+            rand_a=parsed.rand_a,
+            rand_b=parsed.rand_b,
             uuid7_option=uuid7_option,
         )
 
-        if time_fraction is not None and uuid7_option.time_fraction_bits_length is not None:
-            timestamp = unix_ts_ms * 1_000_000 + time_fraction // (
-                1 << uuid7_option.time_fraction_bits_length
-            )
+        if time_fraction is not None:
+            timestamp = (unix_ts_ms << uuid7_option.time_fraction_bits_length) | time_fraction
         else:
             timestamp = unix_ts_ms
 
         return (timestamp, counter)
 
 
-_option_to_uuid7_generator: Dict[UUID7Option, UUID7Generator] = {}
+_option_to_uuid7_generator: Dict[Tuple[str, UUID7Option], UUID7Generator] = {}
+_option_to_uuid7_generator_lock = threading.Lock()
+
+
+def _get_uuid7_generator(function_name: str, uuid7_option: UUID7Option) -> UUID7Generator:
+    # The generator is created on first use. The lock keeps one generator per function and option,
+    # so the functions do not share the counter even if their options are the same.
+    key = (function_name, uuid7_option)
+    uuid7_generator = _option_to_uuid7_generator.get(key)
+    if uuid7_generator is None:
+        with _option_to_uuid7_generator_lock:
+            uuid7_generator = _option_to_uuid7_generator.get(key)
+            if uuid7_generator is None:
+                uuid7_generator = _option_to_uuid7_generator[key] = UUID7Generator(
+                    uuid7_option=uuid7_option,
+                )
+
+    return uuid7_generator
+
+
+_thread_local = threading.local()
+
+
+def _get_thread_local_uuid7_generator(
+    uuid7_option: UUID7Option,
+    shard_bits_length: int,
+) -> UUID7Generator:
+    option_to_generator: Optional[Dict[Tuple[UUID7Option, int], UUID7Generator]] = getattr(
+        _thread_local, "option_to_uuid7_generator", None
+    )
+    if option_to_generator is None:
+        option_to_generator = _thread_local.option_to_uuid7_generator = {}
+
+    key = (uuid7_option, shard_bits_length)
+    if key not in option_to_generator:
+        option_to_generator[key] = UUID7Generator(
+            uuid7_option=uuid7_option,
+            shard_option=get_thread_shard_option(shard_bits_length),
+        )
+
+    return option_to_generator[key]
 
 
 def uuid7(
     uuid7_option: Optional[UUID7Option] = None,
+    sharded: bool = False,
+    shard_bits_length: int = 0,
 ) -> UUID:
     """Generate UUIDv7.
 
+    By default, all threads share one generator per option and the UUIDs are monotonic across threads.
+    If `sharded` is True, each thread has its own generator and no lock is contended.
+    The UUIDs are monotonic per thread only.
+
     Args:
         uuid7_option (Optional[UUID7Option], optional): UUIDv7 option. Defaults to None.
+        sharded (bool, optional): Use a generator per thread if True. Defaults to False.
+        shard_bits_length (int, optional): Number of left most random bits replaced with the shard ID of the thread in sharded mode. Defaults to 0.
 
     Returns:
         UUID: UUIDv7.
     """
     uuid7_option = uuid7_option or METHOD_1_FIXED_LENGTH_DEDICATED_COUNTER_BITS_12
-    if uuid7_option not in _option_to_uuid7_generator:
-        _option_to_uuid7_generator[uuid7_option] = UUID7Generator(
-            uuid7_option=uuid7_option,
-        )
-    uuid7_generator = _option_to_uuid7_generator[uuid7_option]
+    if sharded:
+        return _get_thread_local_uuid7_generator(uuid7_option, shard_bits_length).generate()
 
-    return uuid7_generator.generate()
+    return _get_uuid7_generator("uuid7", uuid7_option).generate()
 
 
 # ==================== BONUS TRACK ====================
 
-_ulid_compatible_generator = UUID7Generator(_ULID_COMPATIBLE_OPTION)
-
 
 def ulid_compatible() -> UUID:
     """Generate ULID compatible UUIDv7.
@@ -543,4 +758,4 @@ def ulid_compatible() -> UUID:
     Returns:
         UUID: UUIDv7.
     """
-    return _ulid_compatible_generator.generate()
+    return _get_uuid7_generator("ulid_compatible", _ULID_COMPATIBLE_OPTION).generate()
@@ -1,6 +1,7 @@
 from typing import Any, Dict
 from uuid import UUID
 
+from newnewid.parser.uuid_record import UUID8Record
 from newnewid.util.nodoc import nodoc
 
 
@@ -55,19 +56,18 @@ class UUID8Generator:
     @classmethod
     @nodoc
     def parse(cls, uuid: UUID, **kwargs: Any) -> Dict[str, Any]:
+        return cls.parse_record(uuid).to_dict()
+
+    @classmethod
+    @nodoc
+    def parse_record(cls, uuid: UUID, **kwargs: Any) -> UUID8Record:
         custom_a = (uuid.int >> 80) & 0xFFFF_FFFF_FFFF
         version = (uuid.int >> 76) & 0xF
         custom_b = (uuid.int >> 64) & 0x0FFF
         variant = (uuid.int >> 62) & 0x03
         custom_c = uuid.int & 0x3FFF_FFFF_FFFF_FFFF
 
-        return {
-            "ver": str(version),
-            "custom_a": custom_a,
-            "custom_b": custom_b,
-            "variant": variant,
-            "custom_c": custom_c,
-        }
+        return UUID8Record(str(version), custom_a, custom_b, variant, custom_c)
 
 
 _uuid8_generator = UUID8Generator()
@@ -0,0 +1,163 @@
+from bisect import bisect_left
+from datetime import datetime, timezone
+from typing import Any, Sequence, Union, cast
+from uuid import UUID
+
+from newnewid.util.uuid7_ndarray import import_numpy
+
+# ver and var of UUIDv7
+_UUID7_FIXED_BITS = (7 << 76) | (0b10 << 62)
+# rand_a and rand_b
+_UUID7_RANDOM_BITS = (0x0FFF << 64) | 0x3FFF_FFFF_FFFF_FFFF
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+Timestamp = Union[int, datetime]
+
+
+def min_uuid7_for(timestamp: Timestamp) -> UUID:
+    """Get the smallest UUIDv7 for a timestamp.
+
+    All the bits of `rand_a` and `rand_b` are 0, so it is less than or equal to any UUIDv7 of
+    the millisecond regardless of `UUID7Option`.
+
+    Args:
+        timestamp (Timestamp): Epoch milliseconds or datetime. The datetime is truncated to milliseconds.
+
+    Returns:
+        UUID: Smallest UUIDv7.
+    """
+    return UUID(int=(_to_unix_ts_ms(timestamp) << 80) | _UUID7_FIXED_BITS)
+
+
+def max_uuid7_for(timestamp: Timestamp) -> UUID:
+    """Get the largest UUIDv7 for a timestamp.
+
+    All the bits of `rand_a` and `rand_b` are 1, so it is greater than or equal to any UUIDv7 of
+    the millisecond regardless of `UUID7Option`. For example, the UUIDv7s from `t1` to `t2`
+    inclusive are `BETWEEN min_uuid7_for(t1) AND max_uuid7_for(t2)` in a database.
+
+    Args:
+        timestamp (Timestamp): Epoch milliseconds or datetime. The datetime is truncated to milliseconds.
+
+    Returns:
+        UUID: Largest UUIDv7.
+    """
+    return UUID(int=(_to_unix_ts_ms(timestamp) << 80) | _UUID7_FIXED_BITS | _UUID7_RANDOM_BITS)
+
+
+class UUID7TimeIndex:
+    """Time index of sorted UUIDv7s.
+
+    The queries bisect the sorted UUIDs by the smallest UUIDv7 of the timestamps, so the UUIDs are
+    not parsed. The ranges are half-open like `range`: `start <= unix_ts_ms < stop`.
+    """
+
+    def __init__(self, uuids: Union[Sequence[UUID], Sequence[int], Any]) -> None:
+        """Create time index.
+
+        Args:
+            uuids (Union[Sequence[UUID], Sequence[int], Any]): UUIDv7s sorted in ascending order. UUIDs, integers of UUIDs, or a `(n, 16)` uint8 NumPy array whose rows are `UUID.bytes` such as the result of `UUID7Generator.generate_ndarray`.
+        """
+        self.uuids = uuids
+        if hasattr(uuids, "dtype"):
+            numpy = import_numpy()
+            array = cast(Any, uuids)
+            assert (
+                array.ndim == 2 and array.shape[1] == 16
+            ), f"uuids must be a (n, 16) array, not {array.shape}"
+            # The upper 64 bits of the rows, whose order is the same as the one of the UUIDs.
+            upper_bytes = numpy.ascontiguousarray(array[:, :8], dtype=numpy.uint8)
+            self._keys: Any = upper_bytes.view(">u8").ravel().astype(numpy.uint64)
+            self._numpy: Any = numpy
+        else:
+            self._keys = [uuid.int if isinstance(uuid, UUID) else uuid for uuid in uuids]
+            self._numpy = None
+
+    def __len__(self) -> int:
+        """Get the number of UUIDs."""
+        return len(self._keys)
+
+    def index(self, timestamp: Timestamp) -> int:
+        """Get the index of the first UUID at or after a timestamp.
+
+        Args:
+            timestamp (Timestamp): Epoch milliseconds or datetime.
+
+        Returns:
+            int: Index. `len(self)` if all the UUIDs are before the timestamp.
+        """
+        min_uuid_int = min_uuid7_for(timestamp).int
+        if self._numpy is not None:
+            key = self._numpy.uint64(min_uuid_int >> 64)
+            return int(self._numpy.searchsorted(self._keys, key, side="left"))
+
+        return bisect_left(self._keys, min_uuid_int)
+
+    def range(self, start: Timestamp, stop: Timestamp) -> slice:
+        """Get the slice of the UUIDs whose timestamps are in `[start, stop)`.
+
+        Args:
+            start (Timestamp): Start timestamp, inclusive.
+            stop (Timestamp): Stop timestamp, exclusive.
+
+        Returns:
+            slice: Slice of `uuids`.
+        """
+        start_index = self.index(start)
+        return slice(start_index, max(self.index(stop), start_index))
+
+    def between(self, start: Timestamp, stop: Timestamp) -> Any:
+        """Get the UUIDs whose timestamps are in `[start, stop)`.
+
+        Args:
+            start (Timestamp): Start timestamp, inclusive.
+            stop (Timestamp): Stop timestamp, exclusive.
+
+        Returns:
+            Any: Slice of `uuids`, the same type as `uuids`.
+        """
+        return self.uuids[self.range(start, stop)]
+
+    def count(self, start: Timestamp, stop: Timestamp) -> int:
+        """Count the UUIDs whose timestamps are in `[start, stop)`.
+
+        Args:
+            start (Timestamp): Start timestamp, inclusive.
+            stop (Timestamp): Stop timestamp, exclusive.
+
+        Returns:
+            int: Number of UUIDs.
+        """
+        range_ = self.range(start, stop)
+        return range_.stop - range_.start
+
+    def percentile(self, q: float) -> int:
+        """Get the timestamp by which `q` percent of the UUIDs were issued.
+
+        The nearest-rank method is used.
+
+        Args:
+            q (float): Percentile from 0 to 100.
+
+        Returns:
+            int: Epoch milliseconds.
+        """
+        assert 0 <= q <= 100, f"q must be between 0 and 100, not {q}"
+        assert len(self._keys) > 0, "no UUIDs"
+        index = min(max(-(-len(self._keys) * q // 100) - 1, 0), len(self._keys) - 1)
+        if self._numpy is not None:
+            return int(self._keys[int(index)]) >> 16
+        return self._keys[int(index)] >> 80
+
+
+def _to_unix_ts_ms(timestamp: Timestamp) -> int:
+    if isinstance(timestamp, datetime):
+        # A naive datetime is the local time, the same as `datetime.timestamp`.
+        delta = (timestamp if timestamp.tzinfo else timestamp.astimezone()) - _EPOCH
+        timestamp = (delta.days * 86_400 + delta.seconds) * 1_000 + delta.microseconds // 1_000
+
+    assert (
+        0 <= timestamp <= 0xFFFF_FFFF_FFFF
+    ), f"timestamp must be between 0 and 2^48 - 1 milliseconds, not {timestamp}"
+    return timestamp
@@ -0,0 +1,277 @@
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from newnewid.draft_peabody_dispatch_new_uuid_format_03.uuid7_generator import (
+    UUID7Option,
+)
+from newnewid.util.specloader import load_modules
+from newnewid.util.uuid7_ndarray import import_numpy
+
+_MASK_128 = (1 << 128) - 1
+
+# (name, shift, bits length) in UUID of each version
+_FIELDS: Dict[str, Tuple[Tuple[str, int, int], ...]] = {
+    "1": (
+        ("time_low", 96, 32),
+        ("time_mid", 80, 16),
+        ("time_high", 64, 12),
+        ("var", 62, 2),
+        ("clock_seq", 48, 14),
+        ("node", 0, 48),
+    ),
+    "3": (("md5_high", 80, 48), ("md5_mid", 64, 12), ("var", 62, 2), ("md5_low", 0, 62)),
+    "4": (("random_a", 80, 48), ("random_b", 64, 12), ("var", 62, 2), ("random_c", 0, 62)),
+    "5": (("sha1_high", 80, 48), ("sha1_mid", 64, 12), ("var", 62, 2), ("sha1_low", 0, 62)),
+    "6": (
+        ("time_high", 96, 32),
+        ("time_mid", 80, 16),
+        ("time_low", 64, 12),
+        ("variant", 62, 2),
+        ("clock_seq", 48, 14),
+        ("node", 0, 48),
+    ),
+    "7": (("unix_ts_ms", 80, 48), ("rand_a", 64, 12), ("var", 62, 2), ("rand_b", 0, 62)),
+    "8": (("custom_a", 80, 48), ("custom_b", 64, 12), ("variant", 62, 2), ("custom_c", 0, 62)),
+    "nil": (),
+    "max": (),
+}
+
+
+class _IntListColumns:
+    """Columns of Python int lists."""
+
+    def __init__(self, uuid_ints: List[int]) -> None:
+        self.uuid_ints = uuid_ints
+
+    def bits(self, shift: int, bits_length: int) -> List[int]:
+        mask = (1 << bits_length) - 1
+        return [(uuid_int >> shift) & mask for uuid_int in self.uuid_ints]
+
+    def field(self, column: List[int], shift: int, bits_length: int) -> List[int]:
+        mask = (1 << bits_length) - 1
+        return [(value >> shift) & mask for value in column]
+
+    def join(
+        self, high: List[int], high_bits_length: int, low: List[int], low_bits_length: int
+    ) -> List[int]:
+        return [(h << low_bits_length) | lo for h, lo in zip(high, low)]
+
+    def apply(self, func: Callable[..., int], bits_length: int, *columns: List[int]) -> List[int]:
+        return [func(*values) for values in zip(*columns)]
+
+
+class _NdarrayColumns:
+    """Columns of NumPy arrays. Columns longer than 64 bits are object arrays of Python int."""
+
+    def __init__(self, numpy: Any, high: Any, low: Any) -> None:
+        self.numpy = numpy
+        self.high = high
+        self.low = low
+
+    def bits(self, shift: int, bits_length: int) -> Any:
+        u = self.numpy.uint64
+        if shift >= 64:
+            return (self.high >> u(shift - 64)) & u((1 << bits_length) - 1)
+        elif shift + bits_length <= 64:
+            return (self.low >> u(shift)) & u((1 << bits_length) - 1)
+        return self.join(
+            self.bits(64, shift + bits_length - 64),
+            shift + bits_length - 64,
+            self.bits(shift, 64 - shift),
+            64 - shift,
+        )
+
+    def field(self, column: Any, shift: int, bits_length: int) -> Any:
+        u = self.numpy.uint64
+        return (column >> u(shift)) & u((1 << bits_length) - 1)
+
+    def join(self, high: Any, high_bits_length: int, low: Any, low_bits_length: int) -> Any:
+        if high_bits_length + low_bits_length <= 64:
+            return (high << self.numpy.uint64(low_bits_length)) | low
+        return (high.astype(object) << low_bits_length) | low.astype(object)
+
+    def apply(self, func: Callable[..., Any], bits_length: int, *columns: Any) -> Any:
+        if bits_length <= 64:
+            return func(*columns)
+        return func(*(column.astype(object) for column in columns))
+
+
+def parse_many(
+    uuids: Any,
+    spec: str = "latest",
+    uuid7_option: Optional[UUID7Option] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """Parse UUIDs in bulk into columns grouped by version.
+
+    The version is read once for all the UUIDs, and each field of a version group is decoded
+    in one pass over the group. A NumPy `(n, 16)` uint8 array is decoded without Python loops.
+
+    The columns are the same as the keys of `parse` except `ver`, which is the key of the group,
+    and `time`, which can be computed from the integer columns. `index` is the positions in `uuids`.
+
+    Args:
+        uuids (Any): Iterable of `UUID`, UUID strings or 16-byte records, a bytes-like object of contiguous 16-byte records, or a NumPy `(n, 16)` uint8 array.
+        spec (str, optional): UUID spec. Draft-peabody-dispatch-new-uuid-format-03 or later is supported. Defaults to "latest".
+        uuid7_option (Optional[UUID7Option], optional): UUIDv7 option. Required if UUIDv7 is included. Defaults to None.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Columns by version ("1" to "8", "nil" and "max"). The columns are NumPy arrays for a NumPy input and lists otherwise.
+    """
+    module = load_modules(spec)
+    assert hasattr(
+        module.UUID7Generator, "parse_record"  # type: ignore
+    ), f"spec must be draft-peabody-dispatch-new-uuid-format-03 or later, not {spec}"
+
+    if hasattr(uuids, "dtype") and hasattr(uuids, "shape"):
+        groups = _group_ndarray(uuids)
+    else:
+        groups = _group_ints(_to_ints(uuids))
+
+    result: Dict[str, Dict[str, Any]] = {}
+    for version, (indices, columns) in groups.items():
+        if version not in _FIELDS:
+            raise ValueError(f"Unsupported version: {version}")
+
+        parsed: Dict[str, Any] = {"index": indices}
+        for name, shift, bits_length in _FIELDS[version]:
+            parsed[name] = columns.bits(shift, bits_length)
+        _add_derived_columns(version, parsed, columns, uuid7_option)
+        result[version] = parsed
+
+    return result
+
+
+def _to_ints(uuids: Iterable[Any]) -> List[int]:
+    if isinstance(uuids, (bytes, bytearray, memoryview)):
+        data = bytes(uuids)
+        assert len(data) % 16 == 0, f"length must be a multiple of 16, not {len(data)}"
+        return [
+            int.from_bytes(data[i : i + 16], "big") for i in range(0, len(data), 16)  # noqa: E203
+        ]
+
+    uuid_ints = []
+    for uuid in uuids:
+        if isinstance(uuid, UUID):
+            uuid_ints.append(uuid.int)
+        elif isinstance(uuid, str):
+            uuid_ints.append(UUID(uuid).int)
+        else:
+            assert len(uuid) == 16, f"UUID bytes must be 16 bytes, not {len(uuid)}"
+            uuid_ints.append(int.from_bytes(uuid, "big"))
+    return uuid_ints
+
+
+def _group_ints(uuid_ints: List[int]) -> Dict[str, Tuple[List[int], _IntListColumns]]:
+    indices_by_version: Dict[str, List[int]] = {}
+    for i, uuid_int in enumerate(uuid_ints):
+        if uuid_int == 0:
+            version = "nil"
+        elif uuid_int == _MASK_128:
+            version = "max"
+        else:
+            version = str((uuid_int >> 76) & 0xF)
+        indices_by_version.setdefault(version, []).append(i)
+
+    return {
+        version: (indices, _IntListColumns([uuid_ints[i] for i in indices]))
+        for version, indices in indices_by_version.items()
+    }
+
+
+def _group_ndarray(uuids: Any) -> Dict[str, Tuple[Any, _NdarrayColumns]]:
+    numpy = import_numpy()
+    assert uuids.ndim == 2 and uuids.shape[1] == 16, f"shape must be (n, 16), not {uuids.shape}"
+
+    records = numpy.ascontiguousarray(uuids, dtype=numpy.uint8).view(">u8").astype(numpy.uint64)
+    high, low = records[:, 0], records[:, 1]
+    max_word = numpy.uint64(0xFFFF_FFFF_FFFF_FFFF)
+
+    versions = ((high >> numpy.uint64(76 - 64)) & numpy.uint64(0xF)).astype(numpy.int64)
+    versions[(high == 0) & (low == 0)] = -1
+    versions[(high == max_word) & (low == max_word)] = -2
+
+    groups: Dict[str, Tuple[Any, _NdarrayColumns]] = {}
+    for version_number in numpy.unique(versions).tolist():
+        version = {-1: "nil", -2: "max"}.get(version_number, str(version_number))
+        indices = numpy.flatnonzero(versions == version_number)
+        groups[version] = (indices, _NdarrayColumns(numpy, high[indices], low[indices]))
+    return groups
+
+
+def _add_derived_columns(
+    version: str,
+    parsed: Dict[str, Any],
+    columns: Any,
+    uuid7_option: Optional[UUID7Option],
+) -> None:
+    if version in ("1", "6"):
+        if version == "1":
+            time_high_mid = columns.join(parsed["time_high"], 12, parsed["time_mid"], 16)
+            gregorian_100_nano_seconds = columns.join(time_high_mid, 28, parsed["time_low"], 32)
+        else:
+            time_high_mid = columns.join(parsed["time_high"], 32, parsed["time_mid"], 16)
+            gregorian_100_nano_seconds = columns.join(time_high_mid, 48, parsed["time_low"], 12)
+        parsed["gregorian_100_nano_seconds"] = gregorian_100_nano_seconds
+        # The Gregorian offset is a multiple of 10.
+        parsed["epoch_nano_fraction"] = columns.apply(
+            lambda value: (value % 10) * 100, 64, gregorian_100_nano_seconds
+        )
+    elif version == "3":
+        md5_high_mid = columns.join(parsed["md5_high"], 48, parsed["md5_mid"], 16)
+        parsed["md5"] = columns.join(md5_high_mid, 64, parsed["md5_low"], 48)
+    elif version == "5":
+        sha1_high_mid = columns.join(parsed["sha1_high"], 48, parsed["sha1_mid"], 16)
+        parsed["sha1"] = columns.join(sha1_high_mid, 64, parsed["sha1_low"], 48)
+    elif version == "7":
+        assert uuid7_option is not None, "uuid7_option must be specified to parse UUIDv7"
+        _add_uuid7_columns(parsed, columns, uuid7_option)
+
+
+def _add_uuid7_columns(parsed: Dict[str, Any], columns: Any, uuid7_option: UUID7Option) -> None:
+    # The same as `UUID7Generator._parse_from_random_section`.
+    time_fraction_bits_length = uuid7_option.time_fraction_bits_length
+    counter_bits_length = uuid7_option.counter_bits_length
+    random_bits_length = uuid7_option.random_bits_length
+
+    if time_fraction_bits_length > 0:
+        time_fraction = _random_section_field(
+            parsed,
+            columns,
+            counter_bits_length + random_bits_length,
+            time_fraction_bits_length,
+        )
+        parsed["nano_fraction"] = columns.apply(
+            lambda value: ((value * 1_000_000) >> time_fraction_bits_length) % 1000,
+            time_fraction_bits_length + 20,
+            time_fraction,
+        )
+    else:
+        parsed["nano_fraction"] = None
+
+    if counter_bits_length > 0:
+        parsed["seq"] = _random_section_field(
+            parsed, columns, random_bits_length, counter_bits_length
+        )
+    else:
+        parsed["seq"] = None
+
+    if counter_bits_length > 0 and random_bits_length == 0:
+        parsed["rand"] = None
+    else:
+        parsed["rand"] = _random_section_field(parsed, columns, 0, random_bits_length)
+
+
+def _random_section_field(
+    parsed: Dict[str, Any], columns: Any, offset: int, bits_length: int
+) -> Any:
+    # The random section is 74 bits of rand_a (12 bits) and rand_b (62 bits).
+    if offset >= 62:
+        return columns.field(parsed["rand_a"], offset - 62, bits_length)
+
+    low_bits_length = min(bits_length, 62 - offset)
+    low = columns.field(parsed["rand_b"], offset, low_bits_length)
+    if low_bits_length == bits_length:
+        return low
+
+    high = columns.field(parsed["rand_a"], 0, bits_length - low_bits_length)
+    return columns.join(high, bits_length - low_bits_length, low, low_bits_length)
@@ -1,7 +1,13 @@
-from typing import Any, Dict
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from uuid import UUID
 
-from newnewid.clock.uuid_clock import UUIDClock
+from newnewid.parser.uuid_record import (
+    UUID1Record,
+    UUID3Record,
+    UUID4Record,
+    UUID5Record,
+    UUIDRecord,
+)
 from newnewid.util.specloader import load_modules
 from newnewid.uuidgenerator.uuid_generator import UUIDGenerator
 
@@ -10,6 +16,11 @@ class _OtherUUIDParser:
     @classmethod
     def parse_uuid1(cls, uuid: UUID, **kwargs: Any) -> Dict[str, Any]:
         """Parse UUIDv1."""
+        return cls.parse_uuid1_record(uuid).to_dict()
+
+    @classmethod
+    def parse_uuid1_record(cls, uuid: UUID, **kwargs: Any) -> UUID1Record:
+        """Parse UUIDv1 into a record."""
         #     0                   1                   2                   3
         #     0 1 2 3 4 5 6 7 8 9 0 1 2 3 4 5 6 7 8 9 0 1 2 3 4 5 6 7 8 9 0 1
         #    +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+
@@ -37,27 +48,16 @@ class _OtherUUIDParser:
         # 48 bits
         node = uuid.int & 0xFFFF_FFFF_FFFF
 
-        gregorian_100_nano_seconds = (time_high << 48) | (time_mid << 32) | time_low
-        time, epoch_nano_fraction = UUIDClock.to_datetime_from_gregorian_100_nano_seconds(
-            gregorian_100_nano_seconds
-        )
-
-        return {
-            "time_low": time_low,
-            "time_mid": time_mid,
-            "ver": str(ver),
-            "time_high": time_high,
-            "var": var,
-            "clock_seq": clock_seq,
-            "node": node,
-            "gregorian_100_nano_seconds": gregorian_100_nano_seconds,
-            "time": time.isoformat(),
-            "epoch_nano_fraction": epoch_nano_fraction,
-        }
+        return UUID1Record(time_low, time_mid, str(ver), time_high, var, clock_seq, node)
 
     @classmethod
     def parse_uuid3(cls, uuid: UUID, **kwargs: Any) -> Dict[str, Any]:
         """Parse UUIDv3."""
+        return cls.parse_uuid3_record(uuid).to_dict()
+
+    @classmethod
+    def parse_uuid3_record(cls, uuid: UUID, **kwargs: Any) -> UUID3Record:
+        """Parse UUIDv3 into a record."""
         #     0                   1                   2                   3
         #     0 1 2 3 4 5 6 7 8 9 0 1 2 3 4 5 6 7 8 9 0 1 2 3 4 5 6 7 8 9 0 1
         #    +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+
@@ -80,20 +80,16 @@ class _OtherUUIDParser:
         # 62 bits
         md5_low = uuid.int & 0x3FFF_FFFF_FFFF_FFFF
 
-        md5 = (md5_high << 64) | (md5_mid << 48) | md5_low
-
-        return {
-            "md5_high": md5_high,
-            "ver": str(ver),
-            "md5_mid": md5_mid,
-            "var": var,
-            "md5_low": md5_low,
-            "md5": md5,
-        }
+        return UUID3Record(md5_high, str(ver), md5_mid, var, md5_low)
 
     @classmethod
     def parse_uuid4(cls, uuid: UUID, **kwargs: Any) -> Dict[str, Any]:
         """Parse UUIDv4."""
+        return cls.parse_uuid4_record(uuid).to_dict()
+
+    @classmethod
+    def parse_uuid4_record(cls, uuid: UUID, **kwargs: Any) -> UUID4Record:
+        """Parse UUIDv4 into a record."""
         #     0                   1                   2                   3
         #     0 1 2 3 4 5 6 7 8 9 0 1 2 3 4 5 6 7 8 9 0 1 2 3 4 5 6 7 8 9 0 1
         #    +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+
@@ -116,17 +112,16 @@ class _OtherUUIDParser:
         # 62 bits
         random_c = uuid.int & 0x3FFF_FFFF_FFFF_FFFF
 
-        return {
-            "random_a": random_a,
-            "ver": str(ver),
-            "random_b": random_b,
-            "var": var,
-            "random_c": random_c,
-        }
+        return UUID4Record(random_a, str(ver), random_b, var, random_c)
 
     @classmethod
     def parse_uuid5(cls, uuid: UUID, **kwargs: Any) -> Dict[str, Any]:
         """Parse UUIDv5."""
+        return cls.parse_uuid5_record(uuid).to_dict()
+
+    @classmethod
+    def parse_uuid5_record(cls, uuid: UUID, **kwargs: Any) -> UUID5Record:
+        """Parse UUIDv5 into a record."""
         #     0                   1                   2                   3
         #     0 1 2 3 4 5 6 7 8 9 0 1 2 3 4 5 6 7 8 9 0 1 2 3 4 5 6 7 8 9 0 1
         #    +-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+-+
@@ -149,54 +144,84 @@ class _OtherUUIDParser:
         # 62 bits
         sha1_low = uuid.int & 0x3FFF_FFFF_FFFF_FFFF
 
-        sha1 = (sha1_high << 64) | (sha1_mid << 48) | sha1_low
+        return UUID5Record(sha1_high, str(ver), sha1_mid, var, sha1_low)
 
-        return {
-            "sha1_high": sha1_high,
-            "ver": str(ver),
-            "sha1_mid": sha1_mid,
-            "var": var,
-            "sha1_low": sha1_low,
-            "sha1": sha1,
-        }
 
+ParseFunction = Callable[..., Union[Dict[str, Any], UUIDRecord]]
 
-def parse(uuid: UUID, spec: str = "latest", **kwargs) -> Dict[str, Any]:
-    """Parse UUID.
+_MAX_UUID_INT = 0xFFFF_FFFF_FFFF_FFFF_FFFF_FFFF_FFFF_FFFF
+
+_spec_to_parser: Dict[Tuple[str, bool], ParseFunction] = {}
+
+
+def get_parser(spec: str = "latest", as_record: bool = False) -> ParseFunction:
+    """Get the parse function of the spec.
+
+    The dispatch table from the version to the parse function is built once per spec and cached,
+    so the returned function only looks up the version of each UUID. Use it in hot loops.
 
     Args:
-        uuid (UUID): UUID.
         spec (str, optional): UUID spec. Defaults to "latest".
+        as_record (bool, optional): Return a `UUIDRecord` instead of a dictionary. Supported from draft-peabody-dispatch-new-uuid-format-03. Defaults to False.
 
     Returns:
-        Dict[str, Any]: Parsed UUID.
+        ParseFunction: Function with the same arguments as `parse` except `spec` and `as_record`.
     """
-    uuid_int = uuid.int
-    version = UUIDGenerator.get_version(uuid)
+    key = (spec, as_record)
+    parser = _spec_to_parser.get(key)
+    if parser is None:
+        parser = _spec_to_parser[key] = _build_parser(spec, as_record)
+    return parser
+
 
+def _build_parser(spec: str, as_record: bool) -> ParseFunction:
     module = load_modules(spec)
-    try:
+    # Every parse function has a `_record` sibling from draft-peabody-dispatch-new-uuid-format-03.
+    suffix = "_record" if as_record else ""
+
+    def get_parse_func(owner: Any, name: str) -> Optional[ParseFunction]:
+        return getattr(owner, f"{name}{suffix}", None) if owner is not None else None
+
+    parse_nil = get_parse_func(getattr(module, "NilUUIDGenerator", None), "parse")
+    parse_max = get_parse_func(getattr(module, "MaxUUIDGenerator", None), "parse")
+
+    # Index is the version.
+    parse_funcs: List[Optional[ParseFunction]] = [None] * 16
+    parse_funcs[1] = get_parse_func(_OtherUUIDParser, "parse_uuid1")
+    parse_funcs[3] = get_parse_func(_OtherUUIDParser, "parse_uuid3")
+    parse_funcs[4] = get_parse_func(_OtherUUIDParser, "parse_uuid4")
+    parse_funcs[5] = get_parse_func(_OtherUUIDParser, "parse_uuid5")
+    parse_funcs[6] = get_parse_func(getattr(module, "UUID6Generator", None), "parse")
+    parse_funcs[7] = get_parse_func(getattr(module, "UUID7Generator", None), "parse")
+    parse_funcs[8] = get_parse_func(getattr(module, "UUID8Generator", None), "parse")
+
+    def parse_uuid(uuid: UUID, **kwargs: Any) -> Union[Dict[str, Any], UUIDRecord]:
+        uuid_int = uuid.int
         if uuid_int == 0:
-            parse_func = module.NilUUIDGenerator.parse  # type: ignore # noqa: F821
-        elif uuid_int == 0xFFFF_FFFF_FFFF_FFFF_FFFF_FFFF_FFFF_FFFF:
-            parse_func = module.MaxUUIDGenerator.parse  # type: ignore # noqa: F821
-        elif version == "1":
-            parse_func = _OtherUUIDParser.parse_uuid1
-        elif version == "3":
-            parse_func = _OtherUUIDParser.parse_uuid3
-        elif version == "4":
-            parse_func = _OtherUUIDParser.parse_uuid4
-        elif version == "5":
-            parse_func = _OtherUUIDParser.parse_uuid5
-        elif version == "6":
-            parse_func = module.UUID6Generator.parse  # type: ignore # noqa: F821
-        elif version == "7":
-            parse_func = module.UUID7Generator.parse  # type: ignore # noqa: F821
-        elif version == "8":
-            parse_func = module.UUID8Generator.parse  # type: ignore # noqa: F821
+            parse_func = parse_nil
+        elif uuid_int == _MAX_UUID_INT:
+            parse_func = parse_max
         else:
-            raise ValueError(f"Unsupported version: {version}")
-    except UnboundLocalError:
-        raise ValueError(f"Unsupported version: {version}")
+            parse_func = parse_funcs[(uuid_int >> 76) & 0xF]
+
+        if parse_func is None:
+            raise ValueError(f"Unsupported version: {UUIDGenerator.get_version(uuid)} in {spec}")
+        return parse_func(uuid, **kwargs)
+
+    return parse_uuid
+
+
+def parse(
+    uuid: UUID, spec: str = "latest", as_record: bool = False, **kwargs
+) -> Union[Dict[str, Any], UUIDRecord]:
+    """Parse UUID.
 
-    return parse_func(uuid, **kwargs)  # type: ignore # noqa: F821
+    Args:
+        uuid (UUID): UUID.
+        spec (str, optional): UUID spec. Defaults to "latest".
+        as_record (bool, optional): Return a `UUIDRecord` instead of a dictionary. The datetime is computed on first access, so it is much cheaper for bulk decoding. Supported from draft-peabody-dispatch-new-uuid-format-03. Defaults to False.
+
+    Returns:
+        Union[Dict[str, Any], UUIDRecord]: Parsed UUID.
+    """
+    return get_parser(spec, as_record)(uuid, **kwargs)
@@ -0,0 +1,400 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+
+from newnewid.clock.uuid_clock import UUIDClock
+
+
+class UUIDRecord:
+    """Parsed UUID.
+
+    A record has the same fields as the dictionary returned by `parse` as attributes.
+    The datetime of a time-based UUID is computed on first access, so a record is much cheaper
+    than the dictionary when only the integer fields are used.
+    """
+
+    __slots__ = ("ver",)
+
+    # Keys of `to_dict` in order.
+    FIELDS: Tuple[str, ...] = ("ver",)
+
+    def __init__(self, ver: str) -> None:
+        """Create UUID record.
+
+        Args:
+            ver (str): Version.
+        """
+        self.ver = ver
+
+    def __getitem__(self, key: str) -> Any:
+        """Get the field by the key of the dictionary.
+
+        Args:
+            key (str): Field name.
+
+        Returns:
+            Any: Field value.
+        """
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare fields.
+
+        Args:
+            other (object): Other record.
+
+        Returns:
+            bool: True if the type and all the fields are the same.
+        """
+        if type(self) is not type(other):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()  # type: ignore
+
+    def __repr__(self) -> str:
+        """Get representation.
+
+        Returns:
+            str: Representation.
+        """
+        fields = ", ".join(f"{key}={value!r}" for key, value in self.to_dict().items())
+        return f"{self.__class__.__name__}({fields})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the dictionary returned by `parse`.
+
+        Returns:
+            Dict[str, Any]: Parsed UUID.
+        """
+        return {key: getattr(self, key) for key in self.FIELDS}
+
+
+class _GregorianTimeRecord(UUIDRecord):
+    __slots__ = ("gregorian_100_nano_seconds", "epoch_nano_fraction", "_datetime")
+
+    def __init__(self, ver: str, gregorian_100_nano_seconds: int) -> None:
+        super().__init__(ver)
+        self.gregorian_100_nano_seconds = gregorian_100_nano_seconds
+        # The same as `UUIDClock.to_datetime_from_gregorian_100_nano_seconds`.
+        self.epoch_nano_fraction = (
+            (gregorian_100_nano_seconds - UUIDClock.GREGORIAN_OFFSET) * 100
+        ) % 1000
+        self._datetime: Optional[datetime] = None
+
+    @property
+    def datetime(self) -> datetime:
+        """Get the time as datetime. It is computed on first access.
+
+        Returns:
+            datetime: Time in the local timezone.
+        """
+        if self._datetime is None:
+            self._datetime = UUIDClock.to_datetime_from_gregorian_100_nano_seconds(
+                self.gregorian_100_nano_seconds
+            )[0]
+        return self._datetime
+
+    @property
+    def time(self) -> str:
+        """Get the time in ISO 8601 format.
+
+        Returns:
+            str: Time.
+        """
+        return self.datetime.isoformat()
+
+
+class UUID1Record(_GregorianTimeRecord):
+    """Parsed UUIDv1."""
+
+    __slots__ = ("time_low", "time_mid", "time_high", "var", "clock_seq", "node")
+
+    FIELDS = (
+        "time_low",
+        "time_mid",
+        "ver",
+        "time_high",
+        "var",
+        "clock_seq",
+        "node",
+        "gregorian_100_nano_seconds",
+        "time",
+        "epoch_nano_fraction",
+    )
+
+    def __init__(
+        self,
+        time_low: int,
+        time_mid: int,
+        ver: str,
+        time_high: int,
+        var: int,
+        clock_seq: int,
+        node: int,
+    ) -> None:
+        """Create UUIDv1 record.
+
+        Args:
+            time_low (int): time_low.
+            time_mid (int): time_mid.
+            ver (str): Version.
+            time_high (int): time_high.
+            var (int): Variant.
+            clock_seq (int): clock_seq.
+            node (int): node.
+        """
+        super().__init__(ver, (time_high << 48) | (time_mid << 32) | time_low)
+        self.time_low = time_low
+        self.time_mid = time_mid
+        self.time_high = time_high
+        self.var = var
+        self.clock_seq = clock_seq
+        self.node = node
+
+
+class UUID6Record(_GregorianTimeRecord):
+    """Parsed UUIDv6."""
+
+    __slots__ = ("time_high", "time_mid", "time_low", "variant", "clock_seq", "node")
+
+    FIELDS = (
+        "time_high",
+        "time_mid",
+        "ver",
+        "time_low",
+        "variant",
+        "clock_seq",
+        "node",
+        "gregorian_100_nano_seconds",
+        "time",
+        "epoch_nano_fraction",
+    )
+
+    def __init__(
+        self,
+        time_high: int,
+        time_mid: int,
+        ver: str,
+        time_low: int,
+        variant: int,
+        clock_seq: int,
+        node: int,
+    ) -> None:
+        """Create UUIDv6 record.
+
+        Args:
+            time_high (int): time_high.
+            time_mid (int): time_mid.
+            ver (str): Version.
+            time_low (int): time_low.
+            variant (int): Variant.
+            clock_seq (int): clock_seq.
+            node (int): node.
+        """
+        super().__init__(ver, (time_high << 28) | (time_mid << 12) | time_low)
+        self.time_high = time_high
+        self.time_mid = time_mid
+        self.time_low = time_low
+        self.variant = variant
+        self.clock_seq = clock_seq
+        self.node = node
+
+
+class UUID3Record(UUIDRecord):
+    """Parsed UUIDv3."""
+
+    __slots__ = ("md5_high", "md5_mid", "var", "md5_low")
+
+    FIELDS = ("md5_high", "ver", "md5_mid", "var", "md5_low", "md5")
+
+    def __init__(self, md5_high: int, ver: str, md5_mid: int, var: int, md5_low: int) -> None:
+        """Create UUIDv3 record.
+
+        Args:
+            md5_high (int): md5_high.
+            ver (str): Version.
+            md5_mid (int): md5_mid.
+            var (int): Variant.
+            md5_low (int): md5_low.
+        """
+        super().__init__(ver)
+        self.md5_high = md5_high
+        self.md5_mid = md5_mid
+        self.var = var
+        self.md5_low = md5_low
+
+    @property
+    def md5(self) -> int:
+        """Get the 122 bits of MD5.
+
+        Returns:
+            int: MD5 bits.
+        """
+        return (self.md5_high << 64) | (self.md5_mid << 48) | self.md5_low
+
+
+class UUID4Record(UUIDRecord):
+    """Parsed UUIDv4."""
+
+    __slots__ = ("random_a", "random_b", "var", "random_c")
+
+    FIELDS = ("random_a", "ver", "random_b", "var", "random_c")
+
+    def __init__(self, random_a: int, ver: str, random_b: int, var: int, random_c: int) -> None:
+        """Create UUIDv4 record.
+
+        Args:
+            random_a (int): random_a.
+            ver (str): Version.
+            random_b (int): random_b.
+            var (int): Variant.
+            random_c (int): random_c.
+        """
+        super().__init__(ver)
+        self.random_a = random_a
+        self.random_b = random_b
+        self.var = var
+        self.random_c = random_c
+
+
+class UUID5Record(UUIDRecord):
+    """Parsed UUIDv5."""
+
+    __slots__ = ("sha1_high", "sha1_mid", "var", "sha1_low")
+
+    FIELDS = ("sha1_high", "ver", "sha1_mid", "var", "sha1_low", "sha1")
+
+    def __init__(self, sha1_high: int, ver: str, sha1_mid: int, var: int, sha1_low: int) -> None:
+        """Create UUIDv5 record.
+
+        Args:
+            sha1_high (int): sha1_high.
+            ver (str): Version.
+            sha1_mid (int): sha1_mid.
+            var (int): Variant.
+            sha1_low (int): sha1_low.
+        """
+        super().__init__(ver)
+        self.sha1_high = sha1_high
+        self.sha1_mid = sha1_mid
+        self.var = var
+        self.sha1_low = sha1_low
+
+    @property
+    def sha1(self) -> int:
+        """Get the 122 bits of SHA-1.
+
+        Returns:
+            int: SHA-1 bits.
+        """
+        return (self.sha1_high << 64) | (self.sha1_mid << 48) | self.sha1_low
+
+
+class UUID7Record(UUIDRecord):
+    """Parsed UUIDv7."""
+
+    __slots__ = (
+        "unix_ts_ms",
+        "rand_a",
+        "var",
+        "rand_b",
+        "nano_fraction",
+        "seq",
+        "rand",
+        "_micro_fraction",
+        "_datetime",
+    )
+
+    FIELDS = (
+        "unix_ts_ms",
+        "ver",
+        "rand_a",
+        "var",
+        "rand_b",
+        "time",
+        "nano_fraction",
+        "seq",
+        "rand",
+    )
+
+    def __init__(
+        self,
+        unix_ts_ms: int,
+        rand_a: int,
+        var: int,
+        rand_b: int,
+        micro_fraction: Optional[int],
+        nano_fraction: Optional[int],
+        seq: Optional[int],
+        rand: Optional[int],
+    ) -> None:
+        """Create UUIDv7 record.
+
+        Args:
+            unix_ts_ms (int): unix_ts_ms.
+            rand_a (int): rand_a.
+            var (int): Variant.
+            rand_b (int): rand_b.
+            micro_fraction (Optional[int]): Microseconds in the millisecond by the time fraction. None if the time fraction is not used.
+            nano_fraction (Optional[int]): Nanoseconds in the microsecond by the time fraction. None if the time fraction is not used.
+            seq (Optional[int]): Counter. None if the counter is not used.
+            rand (Optional[int]): Random bits.
+        """
+        super().__init__("7")
+        self.unix_ts_ms = unix_ts_ms
+        self.rand_a = rand_a
+        self.var = var
+        self.rand_b = rand_b
+        self.nano_fraction = nano_fraction
+        self.seq = seq
+        self.rand = rand
+        self._micro_fraction = micro_fraction
+        self._datetime: Optional[datetime] = None
+
+    @property
+    def datetime(self) -> datetime:
+        """Get the time as datetime. It is computed on first access.
+
+        Returns:
+            datetime: Time in the local timezone.
+        """
+        if self._datetime is None:
+            unix_ts, milliseconds = divmod(self.unix_ts_ms, 1000)
+            time = datetime.fromtimestamp(unix_ts).replace(microsecond=milliseconds * 1000)
+            if self._micro_fraction is not None:
+                time = time + timedelta(microseconds=self._micro_fraction)
+            self._datetime = time
+        return self._datetime
+
+    @property
+    def time(self) -> str:
+        """Get the time in ISO 8601 format.
+
+        Returns:
+            str: Time.
+        """
+        return self.datetime.isoformat()
+
+
+class UUID8Record(UUIDRecord):
+    """Parsed UUIDv8."""
+
+    __slots__ = ("custom_a", "custom_b", "variant", "custom_c")
+
+    FIELDS = ("ver", "custom_a", "custom_b", "variant", "custom_c")
+
+    def __init__(self, ver: str, custom_a: int, custom_b: int, variant: int, custom_c: int) -> None:
+        """Create UUIDv8 record.
+
+        Args:
+            ver (str): Version.
+            custom_a (int): custom_a.
+            custom_b (int): custom_b.
+            variant (int): Variant.
+            custom_c (int): custom_c.
+        """
+        super().__init__(ver)
+        self.custom_a = custom_a
+        self.custom_b = custom_b
+        self.variant = variant
+        self.custom_c = custom_c
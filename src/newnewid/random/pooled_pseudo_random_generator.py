@@ -0,0 +1,83 @@
+import os
+import weakref
+from array import array
+from typing import List
+
+from newnewid.random.pseudo_random_generator import PseudoRandomGenerator
+
+_pooled_pseudo_random_generators: "weakref.WeakSet[PooledPseudoRandomGenerator]" = weakref.WeakSet()
+
+
+class PooledPseudoRandomGenerator(PseudoRandomGenerator):
+    """Pseudo random generator with a buffered entropy pool.
+
+    A large block is pulled from `os.urandom` at once and split into 64-bit words,
+    and bit-fields are carved out of the words. So the CSPRNG is not called for every field
+    of every UUID. The pool is refilled on demand when it runs out.
+
+    This class is thread-safe without a lock because a word is taken by an atomic `list.pop`.
+    Each word is used only once, even when two threads refill the pool at the same time.
+    """
+
+    def __init__(self, pool_bytes_length: int = 4096) -> None:
+        """Create pooled pseudo random generator.
+
+        Args:
+            pool_bytes_length (int, optional): Number of bytes pulled from `os.urandom` at once. It must be a multiple of 8. Defaults to 4096.
+        """
+        assert (
+            pool_bytes_length > 0 and pool_bytes_length % 8 == 0
+        ), f"pool_bytes_length must be a positive multiple of 8, not {pool_bytes_length}"
+        self.pool_bytes_length = pool_bytes_length
+        self._words: List[int] = []
+        _pooled_pseudo_random_generators.add(self)
+
+    def generate(self, bits: int, use: str) -> int:
+        """Generate pseudo random bits.
+
+        The bits are carved out of the entropy pool filled by `os.urandom`.
+
+        Args:
+            bits (int): Number of bits to generate.
+            use (str): Use of the generated bits. This is used for mocking in test classes.
+
+        Returns:
+            int: Pseudo random bits.
+        """
+        if bits <= 0:
+            return 0
+
+        if bits <= 64:
+            return self._pop_word() >> (64 - bits)
+        elif bits <= 128:
+            return ((self._pop_word() << 64) | self._pop_word()) >> (128 - bits)
+
+        words_length = (bits + 63) >> 6
+        value = 0
+        for _ in range(words_length):
+            value = (value << 64) | self._pop_word()
+        return value >> ((words_length << 6) - bits)
+
+    def reseed(self) -> None:
+        """Discard the entropy pool.
+
+        The pool is refilled from `os.urandom` on the next generation.
+        """
+        self._words = []
+
+    def _pop_word(self) -> int:
+        try:
+            return self._words.pop()
+        except IndexError:
+            words = array("Q", os.urandom(self.pool_bytes_length)).tolist()
+            self._words = words
+            return words.pop()
+
+
+def _reseed_after_fork() -> None:
+    for pooled_pseudo_random_generator in list(_pooled_pseudo_random_generators):
+        pooled_pseudo_random_generator.reseed()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reseed_after_fork)
@@ -40,9 +40,11 @@ class PseudoRandomBinaryGenerator:
             if self._last_binary == self.max_value:
                 return self.max_value
             else:
-                binary = self._last_binary
-                while binary <= self._last_binary:
-                    binary = self._pseudo_random_generator.generate(self.mask_bits, "random-binary")
+                # The same distribution as rerandomizing until the binary is greater than the last
+                # one, without the rerandomization.
+                binary = self._pseudo_random_generator.generate_range(
+                    self._last_binary + 1, self.max_value + 1, "random-binary"
+                )
         else:
             binary = self._pseudo_random_generator.generate(self.mask_bits, "random-binary")
 
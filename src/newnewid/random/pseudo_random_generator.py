@@ -1,4 +1,7 @@
-import secrets
+from random import SystemRandom
+
+# The same as `secrets.randbits`, without importing secrets.
+_system_random = SystemRandom()
 
 
 class PseudoRandomGenerator:
@@ -16,4 +19,29 @@ class PseudoRandomGenerator:
         Returns:
             int: Pseudo random bits.
         """
-        return secrets.randbits(bits)
+        return _system_random.getrandbits(bits)
+
+    def generate_range(self, start: int, stop: int, use: str) -> int:
+        """Generate a pseudo random integer in `[start, stop)` in constant time.
+
+        64 more bits than the range are drawn once and reduced modulo the range, so no value is
+        rejected and drawn again. The bias is less than 2^-64. A drawn value already in the range
+        is returned as it is.
+
+        Args:
+            start (int): Least value.
+            stop (int): Value after the greatest value.
+            use (str): Use of the generated bits. This is used for mocking in test classes.
+
+        Returns:
+            int: Pseudo random integer.
+        """
+        assert start < stop, f"start must be less than stop, not {start} >= {stop}"
+        size = stop - start
+        return start + (self.generate(size.bit_length() + 64, use) - start) % size
+
+    def reseed(self) -> None:
+        """Reseed the generator.
+
+        Nothing to do since CSPRNG is called for every generation.
+        """
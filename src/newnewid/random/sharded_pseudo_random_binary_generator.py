@@ -0,0 +1,37 @@
+from newnewid.random.pseudo_random_binary_generator import PseudoRandomBinaryGenerator
+from newnewid.random.pseudo_random_generator import PseudoRandomGenerator
+from newnewid.shard.shard_option import ShardOption
+
+
+class ShardedPseudoRandomBinaryGenerator(PseudoRandomBinaryGenerator):
+    """Pseudo random binary generator whose left most bits are the shard ID."""
+
+    def __init__(
+        self,
+        mask_bits: int,
+        pseudo_random_generator: PseudoRandomGenerator,
+        shard_option: ShardOption,
+    ) -> None:
+        """Create sharded pseudo random binary generator.
+
+        Args:
+            mask_bits (int): Number of bits of the mask including the shard ID.
+            pseudo_random_generator (PseudoRandomGenerator): Pseudo random generator.
+            shard_option (ShardOption): Shard option.
+        """
+        assert (
+            shard_option.shard_bits_length <= mask_bits
+        ), f"shard_bits_length must be less than or equal to {mask_bits}, not {shard_option.shard_bits_length}"
+        super().__init__(mask_bits - shard_option.shard_bits_length, pseudo_random_generator)
+        self._shard = shard_option.shard_id << self.mask_bits
+
+    def generate(self, monotonic: bool = False) -> int:
+        """Generate binary.
+
+        Args:
+            monotonic (bool): Whether the binary should be monotonic.
+
+        Returns:
+            int: Binary.
+        """
+        return self._shard | super().generate(monotonic)
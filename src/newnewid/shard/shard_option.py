@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+
+from newnewid.util.nodoc import nodoc
+
+
+@dataclass(frozen=True)
+class ShardOption:
+    """Option for shard ID folded into the random bits.
+
+    The left most `shard_bits_length` bits of the random bits are replaced with `shard_id`,
+    so generators of different shards never produce the same UUID.
+    """
+
+    shard_id: int
+    shard_bits_length: int
+
+    @nodoc
+    def __post_init__(self):
+        assert (
+            self.shard_bits_length > 0
+        ), f"shard_bits_length must be greater than 0, not {self.shard_bits_length}"
+        assert (
+            0 <= self.shard_id < (1 << self.shard_bits_length)
+        ), f"shard_id must be 0 <= x < 2^{self.shard_bits_length}, not {self.shard_id}"
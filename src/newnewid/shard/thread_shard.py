@@ -0,0 +1,70 @@
+import collections
+import heapq
+import itertools
+import os
+import threading
+from typing import Deque, List, Optional
+
+from newnewid.shard.shard_option import ShardOption
+
+_thread_local = threading.local()
+
+_shard_ids = itertools.count()
+# Shard IDs released by finished threads. The smallest one is reused first.
+_free_shard_ids: List[int] = []
+# Shard IDs released by finalizers. They are moved to `_free_shard_ids` on the next allocation,
+# because a finalizer may run during garbage collection while this thread holds the lock.
+_released_shard_ids: Deque[int] = collections.deque()
+_shard_ids_lock = threading.Lock()
+
+
+class _ThreadShardID:
+    """Shard ID held by a thread while it is alive."""
+
+    def __init__(self) -> None:
+        """Take the smallest free shard ID."""
+        with _shard_ids_lock:
+            while _released_shard_ids:
+                heapq.heappush(_free_shard_ids, _released_shard_ids.popleft())
+            self.value = heapq.heappop(_free_shard_ids) if _free_shard_ids else next(_shard_ids)
+
+    def __del__(self) -> None:
+        """Release the shard ID when the thread-local storage of the thread is cleared."""
+        # `deque.append` is atomic, so no lock is taken here.
+        _released_shard_ids.append(self.value)
+
+
+def get_thread_shard_option(shard_bits_length: int) -> Optional[ShardOption]:
+    """Get shard option of the current thread.
+
+    Each thread is given the smallest shard ID not held by a live thread on the first call, and
+    releases it when it finishes. So live threads never share a shard ID.
+
+    Args:
+        shard_bits_length (int): Number of bits of the shard ID. It must be enough for the live threads that use it.
+
+    Returns:
+        Optional[ShardOption]: Shard option. None if `shard_bits_length` is 0.
+    """
+    if shard_bits_length == 0:
+        return None
+
+    shard_id: Optional[_ThreadShardID] = getattr(_thread_local, "shard_id", None)
+    if shard_id is None:
+        shard_id = _thread_local.shard_id = _ThreadShardID()
+
+    assert shard_id.value < (1 << shard_bits_length), (
+        f"shard IDs of {shard_bits_length} bits are exhausted by the live threads,"
+        f" so shard ID {shard_id.value} is not available"
+    )
+    return ShardOption(shard_id=shard_id.value, shard_bits_length=shard_bits_length)
+
+
+def _reset_after_fork() -> None:
+    # The lock may have been held by another thread, which does not exist in the child.
+    global _shard_ids_lock
+    _shard_ids_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
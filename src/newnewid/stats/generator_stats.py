@@ -0,0 +1,137 @@
+from dataclasses import dataclass
+from threading import Lock
+from time import perf_counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Metric name, type, unit and help of each field of `GeneratorStatsSnapshot` in OpenMetrics.
+_OPENMETRICS_FAMILIES: List[Tuple[str, str, str, str]] = [
+    ("uuids_issued", "counter", "", "UUIDs issued by the generator."),
+    ("stalls", "counter", "", "Sleeps waiting for the clock to advance."),
+    ("stall_seconds", "counter", "seconds", "Seconds slept waiting for the clock to advance."),
+    ("counter_rollovers", "counter", "", "Counter values that wrapped around the counter bits."),
+    ("lock_wait_seconds", "counter", "seconds", "Seconds waited for the generator lock."),
+]
+
+
+@dataclass(frozen=True)
+class GeneratorStatsSnapshot:
+    """Values of `GeneratorStats` at a point of time."""
+
+    uuids_issued: int
+    stalls: int
+    stall_seconds: float
+    counter_rollovers: int
+    lock_wait_seconds: float
+
+
+class GeneratorStats:
+    """Counters of what a generator did.
+
+    Pass the object as `stats` of a generator to count the UUIDs issued, the sleeps waiting for
+    the clock, the counter rollovers and the time waited for the lock. The counters are updated
+    under the lock of the generator.
+    A generator without stats does not pay for them.
+    """
+
+    def __init__(self, labels: Optional[Dict[str, str]] = None) -> None:
+        """Create generator stats.
+
+        Args:
+            labels (Optional[Dict[str, str]], optional): Labels of the metrics in OpenMetrics, for example `{"generator": "orders"}`. Defaults to None.
+        """
+        self.labels = dict(labels or {})
+        self.uuids_issued = 0
+        self.stalls = 0
+        self.stall_seconds = 0.0
+        self.counter_rollovers = 0
+        self.lock_wait_seconds = 0.0
+
+    def snapshot(self) -> GeneratorStatsSnapshot:
+        """Get the current values.
+
+        Returns:
+            GeneratorStatsSnapshot: Current values.
+        """
+        return GeneratorStatsSnapshot(
+            uuids_issued=self.uuids_issued,
+            stalls=self.stalls,
+            stall_seconds=self.stall_seconds,
+            counter_rollovers=self.counter_rollovers,
+            lock_wait_seconds=self.lock_wait_seconds,
+        )
+
+    def to_openmetrics(self, prefix: str = "newnewid") -> str:
+        """Dump the current values in the OpenMetrics text format.
+
+        Args:
+            prefix (str, optional): Prefix of the metric names. Defaults to "newnewid".
+
+        Returns:
+            str: OpenMetrics text ending with `# EOF`.
+        """
+        return dump_openmetrics([self], prefix)
+
+
+def dump_openmetrics(stats_list: Iterable[GeneratorStats], prefix: str = "newnewid") -> str:
+    """Dump the current values of generators in the OpenMetrics text format.
+
+    The generators are told apart by their labels.
+
+    Args:
+        stats_list (Iterable[GeneratorStats]): Stats of generators.
+        prefix (str, optional): Prefix of the metric names. Defaults to "newnewid".
+
+    Returns:
+        str: OpenMetrics text ending with `# EOF`.
+    """
+    samples = [(_format_labels(stats.labels), stats.snapshot()) for stats in stats_list]
+
+    lines: List[str] = []
+    for field, metric_type, unit, help_ in _OPENMETRICS_FAMILIES:
+        name = f"{prefix}_{field}"
+        lines.append(f"# TYPE {name} {metric_type}")
+        if unit:
+            lines.append(f"# UNIT {name} {unit}")
+        lines.append(f"# HELP {name} {help_}")
+        for labels, snapshot in samples:
+            lines.append(f"{name}_total{labels} {getattr(snapshot, field)}")
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+
+    def escape(value: str) -> str:
+        return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    return "{" + ",".join(f'{key}="{escape(value)}"' for key, value in labels.items()) + "}"
+
+
+class StatsLock:
+    """Lock that adds the time waited for it to `GeneratorStats.lock_wait_seconds`.
+
+    The clock is read only when the lock is not free at once.
+    """
+
+    def __init__(self, stats: GeneratorStats) -> None:
+        """Create lock.
+
+        Args:
+            stats (GeneratorStats): Stats to update.
+        """
+        self._lock = Lock()
+        self._stats = stats
+
+    def __enter__(self) -> bool:
+        """Acquire the lock, measuring the wait if it is held by another thread."""
+        if not self._lock.acquire(blocking=False):
+            start = perf_counter()
+            self._lock.acquire()
+            self._stats.lock_wait_seconds += perf_counter() - start
+        return True
+
+    def __exit__(self, *args) -> None:
+        """Release the lock."""
+        self._lock.release()
@@ -0,0 +1,39 @@
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+# `import newnewid` loads only what is used. Besides the attributes imported on first access below,
+# the standard modules that are slow to import are imported inside the functions that use them.
+# `python -X importtime` on CPython 3.11 after `uuid` and `random` are loaded: asyncio 36 ms,
+# multiprocessing 11 ms and secrets 8 ms. tests/lazy_import_test.py keeps them out of the import.
+
+
+def lazy_module_attributes(
+    module_name: str,
+    name_to_module: Dict[str, str],
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Create module `__getattr__` and `__dir__` that import attributes on first access (PEP 562).
+
+    An imported attribute is set to the module, so `__getattr__` is called once per attribute.
+
+    Args:
+        module_name (str): Name of the module that has the attributes.
+        name_to_module (Dict[str, str]): Attribute name to the name of the module that defines it.
+
+    Returns:
+        Tuple[Callable[[str], Any], Callable[[], List[str]]]: `__getattr__` and `__dir__`.
+    """
+    module = sys.modules[module_name]
+
+    def __getattr__(name: str) -> Any:
+        if name not in name_to_module:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+        value = getattr(importlib.import_module(name_to_module[name]), name)
+        setattr(module, name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(module)) | set(name_to_module))
+
+    return __getattr__, __dir__
@@ -1,5 +1,7 @@
 # noqa: E401
 import importlib
+from types import ModuleType
+from typing import Dict
 
 _SPECS = (
     "draft_peabody_dispatch_new_uuid_format_01",
@@ -12,18 +14,30 @@ _SPECS = (
     "draft_ietf_uuidrev_rfc4122bis_03",
 )
 
+_spec_to_module: Dict[str, ModuleType] = {}
 
-def load_modules(spec: str = "latest"):
+
+def load_modules(spec: str = "latest") -> ModuleType:
     """Load modules for the given spec.
 
+    The module is imported once per spec and cached.
+
     Args:
         spec (str, optional): Specification to load. Defaults to "latest".
+
+    Returns:
+        ModuleType: Module of the spec.
     """
+    module = _spec_to_module.get(spec)
+    if module is not None:
+        return module
+
     if spec in _SPECS:
         module = importlib.import_module(f"newnewid.{spec}")
-    elif "latest":
+    elif spec == "latest":
         module = importlib.import_module(f"newnewid.{_SPECS[-1]}")
     else:
         raise ValueError(f"Unknown spec: {spec}")
 
+    _spec_to_module[spec] = module
     return module
@@ -0,0 +1,129 @@
+import os
+from typing import Any, List, Optional, Tuple
+
+from newnewid.shard.shard_option import ShardOption
+
+# rand_a is 12 bits and rand_b is 62 bits.
+_RAND_B_BITS_LENGTH = 62
+_RAND_B_MASK = (1 << _RAND_B_BITS_LENGTH) - 1
+
+
+def import_numpy() -> Any:
+    """Import NumPy, which is an optional dependency.
+
+    Returns:
+        Any: `numpy` module.
+    """
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError("NumPy is required. Install it by `pip install newnewid[numpy]`.") from e
+
+    return numpy
+
+
+def layout_uuid7_ndarray(
+    timestamps: Any,
+    time_fraction_bits_length: int,
+    counter_bits_length: int,
+    random_bits_length: int,
+    rerandomize_until_monotonic: bool,
+    shard_option: Optional[ShardOption],
+) -> Tuple[Any, Optional[int]]:
+    """Lay out UUIDv7s for the timestamps into a NumPy array.
+
+    The counter is reset to a random value when the timestamp written in UUID changes between
+    adjacent elements and incremented by 1 otherwise.
+
+    Args:
+        timestamps (Any): 1-D array of epoch nanoseconds.
+        time_fraction_bits_length (int): Time fraction length in bits. Up to 16.
+        counter_bits_length (int): Counter length in bits. Up to 62.
+        random_bits_length (int): Random length in bits including the shard ID.
+        rerandomize_until_monotonic (bool): Sort the random bits while the timestamp is the same.
+        shard_option (Optional[ShardOption]): Shard ID folded into the left most random bits.
+
+    Returns:
+        Tuple[Any, Optional[int]]: `(n, 16)` uint8 array whose rows are `UUID.bytes`, and the index of the first row whose counter overflowed or None.
+    """
+    numpy = import_numpy()
+    u = numpy.uint64
+
+    timestamps = numpy.asarray(timestamps, dtype=numpy.int64)
+    assert timestamps.ndim == 1, f"timestamps must be a 1-D array, not {timestamps.ndim}-D"
+    n = len(timestamps)
+
+    unix_ts_ms, fraction_nano = numpy.divmod(timestamps, 1_000_000)
+    unix_ts_ms = unix_ts_ms.astype(u) & u(0xFFFF_FFFF_FFFF)
+
+    # (values, bits length, offset) in the 74 bits of rand_a and rand_b
+    fields: List[Tuple[Any, int, int]] = []
+    offset = 0
+
+    # The same as `UUID7Generator.generate_impl_many`.
+    time_fraction_max = 1 << time_fraction_bits_length
+    time_fraction_ceil = (fraction_nano * time_fraction_max + 999_999) // 1_000_000
+    time_fraction = time_fraction_ceil.astype(u) & u(time_fraction_max - 1)
+    ticks = (unix_ts_ms << u(time_fraction_bits_length)) | time_fraction
+
+    run_starts = numpy.empty(n, dtype=bool)
+    run_starts[:1] = True
+    run_starts[1:] = ticks[1:] != ticks[:-1]
+    run_ids = numpy.cumsum(run_starts) - 1
+    start_indices = numpy.flatnonzero(run_starts)
+
+    # 0 bits - 74 bits
+    shard_bits_length = shard_option.shard_bits_length if shard_option else 0
+    nodes: List[Any] = []
+    while offset < random_bits_length - shard_bits_length:
+        bits_length = min(_RAND_B_BITS_LENGTH, random_bits_length - shard_bits_length - offset)
+        nodes.append(_random_words(numpy, n) >> u(64 - bits_length))
+        fields.append((nodes[-1], bits_length, offset))
+        offset += bits_length
+    if rerandomize_until_monotonic and nodes:
+        order = numpy.lexsort(nodes + [run_ids])
+        for i in range(len(nodes)):
+            nodes[i][:] = nodes[i][order]
+    if shard_option:
+        fields.append((numpy.full(n, shard_option.shard_id, dtype=u), shard_bits_length, offset))
+        offset += shard_bits_length
+    assert offset == random_bits_length
+
+    # 0 bits or 12 bits - 62 bits
+    overflow_index: Optional[int] = None
+    if counter_bits_length > 0:
+        resets = _random_words(numpy, len(start_indices)) >> u(64 - (counter_bits_length - 1))
+        counters = resets[run_ids] + (numpy.arange(n) - start_indices[run_ids]).astype(u)
+        overflows = numpy.flatnonzero(counters > u((1 << counter_bits_length) - 1))
+        if overflows.size > 0:
+            overflow_index = int(overflows[0])
+            counters &= u((1 << counter_bits_length) - 1)
+        fields.append((counters, counter_bits_length, offset))
+        offset += counter_bits_length
+
+    # 0 bits - 16 bits
+    if time_fraction_bits_length > 0:
+        fields.append((time_fraction, time_fraction_bits_length, offset))
+        offset += time_fraction_bits_length
+    assert offset == 74, "all bits length must be 74"
+
+    rand_a = numpy.zeros(n, dtype=u)
+    rand_b = numpy.zeros(n, dtype=u)
+    for values, bits_length, field_offset in fields:
+        if field_offset < _RAND_B_BITS_LENGTH:
+            rand_b |= (values << u(field_offset)) & u(_RAND_B_MASK)
+            if field_offset + bits_length > _RAND_B_BITS_LENGTH:
+                rand_a |= values >> u(_RAND_B_BITS_LENGTH - field_offset)
+        else:
+            rand_a |= values << u(field_offset - _RAND_B_BITS_LENGTH)
+
+    # ver is 7 and var is 0b10.
+    records = numpy.empty((n, 2), dtype=">u8")
+    records[:, 0] = (unix_ts_ms << u(16)) | u(7 << 12) | (rand_a & u(0x0FFF))
+    records[:, 1] = u(0b10 << 62) | rand_b
+
+    return records.view(numpy.uint8).reshape(n, 16), overflow_index
+
+
+def _random_words(numpy: Any, n: int) -> Any:
+    return numpy.frombuffer(os.urandom(n * 8), dtype=numpy.uint64).copy()
@@ -1,21 +1,35 @@
+import os
+import weakref
 from abc import ABCMeta, abstractmethod
 from threading import Lock
-from time import sleep
-from typing import Optional
+from time import perf_counter, sleep
+from typing import Any, List, Optional
 from uuid import UUID
 
 from newnewid.clock.uuid_clock import UUIDClock
 from newnewid.exception.backward_uuid_exception import BackwardUUIDException
 from newnewid.random.pseudo_random_generator import PseudoRandomGenerator
+from newnewid.state.high_water_mark_store import HighWaterMarkStore
+from newnewid.stats.generator_stats import GeneratorStats, StatsLock
 from newnewid.util.nodoc import nodoc
 from newnewid.uuidgenerator.uuid_generator import UUIDGenerator
 
+_clock_based_uuid_generators: "weakref.WeakSet[ClockBasedUUIDGenerator]" = weakref.WeakSet()
+
 
 class ClockBasedUUIDGenerator(
     UUIDGenerator,
     metaclass=ABCMeta,
 ):
-    """UUID generator that uses clock."""
+    """UUID generator that uses clock.
+
+    The generator works as a hybrid logical clock (HLC) after `observe` is called with a UUID
+    received from another node: the UUIDs generated afterwards sort after the received one
+    even if the clock of this node is behind.
+
+    The generator is fork-safe. In the child process after `os.fork`, the lock is recreated and
+    the counter and the pseudo random generator are reseeded by `reseed`.
+    """
 
     def __init__(
         self,
@@ -23,22 +37,54 @@ class ClockBasedUUIDGenerator(
         clock: Optional[UUIDClock],
         pseudo_random_generator: Optional[PseudoRandomGenerator],
         last_uuid: Optional[UUID],
+        max_borrow_seconds: float = 0.0,
+        state_store: Optional[HighWaterMarkStore] = None,
+        stats: Optional[GeneratorStats] = None,
     ) -> None:
         """Create ClockBasedUUIDGenerator.
 
         Args:
-            raise_exception_on_backward (bool): Raise exception when backward UUID is generated if True. Otherwise, sleep until next UUID can be generated.
+            raise_exception_on_backward (bool): Raise exception when backward UUID is generated if True. Otherwise, borrow the timestamp from the future or sleep until next UUID can be generated.
             clock (Optional[UUIDClock]): Clock.
             pseudo_random_generator (Optional[PseudoRandomGenerator]): Pseudo random generator.
             last_uuid (Optional[UUID]): Last generated UUID.
+            max_borrow_seconds (float, optional): Maximum seconds the timestamp can run ahead of the clock when the clock does not advance or the counter overflows. Sleep when 0. Defaults to 0.0.
+            state_store (Optional[HighWaterMarkStore], optional): Store of the high-water-mark timestamp to resume after a restart. Defaults to None.
+            stats (Optional[GeneratorStats], optional): Stats updated by the generator. Defaults to None.
         """
+        assert (
+            max_borrow_seconds >= 0
+        ), f"max_borrow_seconds must be greater than or equal to 0, not {max_borrow_seconds}"
         super().__init__()
         self.raise_exception_on_backward = raise_exception_on_backward
         self._clock = clock or UUIDClock()
         self._pseudo_random_generator = pseudo_random_generator or PseudoRandomGenerator()
         self.last_generated = last_uuid
+        self.max_borrow_seconds = max_borrow_seconds
+        self._last_timestamp: Optional[int] = None
+        self._state_store = state_store
+        self._reserved_timestamp: Optional[int] = None
+        self._resume_timestamp = state_store.load() if state_store else None
         self._mask: Optional[int] = None
-        self._lock = Lock()
+        # Timestamp of the hybrid logical clock. It is held until the clock passes it.
+        self._observed_timestamp: Optional[int] = None
+        self.stats = stats
+        self._lock = self._new_lock()
+        _clock_based_uuid_generators.add(self)
+
+    def reseed(self) -> None:
+        """Recreate the lock and reseed the random state.
+
+        This is called automatically in the child process after `os.fork`, so that the children do not
+        continue the same counter sequence as the parent.
+        The last generated UUID is kept, so the UUIDs of the child are still after the ones of the parent.
+        """
+        self._lock = self._new_lock()
+        self._pseudo_random_generator.reseed()
+
+    def _new_lock(self) -> Any:
+        # The lock measures the wait only when the stats are enabled.
+        return StatsLock(self.stats) if self.stats is not None else Lock()
 
     @abstractmethod
     def timestamp(self, clock: UUIDClock) -> int:
@@ -69,26 +115,303 @@ class ClockBasedUUIDGenerator(
             float: Least seconds.
         """
 
+    def next_timestamp(self, timestamp: int) -> int:
+        """Get the least timestamp that is written in UUID as a later time than the given timestamp.
+
+        This is used to borrow the timestamp from the future. Override this to support `max_borrow_seconds`.
+
+        Args:
+            timestamp (int): Timestamp.
+
+        Returns:
+            int: Next timestamp.
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not support max_borrow_seconds")
+
+    def observed_timestamp(self, uuid: UUID) -> int:
+        """Get the timestamp of a UUID received from another node.
+
+        Override this to support `observe`.
+
+        Args:
+            uuid (UUID): Received UUID.
+
+        Returns:
+            int: Timestamp in the same unit as `timestamp`.
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not support observe")
+
+    @property
+    def timestamp_per_second(self) -> int:
+        """Get number of timestamp units per second.
+
+        Override this to support `max_borrow_seconds`.
+
+        Returns:
+            int: Number of timestamp units per second.
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not support max_borrow_seconds")
+
+    def observe(self, uuid: UUID, max_skew_seconds: Optional[float] = None) -> bool:
+        """Fold a UUID received from another node into the generator like a hybrid logical clock.
+
+        The UUIDs generated afterwards sort after `uuid`. While the clock is behind the timestamp of
+        `uuid`, the timestamp is held and the counter continues after the one of `uuid`.
+        When the counter overflows, the timestamp is advanced logically instead of waiting
+        for the clock. The clock takes over again when it passes the timestamp.
+
+        `uuid` of the other version (UUIDv6 for UUIDv7 and vice versa) is folded by its time only.
+        Requires `next_timestamp` and `observed_timestamp`, and `timestamp_per_second` with
+        `max_skew_seconds`.
+
+        Args:
+            uuid (UUID): Received UUID.
+            max_skew_seconds (Optional[float], optional): Maximum seconds the timestamp of `uuid` can be ahead of the clock. `uuid` further ahead is ignored, so a node with a wrong clock cannot push the timestamps into the future. Unlimited if None. Defaults to None.
+
+        Returns:
+            bool: True if `uuid` is folded, False if it is ignored for the skew.
+        """
+        assert (
+            max_skew_seconds is None or max_skew_seconds >= 0
+        ), f"max_skew_seconds must be greater than or equal to 0, not {max_skew_seconds}"
+        timestamp = self.observed_timestamp(uuid)
+        if max_skew_seconds is not None and timestamp - self.timestamp(self._clock) > int(
+            max_skew_seconds * self.timestamp_per_second
+        ):
+            return False
+
+        with self._lock:
+            if self._observed_timestamp is None or timestamp > self._observed_timestamp:
+                self._observed_timestamp = timestamp
+
+            if (
+                self.last_generated is None or uuid > self.last_generated
+            ) and self._observe_counter(uuid):
+                self.last_generated = uuid
+        return True
+
+    def _observe_counter(self, uuid: UUID) -> bool:
+        # Continue the counter after a received UUID of the same version, and return True if done.
+        return False
+
     @nodoc
     def generate(self) -> UUID:
         with self._lock:
+            timestamp = self._current_timestamp()
             while True:
-                if self._mask is None:
-                    self._mask = (1 << self.clock_bits_length) - 1
-
-                uuid = self.generate_impl(self.timestamp(self._clock) & self._mask)
+                uuid = self.generate_impl(timestamp)
 
                 # backward UUID check
                 if self.last_generated is not None and uuid <= self.last_generated:
-                    if self.raise_exception_on_backward:
-                        raise BackwardUUIDException(self.last_generated, uuid)
-                    else:
-                        sleep(self.least_seconds)
-                        continue
+                    timestamp = self._on_backward(self.last_generated, uuid, timestamp)
+                    continue
 
                 self.last_generated = uuid
+                self._last_timestamp = timestamp
+                if self.stats is not None:
+                    self.stats.uuids_issued += 1
                 return uuid
 
+    def generate_many(self, n: int) -> List[UUID]:
+        """Generate UUIDs in bulk.
+
+        The lock is taken once and the clock is read once per run of counter values,
+        so the UUIDs are strictly monotonic as if `generate` were called `n` times.
+
+        Args:
+            n (int): Number of UUIDs to generate.
+
+        Returns:
+            List[UUID]: UUIDs.
+        """
+        return [UUID(int=uuid_int) for uuid_int in self._generate_int_many(n)]
+
+    def generate_into(self, buffer) -> int:
+        """Generate UUIDs into a writable buffer.
+
+        UUIDs are written as contiguous 16-byte big-endian records, the same as `UUID.bytes`.
+
+        Args:
+            buffer: Writable bytes-like object such as `bytearray`. The length must be a multiple of 16.
+
+        Returns:
+            int: Number of generated UUIDs.
+        """
+        view = memoryview(buffer).cast("B")
+        n, remainder = divmod(len(view), 16)
+        assert remainder == 0, f"buffer length must be a multiple of 16, not {len(view)}"
+
+        view[:] = b"".join(uuid_int.to_bytes(16, "big") for uuid_int in self._generate_int_many(n))
+        return n
+
+    async def agenerate(self) -> UUID:
+        """Generate UUID in asyncio.
+
+        The event loop is never blocked. When the clock does not advance or the counter overflows,
+        the coroutine yields with `asyncio.sleep` instead of `time.sleep`.
+
+        Returns:
+            UUID: UUID.
+        """
+        return (await self.agenerate_many(1))[0]
+
+    async def agenerate_many(self, n: int) -> List[UUID]:
+        """Generate UUIDs in bulk in asyncio.
+
+        The UUIDs are reserved in runs like `generate_many`. When the clock does not advance or
+        the counter overflows, the coroutine yields with `asyncio.sleep` instead of `time.sleep`.
+
+        Args:
+            n (int): Number of UUIDs to generate.
+
+        Returns:
+            List[UUID]: UUIDs.
+        """
+        import asyncio
+
+        uuid_ints = self._generate_int_many(n, wait=False)
+        while len(uuid_ints) < n:
+            start = perf_counter()
+            await asyncio.sleep(self.least_seconds)
+            if self.stats is not None:
+                self.stats.stalls += 1
+                self.stats.stall_seconds += perf_counter() - start
+            uuid_ints += self._generate_int_many(n - len(uuid_ints), wait=False)
+
+        return [UUID(int=uuid_int) for uuid_int in uuid_ints]
+
+    def _generate_int_many(self, n: int, wait: bool = True) -> List[int]:
+        assert n >= 0, f"n must be greater than or equal to 0, not {n}"
+
+        uuid_ints: List[int] = []
+        with self._lock:
+            last_int = self.last_generated.int if self.last_generated is not None else -1
+            try:
+                timestamp: Optional[int] = self._current_timestamp()
+                while timestamp is not None and len(uuid_ints) < n:
+                    for uuid_int in self.generate_impl_many(timestamp, n - len(uuid_ints)):
+                        # backward UUID check
+                        if uuid_int <= last_int:
+                            on_backward = self._on_backward if wait else self._on_backward_nowait
+                            timestamp = on_backward(
+                                UUID(int=last_int), UUID(int=uuid_int), timestamp
+                            )
+                            break
+
+                        uuid_ints.append(uuid_int)
+                        last_int = uuid_int
+                        self._last_timestamp = timestamp
+                    else:
+                        # The run stopped before the counter overflows.
+                        timestamp = self._current_timestamp()
+            finally:
+                if uuid_ints:
+                    self.last_generated = UUID(int=uuid_ints[-1])
+                    if self.stats is not None:
+                        self.stats.uuids_issued += len(uuid_ints)
+
+        return uuid_ints
+
+    def _current_timestamp(self) -> int:
+        if self._mask is None:
+            self._mask = (1 << self.clock_bits_length) - 1
+
+        timestamp = self.timestamp(self._clock) & self._mask
+
+        # Hold the timestamp of the hybrid logical clock until the clock passes it.
+        if self._observed_timestamp is not None:
+            if timestamp < self._observed_timestamp:
+                timestamp = self._observed_timestamp
+            else:
+                self._observed_timestamp = None
+
+        # Keep the borrowed timestamp until the clock passes it.
+        if (
+            self.max_borrow_seconds > 0
+            and self._last_timestamp is not None
+            and timestamp < self._last_timestamp
+            and self._is_within_borrow_budget(self._last_timestamp, timestamp)
+        ):
+            return self._last_timestamp
+
+        if self._state_store is not None:
+            return self._reserve(timestamp)
+
+        return timestamp
+
+    def _reserve(self, timestamp: int) -> int:
+        assert self._state_store is not None
+
+        # Resume after the timestamps issued before the restart.
+        if self._resume_timestamp is not None:
+            resume_timestamp = self.next_timestamp(self._resume_timestamp)
+            if timestamp < resume_timestamp:
+                timestamp = resume_timestamp
+            else:
+                self._resume_timestamp = None
+
+        # Save the reserved timestamp before the UUIDs up to it are issued.
+        if self._reserved_timestamp is None or timestamp > self._reserved_timestamp:
+            self._reserved_timestamp = timestamp + int(
+                self._state_store.reserve_seconds * self.timestamp_per_second
+            )
+            self._state_store.save(self._reserved_timestamp)
+
+        return timestamp
+
+    def _on_backward(self, last_uuid: UUID, backward_uuid: UUID, timestamp: int) -> int:
+        next_timestamp = self._on_backward_nowait(last_uuid, backward_uuid, timestamp)
+        if next_timestamp is not None:
+            return next_timestamp
+
+        if self.stats is None:
+            sleep(self.least_seconds)
+        else:
+            start = perf_counter()
+            sleep(self.least_seconds)
+            self.stats.stalls += 1
+            self.stats.stall_seconds += perf_counter() - start
+        return self._current_timestamp()
+
+    def _on_backward_nowait(
+        self, last_uuid: UUID, backward_uuid: UUID, timestamp: int
+    ) -> Optional[int]:
+        if self._observed_timestamp is not None:
+            # Advance the hybrid logical clock instead of waiting for the clock.
+            self._observed_timestamp = self.next_timestamp(max(timestamp, self._observed_timestamp))
+            if self._state_store is not None:
+                return self._reserve(self._observed_timestamp)
+            return self._observed_timestamp
+
+        if self._resume_timestamp is not None:
+            # Advance the resumed timestamp instead of waiting for the clock, which is behind it.
+            # `_reserve` resumes at the next timestamp.
+            self._resume_timestamp = max(timestamp, self._resume_timestamp)
+            return self._reserve(timestamp)
+
+        if self.raise_exception_on_backward:
+            raise BackwardUUIDException(last_uuid, backward_uuid)
+
+        if self.max_borrow_seconds > 0:
+            if self._last_timestamp is not None:
+                timestamp = max(timestamp, self._last_timestamp)
+            borrowed_timestamp = self.next_timestamp(timestamp)
+            if self._is_within_borrow_budget(
+                borrowed_timestamp, self.timestamp(self._clock) & self._mask  # type: ignore
+            ):
+                if self._state_store is not None:
+                    return self._reserve(borrowed_timestamp)
+                return borrowed_timestamp
+
+        # Wait for the clock.
+        return None
+
+    def _is_within_borrow_budget(self, borrowed_timestamp: int, clock_timestamp: int) -> bool:
+        return (
+            borrowed_timestamp - clock_timestamp
+            <= self.max_borrow_seconds * self.timestamp_per_second
+        )
+
     @abstractmethod
     def generate_impl(self, timestamp: int) -> UUID:
         """Generate UUID.
@@ -99,3 +422,26 @@ class ClockBasedUUIDGenerator(
         Returns:
             UUID: UUID.
         """
+
+    def generate_impl_many(self, timestamp: int, n: int) -> List[int]:
+        """Generate a run of UUIDs for the same timestamp.
+
+        Subclasses override this to reserve counter values in one step.
+
+        Args:
+            timestamp (int): Current timestamp.
+            n (int): Maximum number of UUIDs.
+
+        Returns:
+            List[int]: UUIDs as integers. At least one UUID is returned.
+        """
+        return [self.generate_impl(timestamp).int for _ in range(n)]
+
+
+def _reseed_after_fork() -> None:
+    for clock_based_uuid_generator in list(_clock_based_uuid_generators):
+        clock_based_uuid_generator.reseed()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reseed_after_fork)
@@ -1,12 +1,18 @@
 import uuid
 from abc import ABCMeta, abstractmethod
-from typing import Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 
 from newnewid.clock.uuid_clock import UUIDClock
 from newnewid.counter.counter import Counter
 from newnewid.random.pseudo_random_binary_generator import PseudoRandomBinaryGenerator
 from newnewid.random.pseudo_random_generator import PseudoRandomGenerator
+from newnewid.random.sharded_pseudo_random_binary_generator import (
+    ShardedPseudoRandomBinaryGenerator,
+)
+from newnewid.shard.shard_option import ShardOption
+from newnewid.state.high_water_mark_store import HighWaterMarkStore
+from newnewid.stats.generator_stats import GeneratorStats
 from newnewid.util.nodoc import nodoc
 from newnewid.uuidgenerator.clock_based_uuid_generator import ClockBasedUUIDGenerator
 
@@ -32,6 +38,10 @@ class GregorianBasedUUIDGenerator(ClockBasedUUIDGenerator, metaclass=ABCMeta):
         clock: Optional[UUIDClock] = None,
         pseudo_random_generator: Optional[PseudoRandomGenerator] = None,
         last_uuid: Optional[UUID] = None,
+        max_borrow_seconds: float = 0.0,
+        shard_option: Optional[ShardOption] = None,
+        state_store: Optional[HighWaterMarkStore] = None,
+        stats: Optional[GeneratorStats] = None,
     ) -> None:
         """Create GregorianBasedUUIDGenerator.
 
@@ -41,22 +51,26 @@ class GregorianBasedUUIDGenerator(ClockBasedUUIDGenerator, metaclass=ABCMeta):
             clock (Optional[UUIDClock], optional): Clock. Defaults to None.
             pseudo_random_generator (Optional[PseudoRandomGenerator], optional): Pseudo random generator. Defaults to None.
             last_uuid (Optional[UUID], optional): Last generated UUID. Defaults to None.
+            max_borrow_seconds (float, optional): Maximum seconds the timestamp can run ahead of the clock when the clock does not advance or the counter overflows. Defaults to 0.0 (sleep).
+            shard_option (Optional[ShardOption], optional): Shard ID folded into the left most bits of pseudo-random `node`. Defaults to None.
+            state_store (Optional[HighWaterMarkStore], optional): Store of the high-water-mark timestamp. The UUIDs after a restart are always after the ones issued before. Defaults to None.
+            stats (Optional[GeneratorStats], optional): Stats of the UUIDs issued, the sleeps, the counter rollovers and the lock wait. Defaults to None.
         """
-        super().__init__(raise_exception_on_backward, clock, pseudo_random_generator, last_uuid)
+        super().__init__(
+            raise_exception_on_backward,
+            clock,
+            pseudo_random_generator,
+            last_uuid,
+            max_borrow_seconds,
+            state_store,
+            stats,
+        )
 
         last_timestamp: Optional[int] = None
         last_counter: Optional[int] = None
         if last_uuid:
             assert last_uuid.version == 6, f"last_uuid must be version 6, not {last_uuid.version}"
-            parsed = self.__class__.parse(last_uuid)
-            (time_high, time_mid, time_low) = (
-                parsed["time_high"],
-                parsed["time_mid"],
-                parsed["time_low"],
-            )
-
-            last_timestamp = time_high << 20 | time_mid << 4 | time_low
-            last_counter = parsed["clock_seq"]
+            last_timestamp, last_counter = self.__class__._parse_last_uuid(last_uuid)
 
         self._counter = Counter(
             counter_bits_length=14,
@@ -64,14 +78,25 @@ class GregorianBasedUUIDGenerator(ClockBasedUUIDGenerator, metaclass=ABCMeta):
             pseudo_random_generator=self._pseudo_random_generator,
             initial_timestamp=last_timestamp,
             initial_counter=last_counter,
+            stats=stats,
         )
         if uses_mac_address:
+            assert shard_option is None, "shard_option cannot be used with MAC address"
             self._pseudo_random_binary_generator = MacAddressGenerator()
+        elif shard_option:
+            self._pseudo_random_binary_generator = ShardedPseudoRandomBinaryGenerator(
+                48, self._pseudo_random_generator, shard_option
+            )
         else:
             self._pseudo_random_binary_generator = PseudoRandomBinaryGenerator(
                 48, self._pseudo_random_generator
             )
 
+    @nodoc
+    def reseed(self) -> None:
+        super().reseed()
+        self._counter.reset()
+
     @nodoc
     def timestamp(self, clock: UUIDClock) -> int:
         return clock.gregorian_100_nano_seconds()
@@ -86,6 +111,41 @@ class GregorianBasedUUIDGenerator(ClockBasedUUIDGenerator, metaclass=ABCMeta):
     def least_seconds(self) -> float:
         return 0.000_000_1
 
+    @nodoc
+    def next_timestamp(self, timestamp: int) -> int:
+        return timestamp + 1
+
+    @property
+    @nodoc
+    def timestamp_per_second(self) -> int:
+        return 10_000_000
+
+    @nodoc
+    def observed_timestamp(self, uuid: UUID) -> int:
+        if uuid.version == 7:
+            # 48 bits of milliseconds since the Unix epoch
+            return (uuid.int >> 80) * 10_000 + UUIDClock.GREGORIAN_OFFSET
+
+        assert uuid.version == 6, f"uuid must be version 6 or 7, not {uuid.version}"
+        return self.__class__._parse_last_uuid(uuid)[0]
+
+    def _observe_counter(self, uuid: UUID) -> bool:
+        if uuid.version != 6:
+            return False
+
+        self._counter.observe(*self.__class__._parse_last_uuid(uuid))
+        return True
+
+    @classmethod
+    def _parse_last_uuid(cls, last_uuid: UUID) -> Tuple[int, int]:
+        parsed = cls.parse(last_uuid)
+        (time_high, time_mid, time_low) = (
+            parsed["time_high"],
+            parsed["time_mid"],
+            parsed["time_low"],
+        )
+        return time_high << 28 | time_mid << 12 | time_low, parsed["clock_seq"]
+
     @nodoc
     def generate_impl(self, timestamp: int) -> UUID:
         # timestamp is 60 bits
@@ -104,6 +164,18 @@ class GregorianBasedUUIDGenerator(ClockBasedUUIDGenerator, metaclass=ABCMeta):
 
         return self.build(timestamp, ver, var, clock_seq, node)
 
+    @nodoc
+    def generate_impl_many(self, timestamp: int, n: int) -> List[int]:
+        # 14 bits
+        clock_seqs = self._counter.get_next_many(timestamp, n)
+
+        return [
+            self.build(
+                timestamp, 6, 0b10, clock_seq, self._pseudo_random_binary_generator.generate()
+            ).int
+            for clock_seq in clock_seqs
+        ]
+
     @abstractmethod
     def build(
         self,
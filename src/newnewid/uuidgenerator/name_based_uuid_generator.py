@@ -0,0 +1,158 @@
+import collections
+import hashlib
+import itertools
+from typing import TYPE_CHECKING, Any, Deque, Iterable, Iterator, List, Optional, Union
+from uuid import UUID
+
+if TYPE_CHECKING:
+    from multiprocessing.pool import AsyncResult
+
+# Bytes of a UUID record
+_RECORD_BYTES_LENGTH = 16
+
+# UUID version of each hash algorithm
+_ALGO_TO_VERSION = {"md5": 3, "sha1": 5}
+
+# Translation table to set var to 0b10 (octet 8) of the records
+_VARIANT_TABLE = bytes((octet & 0x3F) | 0x80 for octet in range(256))
+
+# Generator of the worker process of `iter_records`
+_worker_generator: Optional["NameBasedUUIDGenerator"] = None
+
+
+class NameBasedUUIDGenerator:
+    """Name-based UUID generator for UUIDv3 (MD5) and UUIDv5 (SHA-1).
+
+    The UUIDs are the same as `uuid3` and `uuid5`. The hash state of the namespace is computed
+    once and copied for each name, so the namespace is not hashed again for every name.
+    """
+
+    def __init__(self, namespace: UUID, algo: str = "sha1") -> None:
+        """Create name-based UUID generator.
+
+        Args:
+            namespace (UUID): Namespace such as `NAMESPACE_DNS`.
+            algo (str, optional): "md5" for UUIDv3 or "sha1" for UUIDv5. Defaults to "sha1".
+        """
+        assert algo in _ALGO_TO_VERSION, f"algo must be md5 or sha1, not {algo}"
+        self.namespace = namespace
+        self.algo = algo
+        self.version = _ALGO_TO_VERSION[algo]
+        self._namespace_hash = _new_hash(algo, namespace.bytes)
+        self._version_table = bytes((octet & 0x0F) | (self.version << 4) for octet in range(256))
+
+    def generate(self, name: Union[str, bytes]) -> UUID:
+        """Generate UUID.
+
+        Args:
+            name (Union[str, bytes]): Name. A string is encoded in UTF-8 like `uuid5`.
+
+        Returns:
+            UUID: UUID.
+        """
+        hash_ = self._namespace_hash.copy()
+        hash_.update(name.encode("utf-8") if isinstance(name, str) else name)
+        return UUID(bytes=hash_.digest()[:_RECORD_BYTES_LENGTH], version=self.version)
+
+    def generate_many(
+        self,
+        names: Iterable[Union[str, bytes]],
+        processes: int = 1,
+        chunk_size: int = 10_000,
+    ) -> List[UUID]:
+        """Generate UUIDs in bulk.
+
+        Args:
+            names (Iterable[Union[str, bytes]]): Names.
+            processes (int, optional): Number of worker processes. The names are hashed in a process pool if greater than 1. Defaults to 1.
+            chunk_size (int, optional): Number of names sent to a worker process at once. Defaults to 10_000.
+
+        Returns:
+            List[UUID]: UUIDs in order of the names.
+        """
+        return [
+            UUID(bytes=records[offset : offset + _RECORD_BYTES_LENGTH])  # noqa: E203
+            for records in self.iter_records(names, processes, chunk_size)
+            for offset in range(0, len(records), _RECORD_BYTES_LENGTH)
+        ]
+
+    def iter_records(
+        self,
+        names: Iterable[Union[str, bytes]],
+        processes: int = 1,
+        chunk_size: int = 10_000,
+    ) -> Iterator[bytes]:
+        """Generate UUIDs as contiguous 16-byte records, the same as `UUID.bytes`, chunk by chunk.
+
+        The names are read lazily, and at most 2 chunks per worker process are in flight,
+        so an input larger than the memory can be streamed.
+
+        Args:
+            names (Iterable[Union[str, bytes]]): Names.
+            processes (int, optional): Number of worker processes. The names are hashed in a process pool if greater than 1. Defaults to 1.
+            chunk_size (int, optional): Number of names per chunk. Defaults to 10_000.
+
+        Yields:
+            bytes: Records of a chunk of names, in order of the names.
+        """
+        assert processes > 0, f"processes must be greater than 0, not {processes}"
+        assert chunk_size > 0, f"chunk_size must be greater than 0, not {chunk_size}"
+
+        names_iterator = iter(names)
+        chunks = iter(lambda: list(itertools.islice(names_iterator, chunk_size)), [])
+        if processes == 1:
+            for chunk in chunks:
+                yield self._generate_records(chunk)
+            return
+
+        import multiprocessing
+
+        # The same as `cli parse --jobs`: the chunks are submitted by hand because `Pool.imap`
+        # reads the whole input ahead.
+        pending: Deque["AsyncResult[bytes]"] = collections.deque()
+        with multiprocessing.Pool(
+            processes, initializer=_init_worker, initargs=(self.namespace, self.algo)
+        ) as pool:
+            for chunk in chunks:
+                pending.append(pool.apply_async(_generate_records_in_worker, (chunk,)))
+                if len(pending) >= 2 * processes:
+                    yield pending.popleft().get()
+            while pending:
+                yield pending.popleft().get()
+
+    def _generate_records(self, names: List[Union[str, bytes]]) -> bytes:
+        namespace_hash = self._namespace_hash
+        digests = []
+        for name in names:
+            hash_ = namespace_hash.copy()
+            hash_.update(name.encode("utf-8") if isinstance(name, str) else name)
+            digests.append(hash_.digest()[:_RECORD_BYTES_LENGTH])
+
+        # ver and var are set for all the records at once.
+        records = bytearray(b"".join(digests))
+        records[6::_RECORD_BYTES_LENGTH] = records[6::_RECORD_BYTES_LENGTH].translate(
+            self._version_table
+        )
+        records[8::_RECORD_BYTES_LENGTH] = records[8::_RECORD_BYTES_LENGTH].translate(
+            _VARIANT_TABLE
+        )
+        return bytes(records)
+
+
+def _new_hash(algo: str, data: bytes) -> Any:
+    # The hash is not used for security, the same as `uuid3` and `uuid5`.
+    try:
+        return hashlib.new(algo, data, usedforsecurity=False)  # type: ignore[call-arg]
+    except TypeError:
+        # Python 3.8 does not have `usedforsecurity`.
+        return hashlib.new(algo, data)
+
+
+def _init_worker(namespace: UUID, algo: str) -> None:
+    global _worker_generator
+    _worker_generator = NameBasedUUIDGenerator(namespace, algo)
+
+
+def _generate_records_in_worker(names: List[Union[str, bytes]]) -> bytes:
+    assert _worker_generator is not None
+    return _worker_generator._generate_records(names)
@@ -0,0 +1,44 @@
+import json
+import time
+
+from newnewid.benchmark.benchmark_suite import (
+    BenchmarkCase,
+    compare_results,
+    dump_results,
+    format_results,
+    get_default_cases,
+    run_cases,
+)
+
+
+class TestBenchmarkSuite:
+    def test_default_cases(self):
+        names = [case.name for case in get_default_cases()]
+        for name in ["uuid1", "uuid4", "uuid6", "uuid7 METHOD_1_12", "uuid8", "parse uuid7"]:
+            assert name in names
+        assert len(set(names)) == len(names)
+
+    def test_run_cases(self):
+        cases = [case for case in get_default_cases() if case.name in ("uuid4", "uuid7 METHOD_2")]
+        results = run_cases(cases, n=200, threads_count=2, max_seconds=0.05)
+
+        loaded = json.loads(dump_results(results))
+        assert loaded == results
+        assert [result["name"] for result in results["results"]] == ["uuid4", "uuid7 METHOD_2"]
+        for result in results["results"]:
+            assert result["ops_per_second"] > 0
+            assert result["threads_ops_per_second"] > 0
+            assert 0 < result["p50_nano_seconds"] <= result["p99_nano_seconds"]
+
+        assert compare_results(results, results) == {"uuid4": 1.0, "uuid7 METHOD_2": 1.0}
+        assert "uuid7 METHOD_2" in format_results(results, results)
+
+    def test_max_seconds(self):
+        # The case stops by the time limit, not by n.
+        results = run_cases(
+            [BenchmarkCase("sleep", lambda: time.sleep(0.001))],
+            n=1_000_000,
+            threads_count=1,
+            max_seconds=0.01,
+        )
+        assert results["results"][0]["ops_per_second"] < 1001
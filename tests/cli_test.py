@@ -0,0 +1,120 @@
+import csv
+import io
+import json
+import sys
+
+import pytest
+
+import newnewid
+from newnewid import NAMESPACE_DNS, UUID, uuid3, uuid4, uuid5
+from newnewid.cli import cli
+from newnewid.parser.uuid_parser import parse
+
+
+def _generate(monkeypatch, capsysbinary, *args: str) -> bytes:
+    monkeypatch.setattr(sys, "argv", ["newnewid", "generate", *args])
+    cli()
+    return capsysbinary.readouterr().out
+
+
+class TestCLIGenerate:
+    @pytest.mark.parametrize("batch_size", ["1", "7", "10000"])
+    def test_text(self, monkeypatch, capsysbinary, batch_size: str):
+        out = _generate(monkeypatch, capsysbinary, "-u", "7", "20", "--batch-size", batch_size)
+        uuids = [UUID(line) for line in out.decode().splitlines()]
+        assert len(uuids) == 20
+        assert uuids == sorted(uuids)
+        assert out.decode() == "".join(f"{uuid}\n" for uuid in uuids)
+
+    @pytest.mark.parametrize("method", ["METHOD-0", "METHOD-4-WITHOUT-COUNTER"])
+    def test_without_counter(self, monkeypatch, capsysbinary, method: str):
+        out = _generate(monkeypatch, capsysbinary, "-u", "7", "-m", method, "20", "-f", "raw16")
+        uuids = [UUID(bytes=out[i : i + 16]) for i in range(0, len(out), 16)]
+        assert len(uuids) == 20
+        assert all(uuid.version == 7 for uuid in uuids)
+        assert uuids == sorted(set(uuids))
+
+    def test_formats(self, monkeypatch, capsysbinary):
+        raw = _generate(monkeypatch, capsysbinary, "-u", "6", "5", "-f", "raw16")
+        assert len(raw) == 5 * 16
+        uuids = [UUID(bytes=raw[i : i + 16]) for i in range(0, len(raw), 16)]
+        assert all(uuid.version == 6 for uuid in uuids)
+
+        out = _generate(monkeypatch, capsysbinary, "-u", "4", "3", "-f", "hex")
+        assert [UUID(hex=line).version for line in out.decode().splitlines()] == [4, 4, 4]
+
+        out = _generate(monkeypatch, capsysbinary, "-u", "max", "2", "-f", "ndjson")
+        assert [json.loads(line) for line in out.decode().splitlines()] == [
+            {"uuid": "ffffffff-ffff-ffff-ffff-ffffffffffff"}
+        ] * 2
+
+        out = _generate(monkeypatch, capsysbinary, "-u", "nil", "2", "-f", "csv")
+        assert out.decode().splitlines() == ["uuid"] + [str(UUID(int=0))] * 2
+
+    @pytest.mark.parametrize("uuid_version, uuid_function", [("3", uuid3), ("5", uuid5)])
+    @pytest.mark.parametrize("jobs", ["1", "2"])
+    def test_stdin(self, monkeypatch, capsysbinary, uuid_version: str, uuid_function, jobs: str):
+        names = ["example.com", "", "名前", "www.example.com"]
+        stdin = "".join(f"{name}\n" for name in names).encode()
+        monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(stdin)))
+        out = _generate(
+            monkeypatch,
+            capsysbinary,
+            "-u",
+            uuid_version,
+            "--namespace",
+            str(NAMESPACE_DNS),
+            "--stdin",
+            "-j",
+            jobs,
+            "--batch-size",
+            "3",
+        )
+        expected = [str(uuid_function(NAMESPACE_DNS, name)) for name in names]
+        assert out.decode().splitlines() == expected
+
+
+def _parse(monkeypatch, capsysbinary, stdin: bytes, *args: str) -> bytes:
+    monkeypatch.setattr(sys, "argv", ["newnewid", "parse", *args])
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(stdin)))
+    cli()
+    return capsysbinary.readouterr().out
+
+
+class TestCLIParse:
+    def test_arguments(self, monkeypatch, capsysbinary):
+        uuid = newnewid.uuid6()
+        out = _parse(monkeypatch, capsysbinary, b"", str(uuid))
+        assert json.loads(out) == {"uuid": str(uuid), **parse(uuid)}
+
+    @pytest.mark.parametrize("jobs", ["1", "2"])
+    def test_stdin(self, monkeypatch, capsysbinary, jobs: str):
+        uuids = [newnewid.uuid7() for _ in range(10)] + [uuid4(), newnewid.uuid6()]
+        stdin = "".join(f"{uuid}\n" for uuid in uuids).encode()
+
+        out = _parse(monkeypatch, capsysbinary, stdin, "--stdin", "-j", jobs, "--chunk-size", "3")
+        rows = [json.loads(line) for line in out.decode().splitlines()]
+        assert [row["uuid"] for row in rows] == [str(uuid) for uuid in uuids]
+        assert rows[-1] == {"uuid": str(uuids[-1]), **parse(uuids[-1])}
+
+    @pytest.mark.parametrize("output_format, delimiter", [("csv", ","), ("tsv", "\t")])
+    def test_raw16_to_csv(self, monkeypatch, capsysbinary, output_format: str, delimiter: str):
+        uuids = [newnewid.uuid7() for _ in range(5)]
+        stdin = b"".join(uuid.bytes for uuid in uuids)
+
+        out = _parse(
+            monkeypatch,
+            capsysbinary,
+            stdin,
+            "--stdin",
+            "--input-format",
+            "raw16",
+            "-f",
+            output_format,
+            "--chunk-size",
+            "2",
+        )
+        rows = list(csv.DictReader(io.StringIO(out.decode()), delimiter=delimiter))
+        assert [row["uuid"] for row in rows] == [str(uuid) for uuid in uuids]
+        assert [int(row["unix_ts_ms"]) for row in rows] == [uuid.int >> 80 for uuid in uuids]
+        assert rows[0]["node"] == ""
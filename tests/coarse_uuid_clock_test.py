@@ -0,0 +1,61 @@
+import os
+import time
+
+import pytest
+
+import newnewid
+from newnewid import CoarseUUIDClock
+
+
+def _wait_for_tick(clock: CoarseUUIDClock, now: int) -> int:
+    deadline = time.monotonic() + 1.0
+    while clock.epoch_nano_seconds() == now and time.monotonic() < deadline:
+        time.sleep(0.001)
+    return clock.epoch_nano_seconds()
+
+
+class TestCoarseUUIDClock:
+    def test_epoch_nano_seconds(self):
+        clock = CoarseUUIDClock()
+        try:
+            now = clock.epoch_nano_seconds()
+            assert now % 1_000_000 == 0
+            assert abs(time.time_ns() - now) < 1_000_000_000
+
+            assert _wait_for_tick(clock, now) > now
+        finally:
+            clock.close()
+
+    def test_close(self):
+        clock = CoarseUUIDClock(resolution_seconds=0.001)
+        clock.close()
+        time.sleep(0.01)
+        now = clock.epoch_nano_seconds()
+        time.sleep(0.01)
+        assert clock.epoch_nano_seconds() == now
+
+    def test_uuid7(self):
+        clock = CoarseUUIDClock()
+        try:
+            generator = newnewid.UUID7Generator(
+                newnewid.METHOD_1_FIXED_LENGTH_DEDICATED_COUNTER_BITS_12, clock=clock
+            )
+            uuids = [generator.generate() for _ in range(10_000)] + generator.generate_many(10_000)
+            assert uuids == sorted(set(uuids))
+            assert uuids[-1].int >> 80 <= time.time_ns() // 1_000_000
+        finally:
+            clock.close()
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="os.fork is not available")
+    def test_fork(self):
+        clock = CoarseUUIDClock()
+        try:
+            pid = os.fork()
+            if pid == 0:
+                now = clock.epoch_nano_seconds()
+                os._exit(0 if _wait_for_tick(clock, now) > now else 1)
+
+            _, status = os.waitpid(pid, 0)
+            assert os.WEXITSTATUS(status) == 0
+        finally:
+            clock.close()
@@ -25,3 +25,15 @@ class TestUUID6Dpdnuf01:
 
         uuid = generator.generate()
         assert uuid == UUID("1EC9414C-232A-6B00-B3C8-9E6BDECED846")
+
+    def test_uuid6_generate_many(self):
+        generator = newnewid.UUID6Generator(uses_mac_address=False)
+        uuids = generator.generate_many(10_000)
+        assert len(uuids) == 10_000
+        assert uuids == sorted(set(uuids))
+        assert all(uuid.version == 6 for uuid in uuids)
+
+    def test_uuid6_sharded(self):
+        uuids = [newnewid.uuid6(sharded=True, shard_bits_length=4) for _ in range(100)]
+        assert uuids == sorted(set(uuids))
+        assert len({uuid.node >> 44 for uuid in uuids}) == 1
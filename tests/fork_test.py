@@ -0,0 +1,56 @@
+import os
+
+import pytest
+
+import newnewid
+from newnewid import UUID
+
+
+def _generate_in_child(generator: newnewid.UUID7Generator) -> UUID:
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            os.close(read_fd)
+            os.write(write_fd, generator.generate().bytes)
+        finally:
+            os._exit(0)
+
+    os.close(write_fd)
+    with os.fdopen(read_fd, "rb") as f:
+        data = f.read()
+    os.waitpid(pid, 0)
+    return UUID(bytes=data)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="os.fork is not available")
+class TestFork:
+    def test_reseed_after_fork(self):
+        pseudo_random_generator = newnewid.PooledPseudoRandomGenerator()
+        generator = newnewid.UUID7Generator(
+            uuid7_option=newnewid.METHOD_1_FIXED_LENGTH_DEDICATED_COUNTER_BITS_42,
+            pseudo_random_generator=pseudo_random_generator,
+        )
+        last_uuid = generator.generate()
+
+        # The pool and the counter are not shared with the children.
+        child_uuids = [_generate_in_child(generator) for _ in range(4)]
+        parent_uuid = generator.generate()
+        assert len(set(child_uuids + [parent_uuid])) == 5
+        seqs = {
+            newnewid.UUID7Generator.parse(
+                uuid, newnewid.METHOD_1_FIXED_LENGTH_DEDICATED_COUNTER_BITS_42
+            )["seq"]
+            for uuid in child_uuids
+        }
+        assert len(seqs) == 4
+        assert all(uuid > last_uuid for uuid in child_uuids)
+
+    def test_lock_after_fork(self):
+        generator = newnewid.UUID7Generator(
+            uuid7_option=newnewid.METHOD_1_FIXED_LENGTH_DEDICATED_COUNTER_BITS_12,
+        )
+        # The lock held in the parent is recreated in the child.
+        with generator._lock:
+            child_uuid = _generate_in_child(generator)
+        assert child_uuid.version == 7
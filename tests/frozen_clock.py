@@ -93,3 +93,25 @@ class FrozenClock(UUIDClock):
     def epoch_nano_seconds(self) -> int:
         self.index = (self.index + 1) % len(self._nano_datetimes)
         return self._nano_datetimes[self.index].time_ns
+
+
+class ManualClock(UUIDClock):
+    def __init__(self, now: int) -> None:
+        super().__init__()
+        self.now = now
+
+    def epoch_nano_seconds(self) -> int:
+        return self.now
+
+
+class TickingClock(UUIDClock):
+    def __init__(self, now: int, step: int) -> None:
+        super().__init__()
+        self.now = now
+        self.step = step
+        self.reads = 0
+
+    def epoch_nano_seconds(self) -> int:
+        self.now += self.step
+        self.reads += 1
+        return self.now
@@ -0,0 +1,73 @@
+import threading
+import time
+
+from const import TEST_CLOCK
+from frozen_clock import ManualClock
+from frozen_pseudo_random_generator import FrozenPseudoRandomGenerator
+
+import newnewid
+from newnewid import GeneratorStats, GeneratorStatsSnapshot, dump_openmetrics
+
+
+class _StepClock(ManualClock):
+    """Clock that advances 1 ms when the generator sleeps."""
+
+    def __init__(self, now: int) -> None:
+        super().__init__(now)
+        self.reads = 0
+
+    def epoch_nano_seconds(self) -> int:
+        self.reads += 1
+        return self.now + (1_000_000 if self.reads > 2 else 0)
+
+
+class TestGeneratorStats:
+    def test_rollover_and_stall(self):
+        stats = GeneratorStats()
+        generator = newnewid.UUID7Generator(
+            newnewid.METHOD_1_FIXED_LENGTH_DEDICATED_COUNTER_BITS_12,
+            clock=_StepClock(TEST_CLOCK.epoch_nano_seconds()),
+            pseudo_random_generator=FrozenPseudoRandomGenerator(counter_reset=4095),
+            stats=stats,
+        )
+
+        uuids = [generator.generate(), generator.generate()]
+        assert uuids == sorted(uuids)
+
+        snapshot = stats.snapshot()
+        assert snapshot.uuids_issued == 2
+        assert snapshot.counter_rollovers == 1
+        assert snapshot.stalls == 1
+        assert snapshot.stall_seconds > 0
+
+    def test_lock_wait(self):
+        stats = GeneratorStats()
+        generator = newnewid.UUID7Generator(newnewid.METHOD_2_MONOTONIC_RANDOM_62_BITS, stats=stats)
+
+        with generator._lock:
+            thread = threading.Thread(target=generator.generate)
+            thread.start()
+            time.sleep(0.05)
+        thread.join()
+
+        assert stats.uuids_issued == 1
+        assert stats.lock_wait_seconds >= 0.04
+
+    def test_openmetrics(self):
+        orders = GeneratorStats({"generator": 'or"ders'})
+        users = GeneratorStats({"generator": "users"})
+        newnewid.UUID6Generator(uses_mac_address=False, stats=orders).generate_many(3)
+
+        assert orders.snapshot() == GeneratorStatsSnapshot(3, 0, 0.0, 0, 0.0)
+        text = dump_openmetrics([orders, users])
+        lines = text.splitlines()
+        assert lines[:3] == [
+            "# TYPE newnewid_uuids_issued counter",
+            "# HELP newnewid_uuids_issued UUIDs issued by the generator.",
+            'newnewid_uuids_issued_total{generator="or\\"ders"} 3',
+        ]
+        assert 'newnewid_uuids_issued_total{generator="users"} 0' in lines
+        assert "# UNIT newnewid_stall_seconds seconds" in lines
+        assert lines[-1] == "# EOF"
+        assert text.endswith("\n")
+        assert orders.to_openmetrics("app").startswith("# TYPE app_uuids_issued counter\n")
@@ -0,0 +1,72 @@
+from const import TEST_CLOCK
+from frozen_clock import ManualClock
+
+import newnewid
+from newnewid import HighWaterMarkStore
+
+
+class TestHighWaterMarkStore:
+    def test_save_and_load(self, tmp_path):
+        path = str(tmp_path / "state")
+        store = HighWaterMarkStore(path)
+        assert store.load() is None
+        store.save(100)
+        store.save(200)
+        store.close()
+
+        store = HighWaterMarkStore(path)
+        assert store.load() == 200
+
+        # A torn write does not lose the last saved timestamp.
+        with open(path, "r+b") as f:
+            f.seek(0)
+            f.write(b"\xff" * 4)
+        assert store.load() == 200
+        store.close()
+
+    def test_resume_after_restart(self, tmp_path):
+        path = str(tmp_path / "state")
+        uuid7_option = newnewid.METHOD_1_FIXED_LENGTH_DEDICATED_COUNTER_BITS_12
+        clock = ManualClock(TEST_CLOCK.epoch_nano_seconds())
+
+        store = HighWaterMarkStore(path, reserve_seconds=1.0)
+        generator = newnewid.UUID7Generator(uuid7_option, clock=clock, state_store=store)
+        uuids = [generator.generate() for _ in range(100)]
+        clock.now += 500_000_000
+        uuids += [generator.generate() for _ in range(100)]
+        # The file is written once per reserved second.
+        assert store.load() == TEST_CLOCK.epoch_nano_seconds() + 1_000_000_000
+        store.close()
+
+        # Restart with the clock stepped backward.
+        clock.now -= 10_000_000_000
+        store = HighWaterMarkStore(path, reserve_seconds=1.0)
+        generator = newnewid.UUID7Generator(uuid7_option, clock=clock, state_store=store)
+        uuid = generator.generate()
+        assert uuid > uuids[-1]
+        assert (
+            newnewid.UUID7Generator.parse(uuid, uuid7_option)["unix_ts_ms"]
+            == (TEST_CLOCK.epoch_nano_seconds() + 1_000_000_000) // 1_000_000 + 1
+        )
+        store.close()
+
+    def test_counter_overflow_after_restart(self, tmp_path):
+        path = str(tmp_path / "state")
+        uuid7_option = newnewid.METHOD_1_FIXED_LENGTH_DEDICATED_COUNTER_BITS_12
+        clock = ManualClock(TEST_CLOCK.epoch_nano_seconds())
+
+        store = HighWaterMarkStore(path, reserve_seconds=1.0)
+        store.save(TEST_CLOCK.epoch_nano_seconds() + 1_000_000_000)
+        store.close()
+
+        # The clock is behind the saved timestamp, so it does not advance the timestamp.
+        store = HighWaterMarkStore(path, reserve_seconds=1.0)
+        generator = newnewid.UUID7Generator(uuid7_option, clock=clock, state_store=store)
+        uuids = generator.generate_many(10_000)
+        assert uuids == sorted(set(uuids))
+        unix_ts_ms = {
+            newnewid.UUID7Generator.parse(uuid, uuid7_option)["unix_ts_ms"] for uuid in uuids
+        }
+        assert len(unix_ts_ms) > 1
+        assert uuids[-1] < generator.generate()
+        store.close()
@@ -0,0 +1,103 @@
+import time
+
+from const import TEST_CLOCK
+from frozen_clock import ManualClock
+
+import newnewid
+from newnewid.counter.counter import Counter
+from newnewid.random.pseudo_random_generator import PseudoRandomGenerator
+
+UUID7_OPTION = newnewid.METHOD_1_FIXED_LENGTH_DEDICATED_COUNTER_BITS_12
+
+
+class TestHybridLogicalClock:
+    def test_observe_uuid7(self):
+        now = TEST_CLOCK.epoch_nano_seconds()
+        ahead = newnewid.UUID7Generator(UUID7_OPTION, clock=ManualClock(now + 10_000_000_000))
+        behind_clock = ManualClock(now)
+        behind = newnewid.UUID7Generator(UUID7_OPTION, clock=behind_clock)
+
+        received = ahead.generate()
+        behind.observe(received)
+
+        # The clock does not advance, so the counter overflow advances the timestamp logically.
+        start = time.perf_counter()
+        uuids = [behind.generate()] + behind.generate_many(10_000)
+        assert time.perf_counter() - start < 1.0
+        assert uuids == sorted(set(uuids))
+        assert uuids[0] > received
+        assert uuids[0].int >> 80 == received.int >> 80
+        assert (uuids[0].int >> 64) & 0x0FFF == ((received.int >> 64) & 0x0FFF) + 1
+
+        # The clock takes over again when it passes the observed timestamp.
+        behind_clock.now = now + 20_000_000_000
+        assert behind.generate().int >> 80 == behind_clock.now // 1_000_000
+
+    def test_observe_older_uuid(self):
+        now = TEST_CLOCK.epoch_nano_seconds()
+        generator = newnewid.UUID7Generator(UUID7_OPTION, clock=ManualClock(now))
+        last = generator.generate()
+
+        generator.observe(
+            newnewid.UUID7Generator(UUID7_OPTION, clock=ManualClock(now - 1)).generate()
+        )
+        assert generator.generate() > last
+
+    def test_observe_other_version(self):
+        now = TEST_CLOCK.epoch_nano_seconds()
+        uuid6 = newnewid.UUID6Generator(
+            uses_mac_address=False, clock=ManualClock(now + 5_000_000_000)
+        ).generate()
+        uuid7_generator = newnewid.UUID7Generator(UUID7_OPTION, clock=ManualClock(now))
+        uuid7_generator.observe(uuid6)
+        assert uuid7_generator.generate().int >> 80 == (now + 5_000_000_000) // 1_000_000
+
+        uuid7 = newnewid.UUID7Generator(
+            UUID7_OPTION, clock=ManualClock(now + 9_000_000_000)
+        ).generate()
+        uuid6_generator = newnewid.UUID6Generator(uses_mac_address=False, clock=ManualClock(now))
+        uuid6_generator.observe(uuid7)
+        assert uuid6_generator.observed_timestamp(
+            uuid6_generator.generate()
+        ) == uuid6_generator.observed_timestamp(uuid7)
+
+    def test_observe_uuid6(self):
+        now = TEST_CLOCK.epoch_nano_seconds()
+        received = newnewid.UUID6Generator(
+            uses_mac_address=False, clock=ManualClock(now + 1_000_000_000)
+        ).generate()
+        generator = newnewid.UUID6Generator(uses_mac_address=False, clock=ManualClock(now))
+        generator.observe(received)
+
+        uuids = generator.generate_many(20_000)
+        assert uuids == sorted(set(uuids))
+        assert uuids[0] > received
+        assert uuids[0].int >> 64 == received.int >> 64
+
+    def test_observe_max_skew_seconds(self):
+        now = TEST_CLOCK.epoch_nano_seconds()
+        generator = newnewid.UUID7Generator(UUID7_OPTION, clock=ManualClock(now))
+
+        # A UUID within the skew is folded.
+        within = newnewid.UUID7Generator(
+            UUID7_OPTION, clock=ManualClock(now + 5_000_000_000)
+        ).generate()
+        assert generator.observe(within, max_skew_seconds=10.0)
+        assert generator.generate() > within
+
+        # A UUID further ahead is ignored.
+        beyond = newnewid.UUID7Generator(
+            UUID7_OPTION, clock=ManualClock(now + 3_600_000_000_000)
+        ).generate()
+        assert not generator.observe(beyond, max_skew_seconds=10.0)
+        assert generator.generate().int >> 80 == (now + 5_000_000_000) // 1_000_000
+
+    def test_counter_observe_max_timestamp(self):
+        counter = Counter(12, 1, PseudoRandomGenerator(), initial_timestamp=100, initial_counter=5)
+
+        counter.observe(110, 7, max_timestamp=200)
+        assert (counter.last_timestamp, counter.counter) == (110, 7)
+
+        counter.observe(1_000, 9, max_timestamp=200)
+        assert (counter.last_timestamp, counter.counter) == (110, 7)
+        assert counter.get_next(110) == 8
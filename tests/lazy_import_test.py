@@ -0,0 +1,52 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import newnewid
+from newnewid.draft_peabody_dispatch_new_uuid_format_03 import uuid7_generator
+
+
+def _imported_modules(code: str) -> set:
+    result = subprocess.run(
+        [sys.executable, "-c", code + "\nimport sys\nprint('\\n'.join(sys.modules))"],
+        check=True,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    return set(result.stdout.split())
+
+
+class TestLazyImport:
+    def test_import_is_lazy(self):
+        modules = _imported_modules("import newnewid")
+        assert "newnewid" in modules
+        for module in [
+            "asyncio",
+            "multiprocessing",
+            "newnewid.draft_peabody_dispatch_new_uuid_format_01.uuid6_generator",
+            "newnewid.draft_peabody_dispatch_new_uuid_format_03.uuid7_generator",
+        ]:
+            assert module not in modules
+
+    def test_uuid7_imports_only_what_is_needed(self):
+        modules = _imported_modules("import newnewid\nnewnewid.uuid7()")
+        assert "newnewid.draft_peabody_dispatch_new_uuid_format_03.uuid7_generator" in modules
+        for module in [
+            "asyncio",
+            "multiprocessing",
+            "newnewid.draft_peabody_dispatch_new_uuid_format_01.uuid6_generator",
+        ]:
+            assert module not in modules
+
+    def test_attributes(self):
+        assert newnewid.UUID7Generator is uuid7_generator.UUID7Generator
+        assert "UUID7Generator" in vars(newnewid)
+        assert set(newnewid.__all__) <= set(dir(newnewid))
+        for name in newnewid.__all__:
+            assert getattr(newnewid, name) is not None
+
+        with pytest.raises(AttributeError):
+            newnewid.no_such_attribute  # noqa: B018
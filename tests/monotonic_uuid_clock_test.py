@@ -0,0 +1,88 @@
+import newnewid
+from newnewid import MonotonicUUIDClock
+from newnewid.clock import monotonic_uuid_clock
+
+_SECOND = 1_000_000_000
+
+
+class _FakeTime:
+    def __init__(self) -> None:
+        self.wall = 1_700_000_000 * _SECOND
+        self.monotonic = 1_000 * _SECOND
+
+    def time_ns(self) -> int:
+        return self.wall
+
+    def monotonic_ns(self) -> int:
+        return self.monotonic
+
+    def advance(self, nano_seconds: int) -> None:
+        self.wall += nano_seconds
+        self.monotonic += nano_seconds
+
+
+class TestMonotonicUUIDClock:
+    def test_step_backward(self, monkeypatch):
+        fake_time = _FakeTime()
+        monkeypatch.setattr(monotonic_uuid_clock, "time", fake_time)
+        clock = MonotonicUUIDClock(sync_seconds=1.0, max_slew_rate=0.001)
+        start = clock.epoch_nano_seconds()
+        assert start == fake_time.wall
+
+        # The system clock steps 1 second backward.
+        fake_time.wall -= _SECOND
+        times = []
+        for _ in range(100):
+            fake_time.advance(_SECOND // 10)
+            times.append(clock.epoch_nano_seconds())
+
+        assert times == sorted(set(times))
+        assert clock.last_drift_nano_seconds < 0
+        # It runs slower by at most 1 ms per second.
+        elapsed = times[-1] - start
+        assert 10 * _SECOND - 10_000_000 <= elapsed < 10 * _SECOND
+        assert times[-1] > fake_time.wall
+
+    def test_step_forward(self, monkeypatch):
+        fake_time = _FakeTime()
+        monkeypatch.setattr(monotonic_uuid_clock, "time", fake_time)
+        clock = MonotonicUUIDClock(sync_seconds=1.0, max_slew_rate=0.001)
+        start = clock.epoch_nano_seconds()
+
+        # The system clock steps 1 hour forward, for example after a suspend.
+        fake_time.wall += 3_600 * _SECOND
+        times = []
+        for _ in range(20):
+            fake_time.advance(_SECOND // 10)
+            times.append(clock.epoch_nano_seconds())
+
+        assert times == sorted(set(times))
+        assert times[8] - start < _SECOND
+        # It follows the system clock at the next sync instead of slewing.
+        assert times[9] == start + 3_601 * _SECOND
+        assert times[-1] == fake_time.wall
+
+    def test_drift_is_corrected(self, monkeypatch):
+        fake_time = _FakeTime()
+        monkeypatch.setattr(monotonic_uuid_clock, "time", fake_time)
+        clock = MonotonicUUIDClock(sync_seconds=1.0, max_slew_rate=0.001)
+
+        # The monotonic clock runs 100 us per second slower than the system clock.
+        for _ in range(20):
+            fake_time.advance(_SECOND // 2)
+            fake_time.wall += 50_000
+            clock.epoch_nano_seconds()
+        assert abs(fake_time.wall - clock.epoch_nano_seconds()) <= 100_000
+
+        # Idle for long, then the clock does not overshoot.
+        fake_time.advance(60 * _SECOND)
+        assert abs(fake_time.wall - clock.epoch_nano_seconds()) <= 200_000
+
+    def test_uuid7(self):
+        generator = newnewid.UUID7Generator(
+            newnewid.METHOD_1_FIXED_LENGTH_DEDICATED_COUNTER_BITS_12,
+            clock=MonotonicUUIDClock(),
+            raise_exception_on_backward=True,
+        )
+        uuids = generator.generate_many(1_000)
+        assert uuids == sorted(set(uuids))
@@ -0,0 +1,30 @@
+import pytest
+
+from newnewid import NAMESPACE_DNS, NAMESPACE_URL, NameBasedUUIDGenerator, uuid3, uuid5
+
+NAMES = ["example.com", "", "名前", "www.example.com"] * 3
+
+
+class TestNameBasedUUIDGenerator:
+    @pytest.mark.parametrize("algo, uuid_function", [("md5", uuid3), ("sha1", uuid5)])
+    def test_generate(self, algo, uuid_function):
+        generator = NameBasedUUIDGenerator(NAMESPACE_DNS, algo)
+        for name in NAMES:
+            assert generator.generate(name) == uuid_function(NAMESPACE_DNS, name)
+        assert generator.generate(b"example.com") == uuid_function(NAMESPACE_DNS, "example.com")
+
+        uuid = generator.generate("example.com")
+        assert uuid.version == (3 if algo == "md5" else 5)
+        assert NameBasedUUIDGenerator(NAMESPACE_URL, algo).generate("example.com") != uuid
+
+    @pytest.mark.parametrize("algo, uuid_function", [("md5", uuid3), ("sha1", uuid5)])
+    @pytest.mark.parametrize("processes", [1, 2])
+    def test_generate_many(self, algo, uuid_function, processes):
+        generator = NameBasedUUIDGenerator(NAMESPACE_DNS, algo)
+        expected = [uuid_function(NAMESPACE_DNS, name) for name in NAMES]
+
+        assert generator.generate_many(NAMES, processes=processes, chunk_size=5) == expected
+        assert generator.generate_many(iter([]), processes=processes) == []
+
+        records = b"".join(generator.iter_records(iter(NAMES), processes, chunk_size=5))
+        assert records == b"".join(uuid.bytes for uuid in expected)
@@ -0,0 +1,21 @@
+import newnewid
+from newnewid import PooledPseudoRandomGenerator
+
+
+class TestPooledPseudoRandomGenerator:
+    def test_generate(self):
+        generator = PooledPseudoRandomGenerator(pool_bytes_length=64)
+        for bits in [1, 7, 8, 12, 62, 74, 200]:
+            values = [generator.generate(bits, "random-binary") for _ in range(100)]
+            assert all(0 <= value < (1 << bits) for value in values)
+            assert len(set(values)) > 1
+        assert generator.generate(0, "random-binary") == 0
+
+    def test_uuid7(self):
+        generator = newnewid.UUID7Generator(
+            uuid7_option=newnewid.METHOD_2_MONOTONIC_RANDOM_62_BITS,
+            pseudo_random_generator=PooledPseudoRandomGenerator(),
+        )
+        uuids = [generator.generate() for _ in range(1_000)]
+        assert uuids == sorted(set(uuids))
+        assert all(uuid.version == 7 for uuid in uuids)
@@ -0,0 +1,43 @@
+from const import TEST_CLOCK
+from frozen_clock import ManualClock
+from frozen_pseudo_random_generator import FrozenPseudoRandomGenerator
+
+import newnewid
+from newnewid import PooledPseudoRandomGenerator, PseudoRandomGenerator
+from newnewid.random.pseudo_random_binary_generator import PseudoRandomBinaryGenerator
+
+
+class TestPseudoRandomGenerator:
+    def test_generate_range(self):
+        for generator in [PseudoRandomGenerator(), PooledPseudoRandomGenerator()]:
+            for start, stop in [(0, 1), (1, 2), (1, 1 << 62), (5, 8), ((1 << 74) - 3, 1 << 74)]:
+                values = [generator.generate_range(start, stop, "counter") for _ in range(100)]
+                assert all(start <= value < stop for value in values)
+                assert len(set(values)) > 1 or stop - start == 1
+
+            counts = [0] * 3
+            for _ in range(3_000):
+                counts[generator.generate_range(1, 4, "counter-increment") - 1] += 1
+            assert all(800 < count < 1_200 for count in counts)
+
+    def test_generate_range_keeps_value_in_range(self):
+        generator = FrozenPseudoRandomGenerator(random_binary=[6, 9, 4])
+        assert [generator.generate_range(5, 8, "random-binary") for _ in range(3)] == [6, 6, 7]
+
+    def test_monotonic_binary(self):
+        binary_generator = PseudoRandomBinaryGenerator(74, PseudoRandomGenerator())
+        binaries = [binary_generator.generate(monotonic=True) for _ in range(1_000)]
+        assert binaries == sorted(binaries)
+        assert binaries[-1] == binary_generator.max_value
+        assert len(set(binaries)) > 20
+
+    def test_zero_increment_is_not_drawn_again(self):
+        pseudo_random_generator = FrozenPseudoRandomGenerator(counter_increment=[0, 5])
+        generator = newnewid.UUID7Generator(
+            newnewid.METHOD_2_MONOTONIC_RANDOM_62_BITS,
+            clock=ManualClock(TEST_CLOCK.epoch_nano_seconds()),
+            pseudo_random_generator=pseudo_random_generator,
+        )
+        uuids = generator.generate_many(3)
+        assert uuids == sorted(set(uuids))
+        assert pseudo_random_generator.counter_increment_index == 1
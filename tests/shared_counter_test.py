@@ -0,0 +1,81 @@
+import multiprocessing
+
+import pytest
+from const import TEST_CLOCK
+from frozen_clock import ManualClock
+
+import newnewid
+from newnewid import UUID, SharedCounterState
+
+UUID7_OPTION = newnewid.METHOD_1_FIXED_LENGTH_DEDICATED_COUNTER_BITS_12
+
+
+def _generate_in_worker(shared_counter_state: SharedCounterState, now: int, queue, n: int) -> None:
+    generator = newnewid.UUID7Generator(
+        UUID7_OPTION,
+        clock=ManualClock(now),
+        shared_counter_state=shared_counter_state,
+    )
+    queue.put([uuid.bytes for uuid in generator.generate_many(n)])
+
+
+class TestSharedCounter:
+    def test_clock_behind(self):
+        shared_counter_state = SharedCounterState()
+        now = TEST_CLOCK.epoch_nano_seconds()
+        ahead = newnewid.UUID7Generator(
+            UUID7_OPTION,
+            clock=ManualClock(now + 10_000_000),
+            shared_counter_state=shared_counter_state,
+        )
+        behind = newnewid.UUID7Generator(
+            UUID7_OPTION,
+            clock=ManualClock(now),
+            shared_counter_state=shared_counter_state,
+        )
+
+        uuids = []
+        for _ in range(10):
+            uuids.append(ahead.generate())
+            uuids.append(behind.generate())
+        assert uuids == sorted(uuids)
+        assert len(set(uuids)) == len(uuids)
+
+    def test_carry_overflow(self):
+        # The clock never advances, so the overflow must be carried into unix_ts_ms.
+        now = TEST_CLOCK.epoch_nano_seconds()
+        generator = newnewid.UUID7Generator(
+            UUID7_OPTION,
+            clock=ManualClock(now),
+            shared_counter_state=SharedCounterState(),
+        )
+
+        uuids = generator.generate_many(5000)
+        assert uuids == sorted(uuids)
+        assert len(set(uuids)) == len(uuids)
+        parsed = newnewid.UUID7Generator.parse(uuids[-1], UUID7_OPTION)
+        assert parsed["unix_ts_ms"] > now // 1_000_000
+
+    @pytest.mark.skipif(
+        "fork" not in multiprocessing.get_all_start_methods(), reason="fork is not available"
+    )
+    def test_processes(self):
+        context = multiprocessing.get_context("fork")
+        shared_counter_state = SharedCounterState()
+        queue = context.Queue()
+        now = TEST_CLOCK.epoch_nano_seconds()
+        processes = [
+            context.Process(
+                target=_generate_in_worker, args=(shared_counter_state, now, queue, 100)
+            )
+            for _ in range(4)
+        ]
+        for process in processes:
+            process.start()
+        uuids = [UUID(bytes=data) for _ in processes for data in queue.get()]
+        for process in processes:
+            process.join()
+
+        # The counter values of all processes are one contiguous run.
+        seqs = sorted(newnewid.UUID7Generator.parse(uuid, UUID7_OPTION)["seq"] for uuid in uuids)
+        assert seqs == list(range(seqs[0], seqs[0] + 400))
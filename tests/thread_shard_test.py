@@ -0,0 +1,61 @@
+import threading
+from typing import List, Union
+
+from newnewid.shard import thread_shard
+from newnewid.shard.thread_shard import get_thread_shard_option
+
+
+def _get_shard_ids(n: int, shard_bits_length: int) -> List[Union[int, AssertionError]]:
+    # Shard IDs of n threads that are alive at the same time
+    barrier = threading.Barrier(n)
+    results: List[Union[int, AssertionError]] = [0] * n
+
+    def run(index: int) -> None:
+        try:
+            shard_option = get_thread_shard_option(shard_bits_length)
+            assert shard_option is not None
+            results[index] = shard_option.shard_id
+        except AssertionError as e:
+            results[index] = e
+        barrier.wait()
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(n)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+class TestThreadShard:
+    def test_no_shard(self):
+        assert get_thread_shard_option(0) is None
+
+    def test_live_threads_do_not_share_shard_id(self):
+        shard_ids = _get_shard_ids(4, 8)
+        assert len(set(shard_ids)) == 4
+
+    def test_shard_id_is_released(self):
+        # A finished thread releases its shard ID to the next thread.
+        assert _get_shard_ids(1, 8) == _get_shard_ids(1, 8)
+
+    def test_exhausted(self):
+        results = _get_shard_ids(5, 2)
+        assert any(isinstance(result, AssertionError) for result in results)
+
+    def test_release_while_locked(self):
+        # A finalizer may run during garbage collection while the lock is held.
+        shard_ids = [thread_shard._ThreadShardID()]
+        value = shard_ids[0].value
+        released = threading.Event()
+
+        def release() -> None:
+            with thread_shard._shard_ids_lock:
+                # The last reference is dropped, so the finalizer runs here.
+                shard_ids.clear()
+            released.set()
+
+        thread = threading.Thread(target=release, daemon=True)
+        thread.start()
+        assert released.wait(5.0)
+        assert thread_shard._ThreadShardID().value == value
@@ -0,0 +1,62 @@
+import pytest
+from const import TEST_CLOCK
+
+import newnewid
+from newnewid import UUID
+
+numpy = pytest.importorskip("numpy")
+
+
+def _to_uuids(uuid_bytes_array) -> list:
+    return [UUID(bytes=row.tobytes()) for row in uuid_bytes_array]
+
+
+class TestUUID7Ndarray:
+    @pytest.mark.parametrize(
+        "uuid7_option",
+        [
+            newnewid.METHOD_1_FIXED_LENGTH_DEDICATED_COUNTER_BITS_12,
+            newnewid.METHOD_1_FIXED_LENGTH_DEDICATED_COUNTER_BITS_42,
+            newnewid.METHOD_3_RERANDOMIZE_UNTIL_MONOTONIC,
+            newnewid.METHOD_4_REPLACE_LEFT_MOST_RANDOM_BITS_WITH_INCREASED_CLOCK_PRECISION_12_BITS_WITH_COUNTER_14_BITS,
+        ],
+    )
+    def test_timestamps(self, uuid7_option: newnewid.UUID7Option):
+        now = TEST_CLOCK.epoch_nano_seconds()
+        timestamps = numpy.repeat(numpy.arange(now, now + 100_000_000, 250_000), 3)
+        generator = newnewid.UUID7Generator(uuid7_option)
+
+        uuid_bytes_array = generator.generate_ndarray(timestamps)
+        assert uuid_bytes_array.shape == (len(timestamps), 16)
+        assert uuid_bytes_array.dtype == numpy.uint8
+
+        uuids = _to_uuids(uuid_bytes_array)
+        assert uuids == sorted(uuids)
+        assert len(set(uuids)) == len(uuids)
+        parsed = [newnewid.UUID7Generator.parse(uuid, uuid7_option) for uuid in uuids]
+        assert [p["unix_ts_ms"] for p in parsed] == (timestamps // 1_000_000).tolist()
+        if uuid7_option.counter_option:
+            # The counter is incremented by 1 while the timestamp is the same.
+            for i in range(1, len(parsed)):
+                if timestamps[i] == timestamps[i - 1]:
+                    assert parsed[i]["seq"] == parsed[i - 1]["seq"] + 1
+
+    def test_count(self):
+        generator = newnewid.UUID7Generator(
+            newnewid.METHOD_1_FIXED_LENGTH_DEDICATED_COUNTER_BITS_12,
+            clock=TEST_CLOCK,
+            shard_option=newnewid.ShardOption(shard_id=0b1011, shard_bits_length=4),
+        )
+        uuids = _to_uuids(generator.generate_ndarray(n=100))
+        assert uuids == sorted(uuids)
+        for uuid in uuids:
+            assert uuid.version == 7
+            assert (uuid.int >> 58) & 0b1111 == 0b1011
+
+    def test_overflow(self):
+        generator = newnewid.UUID7Generator(
+            newnewid.METHOD_1_FIXED_LENGTH_DEDICATED_COUNTER_BITS_12,
+            clock=TEST_CLOCK,
+        )
+        with pytest.raises(newnewid.BackwardUUIDException):
+            generator.generate_ndarray(n=4097)
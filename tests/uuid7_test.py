@@ -1,8 +1,12 @@
+import asyncio
+import threading
 from datetime import datetime
+from time import perf_counter
+from typing import Dict, List
 
 from assert_uuid import assert_uuid
 from const import TEST_CLOCK
-from frozen_clock import FrozenClock, NanoDateTime
+from frozen_clock import FrozenClock, ManualClock, NanoDateTime, TickingClock
 from frozen_pseudo_random_generator import FrozenPseudoRandomGenerator
 
 import newnewid
@@ -154,7 +158,7 @@ class TestUUID7:
 
     def test_uuid7_method_2_62(self):
         pseudo_random_generator = FrozenPseudoRandomGenerator(
-            counter_reset=3582500046746685589207, counter_increment=263884065636370560438
+            counter_reset=3582500046746685589207, counter_increment=3884065636370560438
         )
         uuid7_option = UUID7Option.method_2_monotonic_random(62)
         generator = newnewid.UUID7Generator(
@@ -172,14 +176,14 @@ class TestUUID7:
         actual2 = generator.generate()
         assert_uuid(
             actual2,
-            UUID("017F22E2-79B0-7342-834D-73322A3BFC8D"),
+            UUID("017F22E2-79B0-7309-AB13-E4BC28ABFC8D"),
             newnewid.UUID7Generator,
             uuid7_option=uuid7_option,
         )
 
     def test_uuid7_method_3(self):
         pseudo_random_generator = FrozenPseudoRandomGenerator(
-            random_binary=[3582500046746685589207, 3582500046746685589206, 3846384112383056149645]
+            random_binary=[3582500046746685589207, 3846384112383056149645]
         )
         uuid7_option = METHOD_3_RERANDOMIZE_UNTIL_MONOTONIC
         generator = newnewid.UUID7Generator(
@@ -202,6 +206,19 @@ class TestUUID7:
             uuid7_option=uuid7_option,
         )
 
+    def test_uuid7_method_3_rerandomizes_per_tick(self):
+        clock = ManualClock(TEST_CLOCK.epoch_nano_seconds())
+        generator = newnewid.UUID7Generator(
+            uuid7_option=METHOD_3_RERANDOMIZE_UNTIL_MONOTONIC,
+            clock=clock,
+            pseudo_random_generator=FrozenPseudoRandomGenerator(random_binary=[100, 50, 10]),
+        )
+        assert generator.generate().int & ((1 << 62) - 1) == 100
+        clock.now += 1_000_000
+        assert generator.generate().int & ((1 << 62) - 1) == 50
+        # The same tick, so the random bits are greater than the last ones.
+        assert generator.generate().int & ((1 << 62) - 1) > 50
+
     def test_uuid7_method_4_without_counter(self):
         pseudo_random_generator = FrozenPseudoRandomGenerator(
             random_binary=[3521272293113388459, 33447269696974427]
@@ -298,3 +315,160 @@ class TestUUID7:
             newnewid.UUID7Generator,
             uuid7_option=uuid7_option,
         )
+
+    def test_uuid7_generate_many(self):
+        uuid7_option = UUID7Option.method_1_fixed_length_dedicated_counter_bits(12)
+
+        def create_generator():
+            return newnewid.UUID7Generator(
+                uuid7_option=uuid7_option,
+                clock=TEST_CLOCK,
+                pseudo_random_generator=FrozenPseudoRandomGenerator(
+                    counter_reset=3267,
+                    random_binary=[1784793296645077391, 4660],
+                ),
+            )
+
+        generator = create_generator()
+        expected = [generator.generate() for _ in range(100)]
+
+        actual = create_generator().generate_many(100)
+        assert actual == expected
+        assert actual == sorted(set(actual))
+
+    def test_uuid7_generate_many_monotonic(self):
+        for uuid7_option in [
+            newnewid.METHOD_1_FIXED_LENGTH_DEDICATED_COUNTER_BITS_12,
+            newnewid.METHOD_2_MONOTONIC_RANDOM_62_BITS,
+            METHOD_4_REPLACE_LEFT_MOST_RANDOM_BITS_WITH_INCREASED_CLOCK_PRECISION_12_BITS_WITH_COUNTER_14_BITS,
+        ]:
+            generator = newnewid.UUID7Generator(uuid7_option=uuid7_option)
+            uuids = generator.generate_many(10_000) + [generator.generate()]
+            assert uuids == sorted(set(uuids))
+
+    def test_uuid7_generate_many_without_counter(self):
+        for uuid7_option in [
+            newnewid.METHOD_0_NO_COUNTER,
+            METHOD_3_RERANDOMIZE_UNTIL_MONOTONIC,
+            METHOD_4_REPLACE_LEFT_MOST_RANDOM_BITS_WITH_INCREASED_CLOCK_PRECISION_12_BITS,
+        ]:
+            clock = TickingClock(TEST_CLOCK.epoch_nano_seconds(), 1_000_000)
+            generator = newnewid.UUID7Generator(uuid7_option=uuid7_option, clock=clock)
+            buffer = bytearray(16 * 5_000)
+
+            start = perf_counter()
+            uuids = generator.generate_many(5_000)
+            assert generator.generate_into(buffer) == 5_000
+            elapsed = perf_counter() - start
+
+            uuids += [UUID(bytes=bytes(buffer[i : i + 16])) for i in range(0, len(buffer), 16)]
+            assert uuids == sorted(set(uuids))
+            # The clock is read about once per UUID instead of the run restarting at every
+            # UUID that is not greater than the last one.
+            assert clock.reads <= 2 * len(uuids) + 2
+            assert elapsed < 2.0
+
+    def test_uuid7_generate_into(self):
+        generator = newnewid.UUID7Generator(
+            uuid7_option=newnewid.METHOD_1_FIXED_LENGTH_DEDICATED_COUNTER_BITS_12
+        )
+        buffer = bytearray(16 * 10)
+        assert generator.generate_into(buffer) == 10
+
+        uuids = [UUID(bytes=bytes(buffer[i : i + 16])) for i in range(0, len(buffer), 16)]
+        assert uuids == sorted(set(uuids))
+        assert uuids[-1] == generator.last_generated
+
+    def test_uuid7_borrow_from_future(self):
+        uuid7_option = UUID7Option.method_1_fixed_length_dedicated_counter_bits(12)
+        clock = ManualClock(TEST_CLOCK.epoch_nano_seconds())
+        generator = newnewid.UUID7Generator(
+            uuid7_option=uuid7_option,
+            clock=clock,
+            max_borrow_seconds=0.01,
+        )
+        # The counter overflows in the same millisecond, so the timestamp is borrowed.
+        uuids = generator.generate_many(3 * 4096)
+        assert uuids == sorted(set(uuids))
+
+        first_ms = newnewid.UUID7Generator.parse(uuids[0], uuid7_option)["unix_ts_ms"]
+        last_ms = newnewid.UUID7Generator.parse(uuids[-1], uuid7_option)["unix_ts_ms"]
+        assert first_ms == clock.now // 1_000_000
+        assert 2 <= last_ms - first_ms <= 10
+
+        # The borrowed timestamp is kept until the clock passes it.
+        uuid = generator.generate()
+        assert newnewid.UUID7Generator.parse(uuid, uuid7_option)["unix_ts_ms"] >= last_ms
+
+        clock.now += 20_000_000
+        uuid = generator.generate()
+        assert uuid > uuids[-1]
+        assert (
+            newnewid.UUID7Generator.parse(uuid, uuid7_option)["unix_ts_ms"]
+            == clock.now // 1_000_000
+        )
+
+    def test_uuid7_sharded(self):
+        uuid7_option = newnewid.METHOD_1_FIXED_LENGTH_DEDICATED_COUNTER_BITS_12
+        results: Dict[int, List[UUID]] = {}
+        # The threads are alive at the same time, so they do not reuse the shard IDs of each other.
+        barrier = threading.Barrier(4)
+
+        def run(index: int) -> None:
+            results[index] = [
+                newnewid.uuid7(uuid7_option, sharded=True, shard_bits_length=8)
+                for _ in range(1_000)
+            ]
+            barrier.wait()
+
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        shard_ids = set()
+        for uuids in results.values():
+            assert uuids == sorted(set(uuids))
+            thread_shard_ids = {
+                newnewid.UUID7Generator.parse(uuid, uuid7_option)["rand"] >> (62 - 8)
+                for uuid in uuids
+            }
+            assert len(thread_shard_ids) == 1
+            shard_ids |= thread_shard_ids
+        assert len(shard_ids) == 4
+
+    def test_uuid7_shard_option(self):
+        generator = newnewid.UUID7Generator(
+            uuid7_option=newnewid.METHOD_1_FIXED_LENGTH_DEDICATED_COUNTER_BITS_12,
+            clock=TEST_CLOCK,
+            pseudo_random_generator=FrozenPseudoRandomGenerator(counter_reset=3267),
+            shard_option=newnewid.ShardOption(shard_id=0xAB, shard_bits_length=8),
+        )
+        actual = generator.generate()
+        assert actual == UUID("017F22E2-79B0-7CC3-AAC0-000000000000")
+
+    def test_uuid7_agenerate_many(self):
+        clock = ManualClock(TEST_CLOCK.epoch_nano_seconds())
+        generator = newnewid.UUID7Generator(
+            uuid7_option=UUID7Option.method_1_fixed_length_dedicated_counter_bits(12),
+            clock=clock,
+        )
+
+        async def tick() -> None:
+            # This runs only if the generator does not block the event loop. The counter starts
+            # at a random value, so the number of milliseconds to generate 5,000 UUIDs varies.
+            while True:
+                await asyncio.sleep(0.01)
+                clock.now += 1_000_000
+
+        async def run() -> List[UUID]:
+            ticker = asyncio.ensure_future(tick())
+            uuids = await generator.agenerate_many(5_000)
+            uuids.append(await generator.agenerate())
+            ticker.cancel()
+            return uuids
+
+        uuids = asyncio.run(run())
+        assert len(uuids) == 5_001
+        assert uuids == sorted(set(uuids))
@@ -0,0 +1,65 @@
+from datetime import datetime, timezone
+
+import pytest
+from const import TEST_CLOCK
+from frozen_clock import ManualClock
+
+import newnewid
+from newnewid import UUID7TimeIndex, max_uuid7_for, min_uuid7_for
+
+UUID7_OPTION = newnewid.METHOD_1_FIXED_LENGTH_DEDICATED_COUNTER_BITS_12
+
+
+def _generate(unix_ts_ms_list):
+    clock = ManualClock(0)
+    generator = newnewid.UUID7Generator(UUID7_OPTION, clock=clock)
+    uuids = []
+    for unix_ts_ms in unix_ts_ms_list:
+        clock.now = unix_ts_ms * 1_000_000
+        uuids.append(generator.generate())
+    return uuids
+
+
+class TestMinMaxUUID7For:
+    def test_bounds(self):
+        unix_ts_ms = TEST_CLOCK.epoch_nano_seconds() // 1_000_000
+        uuids = _generate([unix_ts_ms] * 10)
+        assert all(min_uuid7_for(unix_ts_ms) <= uuid <= max_uuid7_for(unix_ts_ms) for uuid in uuids)
+        assert max_uuid7_for(unix_ts_ms - 1) < min_uuid7_for(unix_ts_ms)
+        assert max_uuid7_for(unix_ts_ms).version == 7
+        assert min_uuid7_for(unix_ts_ms).variant == newnewid.RFC_4122
+
+    def test_datetime(self):
+        dt = datetime(2022, 2, 22, 19, 22, 22, 123_999, tzinfo=timezone.utc)
+        assert min_uuid7_for(dt) == min_uuid7_for(1_645_557_742_123)
+        assert str(min_uuid7_for(dt)) == "017f22e2-7a2b-7000-8000-000000000000"
+
+
+class TestUUID7TimeIndex:
+    @pytest.mark.parametrize("kind", ["uuid", "int"])
+    def test_queries(self, kind: str):
+        unix_ts_ms_list = [1_000, 1_000, 1_001, 1_003, 1_003, 1_003, 1_010]
+        uuids = _generate(unix_ts_ms_list)
+        items = uuids if kind == "uuid" else [uuid.int for uuid in uuids]
+        index = UUID7TimeIndex(items)
+
+        assert len(index) == 7
+        assert index.range(1_001, 1_004) == slice(2, 6)
+        assert index.between(1_001, 1_004) == items[2:6]
+        assert index.count(1_000, 1_001) == 2
+        assert index.count(1_004, 1_010) == 0
+        assert index.count(0, 2_000) == 7
+        assert index.count(1_010, 1_000) == 0
+        assert index.index(2_000) == 7
+        assert [index.percentile(q) for q in [0, 50, 100]] == [1_000, 1_003, 1_010]
+
+    def test_ndarray(self):
+        pytest.importorskip("numpy")
+        generator = newnewid.UUID7Generator(UUID7_OPTION)
+        timestamps = [(1_000 + i // 3) * 1_000_000 for i in range(30)]
+        uuid_bytes_array = generator.generate_ndarray(timestamps)
+        index = UUID7TimeIndex(uuid_bytes_array)
+
+        assert index.range(1_002, 1_005) == slice(6, 15)
+        assert index.between(1_002, 1_005).shape == (9, 16)
+        assert index.percentile(50) == 1_004
@@ -0,0 +1,111 @@
+import random
+from uuid import UUID
+
+import pytest
+
+import newnewid
+from newnewid import UUIDArray
+
+UUID7_OPTION = newnewid.METHOD_1_FIXED_LENGTH_DEDICATED_COUNTER_BITS_12
+
+
+def _random_uuids(n):
+    rng = random.Random(0)
+    return [UUID(int=rng.getrandbits(128)) for _ in range(n)]
+
+
+class TestUUIDArray:
+    def test_append_extend(self):
+        uuids = _random_uuids(10)
+        uuid_array = UUIDArray(uuids[:3])
+        uuid_array.append(uuids[3])
+        uuid_array.extend(uuids[4:8])
+        uuid_array.extend(UUIDArray(uuids[8:]))
+
+        assert len(uuid_array) == 10
+        assert list(uuid_array) == uuids
+        assert uuid_array[0] == uuids[0]
+        assert uuid_array[-1] == uuids[-1]
+        assert uuid_array.tobytes() == b"".join(uuid.bytes for uuid in uuids)
+        with pytest.raises(IndexError):
+            uuid_array[10]
+
+    def test_contains_unsorted(self):
+        uuids = _random_uuids(100)
+        uuid_array = UUIDArray(uuids)
+        assert all(uuid in uuid_array for uuid in uuids)
+        assert UUID(int=0) not in uuid_array
+        assert "not a UUID" not in uuid_array
+
+        # The bytes across two records are not a UUID of the array.
+        straddling = UUID(bytes=uuids[0].bytes[8:] + uuids[1].bytes[:8])
+        assert straddling not in uuid_array
+
+    def test_slice_setitem(self):
+        uuids = _random_uuids(10)
+        uuid_array = UUIDArray(uuids)
+
+        assert uuid_array[2:5] == UUIDArray(uuids[2:5])
+        assert uuid_array[::-3] == UUIDArray(uuids[::-3])
+        assert len(uuid_array[5:2]) == 0
+
+        uuid_array[1] = uuids[0]
+        assert uuid_array[1] == uuids[0]
+        assert len(uuid_array) == 10
+
+    def test_extend_generated(self):
+        generator = newnewid.UUID7Generator(UUID7_OPTION)
+        uuid_array = UUIDArray(generator.generate_many(100))
+        uuid_array.extend_generated(generator, 1_000)
+
+        assert len(uuid_array) == 1_100
+        uuids = list(uuid_array)
+        assert uuids == sorted(set(uuids))
+        assert all(uuid.version == 7 for uuid in uuids)
+
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_sort_searchsorted(self, monkeypatch, use_numpy):
+        if use_numpy:
+            pytest.importorskip("numpy")
+        else:
+
+            def import_numpy():
+                raise ImportError("numpy")
+
+            monkeypatch.setattr(newnewid.column.uuid_array, "import_numpy", import_numpy)
+
+        uuids = _random_uuids(1_000)
+        uuid_array = UUIDArray(uuids + uuids[:10])
+        uuid_array.sort()
+        sorted_uuids = sorted(uuids + uuids[:10])
+        assert list(uuid_array) == sorted_uuids
+
+        uuid = uuids[0]
+        left = uuid_array.searchsorted(uuid)
+        assert uuid_array[left] == uuid
+        assert uuid_array.searchsorted(uuid, side="right") == left + 2
+        assert uuid_array.index(uuid) == left
+        assert uuid in uuid_array
+        assert uuid_array.contains_sorted(uuid)
+        assert not uuid_array.contains_sorted(UUID(int=0))
+        assert uuid_array.searchsorted(UUID(int=0)) == 0
+        assert uuid_array.searchsorted(UUID(int=(1 << 128) - 1)) == len(uuid_array)
+        assert uuid_array.index(UUID(int=0)) is None
+
+    def test_numpy(self):
+        numpy = pytest.importorskip("numpy")
+        generator = newnewid.UUID7Generator(UUID7_OPTION)
+        uuid_bytes_array = generator.generate_ndarray(n=100)
+        uuid_array = UUIDArray.frombytes(uuid_bytes_array)
+
+        assert len(uuid_array) == 100
+        assert uuid_array[0] == UUID(bytes=uuid_bytes_array[0].tobytes())
+
+        view = uuid_array.to_numpy()
+        assert numpy.array_equal(view, uuid_bytes_array)
+        view[0] = 0
+        assert uuid_array[0] == UUID(int=0)
+
+    def test_buffer(self):
+        uuids = _random_uuids(3)
+        assert bytes(memoryview(UUIDArray(uuids).data)) == b"".join(uuid.bytes for uuid in uuids)
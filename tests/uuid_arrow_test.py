@@ -0,0 +1,86 @@
+from uuid import UUID
+
+import pytest
+
+import newnewid
+from newnewid import UUIDArray
+from newnewid.column.uuid_arrow import (
+    arrow_records,
+    generate_arrow,
+    generate_records,
+    parse_many_arrow,
+    to_arrow,
+)
+from newnewid.parser.uuid_bulk_parser import parse_many
+
+UUID7_OPTION = newnewid.METHOD_1_FIXED_LENGTH_DEDICATED_COUNTER_BITS_12
+
+
+def _uuids(records):
+    return [UUID(bytes=bytes(records[i : i + 16])) for i in range(0, len(records), 16)]
+
+
+class TestGenerateRecords:
+    def test_uuid4(self):
+        uuids = _uuids(generate_records(1_000))
+        assert len(set(uuids)) == 1_000
+        assert all(uuid.version == 4 and uuid.variant == newnewid.RFC_4122 for uuid in uuids)
+
+    def test_generator(self):
+        generator = newnewid.UUID7Generator(UUID7_OPTION)
+        uuids = _uuids(generate_records(1_000, generator))
+        assert uuids == sorted(set(uuids))
+        assert all(uuid.version == 7 for uuid in uuids)
+
+
+class TestArrow:
+    def test_generate_arrow(self):
+        pyarrow = pytest.importorskip("pyarrow")
+        for generator, version in [
+            (None, 4),
+            (newnewid.UUID6Generator(uses_mac_address=False), 6),
+            (newnewid.UUID7Generator(UUID7_OPTION), 7),
+        ]:
+            array = generate_arrow(100, generator)
+            assert array.type == pyarrow.binary(16)
+            assert len(array) == 100
+            assert array.null_count == 0
+            assert UUID(bytes=array[0].as_py()).version == version
+
+    def test_to_arrow(self):
+        pytest.importorskip("pyarrow")
+        uuids = [newnewid.uuid7() for _ in range(10)]
+        uuid_array = UUIDArray(uuids)
+        array = to_arrow(uuid_array)
+        assert [UUID(bytes=value) for value in array.to_pylist()] == uuids
+
+        # The Arrow array is a view of the records.
+        uuid_array[0] = UUID(int=0)
+        assert array[0].as_py() == bytes(16)
+        assert bytes(arrow_records(array[1:3]).tobytes()) == uuid_array[1:3].tobytes()
+
+    def test_parse_many_arrow(self):
+        pyarrow = pytest.importorskip("pyarrow")
+        uuids = [
+            newnewid.uuid3(newnewid.NAMESPACE_DNS, "example.com"),
+            newnewid.uuid4(),
+            newnewid.UUID7Generator(UUID7_OPTION).generate(),
+        ]
+        expected = parse_many(uuids, uuid7_option=UUID7_OPTION)
+        for inputs in [uuids, UUIDArray(uuids), to_arrow(UUIDArray(uuids))]:
+            tables = parse_many_arrow(inputs, uuid7_option=UUID7_OPTION)
+            assert set(tables) == set(expected)
+            for version, table in tables.items():
+                assert table.column_names == list(expected[version])
+                assert table.column("index").type == pyarrow.int64()
+                for name, column in expected[version].items():
+                    values = table.column(name).to_pylist()
+                    if column is None:
+                        assert values == [None] * len(table)
+                    elif table.column(name).type == pyarrow.binary(16):
+                        assert [int.from_bytes(value, "big") for value in values] == list(column)
+                    else:
+                        assert values == list(column)
+
+        assert tables["3"].column("md5").type == pyarrow.binary(16)
+        assert tables["7"].column("seq").type == pyarrow.uint64()
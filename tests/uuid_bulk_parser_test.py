@@ -0,0 +1,73 @@
+import uuid as std_uuid
+from typing import Any, Dict, List
+
+import pytest
+
+import newnewid
+from newnewid import UUID
+from newnewid.parser.uuid_bulk_parser import parse_many
+from newnewid.parser.uuid_parser import parse
+
+UUID7_OPTIONS = [
+    newnewid.METHOD_1_FIXED_LENGTH_DEDICATED_COUNTER_BITS_12,
+    newnewid.METHOD_2_MONOTONIC_RANDOM_62_BITS,
+    newnewid.METHOD_3_RERANDOMIZE_UNTIL_MONOTONIC,
+    newnewid.METHOD_4_REPLACE_LEFT_MOST_RANDOM_BITS_WITH_INCREASED_CLOCK_PRECISION_12_BITS_WITH_COUNTER_14_BITS,
+]
+
+
+def _sample_uuids(uuid7_option: newnewid.UUID7Option) -> List[UUID]:
+    return [
+        std_uuid.uuid1(),
+        std_uuid.uuid3(std_uuid.NAMESPACE_DNS, "example.com"),
+        std_uuid.uuid4(),
+        std_uuid.uuid5(std_uuid.NAMESPACE_DNS, "example.com"),
+        newnewid.uuid6(),
+        newnewid.UUID7Generator(uuid7_option).generate(),
+        newnewid.uuid8(1, 2, 3),
+        newnewid.nil_uuid(),
+        newnewid.max_uuid(),
+        std_uuid.uuid4(),
+    ]
+
+
+def _assert_same_as_parse(
+    result: Dict[str, Dict[str, Any]], uuids: List[UUID], uuid7_option: newnewid.UUID7Option
+) -> None:
+    assert sum(len(columns["index"]) for columns in result.values()) == len(uuids)
+    for version, columns in result.items():
+        for row, index in enumerate(columns["index"]):
+            parsed = parse(uuids[index], uuid7_option=uuid7_option)
+            assert parsed["ver"] == version
+            assert set(columns) == set(parsed) - {"ver", "time"} | {"index"}
+            for key, column in columns.items():
+                if key != "index":
+                    expected = parsed[key]
+                    assert (None if column is None else int(column[row])) == expected
+
+
+class TestParseMany:
+    @pytest.mark.parametrize("uuid7_option", UUID7_OPTIONS)
+    def test_inputs(self, uuid7_option: newnewid.UUID7Option):
+        uuids = _sample_uuids(uuid7_option)
+        for inputs in [
+            uuids,
+            [str(uuid) for uuid in uuids],
+            [uuid.bytes for uuid in uuids],
+            b"".join(uuid.bytes for uuid in uuids),
+        ]:
+            result = parse_many(inputs, uuid7_option=uuid7_option)
+            _assert_same_as_parse(result, uuids, uuid7_option)
+
+    @pytest.mark.parametrize("uuid7_option", UUID7_OPTIONS)
+    def test_ndarray(self, uuid7_option: newnewid.UUID7Option):
+        numpy = pytest.importorskip("numpy")
+        uuids = _sample_uuids(uuid7_option)
+        array = numpy.frombuffer(b"".join(uuid.bytes for uuid in uuids), dtype=numpy.uint8)
+
+        result = parse_many(array.reshape(-1, 16), uuid7_option=uuid7_option)
+        _assert_same_as_parse(result, uuids, uuid7_option)
+
+    def test_unsupported_version(self):
+        with pytest.raises(ValueError):
+            parse_many([UUID("00000000-0000-2000-8000-000000000000")])
@@ -0,0 +1,88 @@
+import pytest
+
+import newnewid
+
+pandas = pytest.importorskip("pandas")
+
+from newnewid.column.uuid_pandas import (  # noqa: E402
+    UUIDDtype,
+    UUIDExtensionArray,
+    parse_many_frames,
+)
+
+UUID7_OPTION = newnewid.METHOD_1_FIXED_LENGTH_DEDICATED_COUNTER_BITS_12
+
+
+class TestUUIDExtensionArray:
+    def test_series(self):
+        uuids = [newnewid.uuid4() for _ in range(5)]
+        series = pandas.Series(uuids + [None], dtype="uuid")
+
+        assert isinstance(series.dtype, UUIDDtype)
+        assert isinstance(series.array, UUIDExtensionArray)
+        assert series[0] == uuids[0]
+        assert series.isna().tolist() == [False] * 5 + [True]
+        assert series.array.nbytes == 6 * 17
+        assert (series == uuids[1]).tolist() == [False, True, False, False, False, False]
+        assert list(series.iloc[1:3]) == uuids[1:3]
+
+        series[5] = uuids[0]
+        assert series.nunique() == 5
+        assert series.sort_values().tolist() == sorted(uuids + [uuids[0]])
+
+    def test_take_concat(self):
+        uuids = [newnewid.uuid4() for _ in range(3)]
+        array = UUIDExtensionArray._from_sequence(uuids)
+
+        taken = array.take([2, -1, 0], allow_fill=True)
+        assert taken[0] == uuids[2]
+        assert taken[1] is pandas.NA
+        assert array.take([-1]).tolist() == [uuids[2]]
+        assert array.take([-1], allow_fill=True, fill_value=uuids[0])[0] == uuids[0]
+        with pytest.raises(IndexError):
+            array.take([3])
+
+        concatenated = pandas.concat([pandas.Series(array), pandas.Series(taken)])
+        assert len(concatenated) == 6
+        assert concatenated.isna().sum() == 1
+
+    def test_generate(self):
+        generator = newnewid.UUID7Generator(UUID7_OPTION)
+        array = UUIDExtensionArray.generate(1_000, generator)
+        uuids = list(array)
+        assert uuids == sorted(set(uuids))
+        assert UUIDExtensionArray.generate(1)[0].version == 4
+
+        frame = pandas.DataFrame({"id": UUIDExtensionArray(generator.generate_ndarray(n=10))})
+        assert frame["id"].dtype == "uuid"
+        assert frame["id"][0].version == 7
+
+    def test_arrow(self):
+        pyarrow = pytest.importorskip("pyarrow")
+        uuids = [newnewid.uuid4(), None, newnewid.uuid4()]
+        frame = pandas.DataFrame({"id": pandas.array(uuids, dtype="uuid")})
+
+        table = pyarrow.Table.from_pandas(frame)
+        assert table.column("id").type == pyarrow.binary(16)
+        assert table.column("id").to_pylist() == [uuids[0].bytes, None, uuids[2].bytes]
+
+        restored = table.to_pandas(types_mapper={pyarrow.binary(16): UUIDDtype()}.get)
+        assert restored["id"].dtype == "uuid"
+        assert restored["id"][0] == uuids[0]
+        assert restored["id"].isna().tolist() == [False, True, False]
+
+
+class TestParseManyFrames:
+    def test_parse_many_frames(self):
+        uuids = [
+            newnewid.uuid4(),
+            newnewid.UUID7Generator(UUID7_OPTION).generate(),
+            newnewid.uuid4(),
+        ]
+        frames = parse_many_frames(pandas.Series(uuids, dtype="uuid"), uuid7_option=UUID7_OPTION)
+
+        assert frames["4"].index.tolist() == [0, 2]
+        assert frames["7"].index.tolist() == [1]
+        assert frames["7"]["unix_ts_ms"][1] == uuids[1].int >> 80
+        assert frames["7"]["seq"].dtype == "uint64"
+        assert frames["4"]["random_a"][2] == uuids[2].int >> 80
@@ -0,0 +1,37 @@
+import uuid as std_uuid
+
+import pytest
+
+import newnewid
+from newnewid import UUID
+from newnewid.parser.uuid_parser import get_parser, parse
+from newnewid.util.specloader import load_modules
+
+UUID7_OPTION = newnewid.METHOD_1_FIXED_LENGTH_DEDICATED_COUNTER_BITS_12
+
+
+class TestGetParser:
+    def test_cached(self):
+        assert get_parser() is get_parser()
+        assert get_parser(as_record=True) is not get_parser()
+        assert load_modules("latest") is load_modules("latest")
+
+    def test_same_as_parse(self):
+        parse_uuid = get_parser()
+        for uuid in [
+            std_uuid.uuid1(),
+            std_uuid.uuid4(),
+            newnewid.uuid6(),
+            newnewid.uuid7(),
+            newnewid.nil_uuid(),
+            newnewid.max_uuid(),
+        ]:
+            assert parse_uuid(uuid, uuid7_option=UUID7_OPTION) == parse(
+                uuid, uuid7_option=UUID7_OPTION
+            )
+
+    def test_unsupported(self):
+        with pytest.raises(ValueError):
+            get_parser()(UUID("00000000-0000-2000-8000-000000000000"))
+        with pytest.raises(ValueError):
+            get_parser("unknown-spec")
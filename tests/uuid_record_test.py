@@ -0,0 +1,55 @@
+import uuid as std_uuid
+
+import pytest
+
+import newnewid
+from newnewid import UUID, UUID7Record, UUIDRecord
+from newnewid.parser.uuid_parser import parse
+
+UUID7_OPTION = (
+    newnewid.METHOD_4_REPLACE_LEFT_MOST_RANDOM_BITS_WITH_INCREASED_CLOCK_PRECISION_12_BITS_WITH_COUNTER_14_BITS
+)
+
+
+class TestUUIDRecord:
+    @pytest.mark.parametrize(
+        "uuid",
+        [
+            std_uuid.uuid1(),
+            std_uuid.uuid3(std_uuid.NAMESPACE_DNS, "example.com"),
+            std_uuid.uuid4(),
+            std_uuid.uuid5(std_uuid.NAMESPACE_DNS, "example.com"),
+            newnewid.uuid6(),
+            newnewid.UUID7Generator(UUID7_OPTION).generate(),
+            newnewid.uuid8(1, 2, 3),
+            newnewid.nil_uuid(),
+            newnewid.max_uuid(),
+        ],
+    )
+    def test_same_as_dict(self, uuid: UUID):
+        record = parse(uuid, as_record=True, uuid7_option=UUID7_OPTION)
+        assert isinstance(record, UUIDRecord)
+        parsed = parse(uuid, uuid7_option=UUID7_OPTION)
+        assert record.to_dict() == parsed
+        for key, value in parsed.items():
+            assert record[key] == value
+
+    def test_lazy_datetime(self):
+        uuid = newnewid.UUID7Generator(UUID7_OPTION).generate()
+        record = newnewid.UUID7Generator.parse_record(uuid, UUID7_OPTION)
+        assert isinstance(record, UUID7Record)
+        assert record._datetime is None
+        assert record.unix_ts_ms == uuid.int >> 80
+        assert record._datetime is None
+
+        assert record.time == record.datetime.isoformat()
+        assert record._datetime is not None
+
+    def test_unsupported_spec(self):
+        with pytest.raises(ValueError):
+            parse(
+                newnewid.uuid7(),
+                spec="draft_peabody_dispatch_new_uuid_format_01",
+                as_record=True,
+                uuid7_option=UUID7_OPTION,
+            )